@@ -1,20 +1,44 @@
 """
 Agent definitions for the Logistics Multi-Agent System
+
+Agents are built lazily from the spec table in ``_registry``: each
+``*_agent`` attribute creates its agent on first access. Every agent also
+has an ``*_agent_stream(state)`` async generator yielding batched output text.
+``run_all(scenario_ctx)`` runs several agents on one scenario concurrently.
 """
 
-from .route_planner import route_planner_agent
-from .procurement_manager import procurement_manager_agent
-from .inventory_manager import inventory_manager_agent
-from .distribution_handler import distribution_handler_agent
-from .demand_forecaster import demand_forecaster_agent
-from .cost_optimizer import cost_optimizer_agent
-
-__all__ = [
-    "route_planner_agent",
-    "procurement_manager_agent",
-    "inventory_manager_agent",
-    "distribution_handler_agent",
-    "demand_forecaster_agent",
-    "cost_optimizer_agent",
-]
+import functools
+import threading
+
+from config.settings import LOGISTICS_WARMUP
+from config.llm_factory import warmup_llm
+from ._cache import response_cache
+from ._registry import AGENT_SPECS, build_agent
+from ._stream import stream_agent
+from ._batch import run_all, arun_all
+from .batch import BatchProcessor
+
+
+_AGENT_ATTRS = {f"{name}_agent": name for name, *_ in AGENT_SPECS}
+_STREAM_ATTRS = {f"{name}_agent_stream": name for name, *_ in AGENT_SPECS}
+
 
+def __getattr__(name):
+    """Build the requested agent (or its streaming entry point) on first access (PEP 562)."""
+    if name in _AGENT_ATTRS:
+        value = build_agent(_AGENT_ATTRS[name])
+    elif name in _STREAM_ATTRS:
+        value = functools.partial(stream_agent, build_agent(_STREAM_ATTRS[name]))
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+if LOGISTICS_WARMUP:
+    threading.Thread(target=warmup_llm, name="llm-warmup", daemon=True).start()
+
+
+__all__ = list(_AGENT_ATTRS) + list(_STREAM_ATTRS) + [
+    "response_cache", "build_agent", "stream_agent", "run_all", "arun_all", "BatchProcessor",
+]
@@ -0,0 +1,62 @@
+"""
+Concurrent execution of several worker agents on the same scenario.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional
+
+from config.llm_factory import cached_user_message
+from ._registry import AGENT_SPECS, build_agent
+
+
+async def arun_all(
+    scenario_ctx: str,
+    agent_names: Optional[List[str]] = None,
+    max_concurrency: int = 4,
+) -> Dict[str, Any]:
+    """
+    Run several agents on the same scenario concurrently.
+    
+    Each agent gets the scenario context as its user message and is driven
+    through ``ainvoke``, so LLM round-trips overlap: wall-clock time is close
+    to the slowest agent rather than the sum of all of them.
+    
+    Args:
+        scenario_ctx: Scenario description passed to every agent
+        agent_names: Agents to run (defaults to all registered agents)
+        max_concurrency: Maximum number of agents in flight (provider rate limits)
+        
+    Returns:
+        Dictionary mapping agent name to its output state, or to the
+        exception it raised
+    """
+    names = agent_names or [name for name, *_ in AGENT_SPECS]
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_one(name: str):
+        agent = build_agent(name)
+        async with semaphore:
+            return await agent.ainvoke({"messages": [cached_user_message(scenario_ctx)]})
+
+    results = await asyncio.gather(*(run_one(name) for name in names), return_exceptions=True)
+    return dict(zip(names, results))
+
+
+def run_all(
+    scenario_ctx: str,
+    agent_names: Optional[List[str]] = None,
+    max_concurrency: int = 4,
+) -> Dict[str, Any]:
+    """
+    Synchronous wrapper around arun_all (must not be called from a running event loop).
+    
+    Args:
+        scenario_ctx: Scenario description passed to every agent
+        agent_names: Agents to run (defaults to all registered agents)
+        max_concurrency: Maximum number of agents in flight
+        
+    Returns:
+        Dictionary mapping agent name to its output state, or to the
+        exception it raised
+    """
+    return asyncio.run(arun_all(scenario_ctx, agent_names, max_concurrency))
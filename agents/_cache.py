@@ -0,0 +1,159 @@
+"""
+Response cache for worker agents.
+
+Agents are invoked repeatedly with identical delegations (e.g. the same
+scenario re-run from the CLI or Streamlit). This module puts an exact-match
+cache in front of ``agent.invoke``, keyed on a hash of the system prompt,
+tool names, input messages and the version of the scenario data they refer
+to. Editing a scenario's CSV files therefore invalidates its entries.
+
+There is deliberately no similarity matching: delegations that differ only
+in a scenario directory or a product ID are near-identical as text but need
+different answers.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from langchain_core.messages import BaseMessage
+
+from config import SCENARIO_DIRS
+from utils.scenario_cache import scenario_digest
+
+
+def _message_text(messages: List[BaseMessage]) -> str:
+    """Flatten a list of messages into a single text used for keying."""
+    parts = []
+    for msg in messages:
+        content = msg.content
+        if not isinstance(content, str):
+            content = " ".join(
+                item if isinstance(item, str) else str(item.get("text", ""))
+                for item in content
+            )
+        parts.append(f"{msg.type}: {content}")
+    return "\n".join(parts)
+
+
+def _data_version(text: str) -> str:
+    """
+    Digest of the scenario data an input refers to.
+
+    Inputs that name no scenario directory depend on all of them, so they
+    are keyed on every scenario's digest.
+    """
+    scenario_ids = [sid for sid, scenario_dir in SCENARIO_DIRS.items() if scenario_dir in text]
+    return "\x00".join(scenario_digest(sid) for sid in scenario_ids or SCENARIO_DIRS)
+
+
+class ResponseCache:
+    """
+    Bounded exact-match cache of agent responses.
+
+    Args:
+        maxsize: Maximum number of cached responses (least recently used evicted first)
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(namespace: str, text: str) -> str:
+        """Build the cache key."""
+        return hashlib.sha256(f"{namespace}\x00{text}".encode("utf-8")).hexdigest()
+
+    def get(self, namespace: str, text: str) -> Optional[Any]:
+        """
+        Look up a cached response.
+
+        Args:
+            namespace: Scope of the entry (agent prompt + tools + data version)
+            text: Flattened input messages
+
+        Returns:
+            The cached value, or None on a miss
+        """
+        key = self.make_key(namespace, text)
+        with self._lock:
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, namespace: str, text: str, value: Any) -> None:
+        """Store a response for the given input."""
+        key = self.make_key(namespace, text)
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared by every wrapped agent; entries are namespaced per agent
+response_cache = ResponseCache()
+
+
+class CachedAgent:
+    """
+    Transparent proxy around a compiled agent that serves repeat requests from cache.
+
+    Only ``invoke``/``ainvoke`` are intercepted; every other attribute is
+    forwarded to the wrapped agent, so the proxy can be handed to
+    ``create_supervisor`` like the original.
+
+    Args:
+        agent: The compiled agent graph to wrap
+        system_prompt: The agent's static system prompt (part of the cache key)
+        tool_names: Names of the agent's tools (part of the cache key)
+        cache: Cache instance to use (defaults to the shared response cache)
+    """
+
+    def __init__(self, agent, system_prompt: str, tool_names: List[str], cache: ResponseCache = None):
+        self._agent = agent
+        self._cache = cache if cache is not None else response_cache
+        self._namespace = "\x00".join([agent.name or "", system_prompt, *sorted(tool_names)])
+
+    def __getattr__(self, name):
+        return getattr(self._agent, name)
+
+    @staticmethod
+    def _replay(input_messages: List[BaseMessage], new_messages: List[BaseMessage]) -> Dict[str, Any]:
+        """Rebuild an agent output from cached messages with fresh message ids."""
+        replayed = [msg.model_copy(update={"id": None}) for msg in new_messages]
+        return {"messages": list(input_messages) + replayed}
+
+    def _lookup(self, state: Dict[str, Any]):
+        messages = state.get("messages", [])
+        text = _message_text(messages)
+        # The data version is read per call: the same delegation is a new
+        # request once the scenario files it refers to have changed
+        namespace = f"{self._namespace}\x00{_data_version(text)}"
+        return messages, text, namespace, self._cache.get(namespace, text)
+
+    def invoke(self, state: Dict[str, Any], config=None, **kwargs) -> Dict[str, Any]:
+        messages, text, namespace, cached = self._lookup(state)
+        if cached is not None:
+            return self._replay(messages, cached)
+
+        output = self._agent.invoke(state, config, **kwargs)
+        self._cache.put(namespace, text, output["messages"][len(messages):])
+        return output
+
+    async def ainvoke(self, state: Dict[str, Any], config=None, **kwargs) -> Dict[str, Any]:
+        messages, text, namespace, cached = self._lookup(state)
+        if cached is not None:
+            return self._replay(messages, cached)
+
+        output = await self._agent.ainvoke(state, config, **kwargs)
+        self._cache.put(namespace, text, output["messages"][len(messages):])
+        return output
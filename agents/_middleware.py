@@ -0,0 +1,213 @@
+"""
+Agent middleware shared by the worker agents.
+"""
+
+import asyncio
+import json
+import threading
+from concurrent.futures import Future
+from typing import Any, Dict, List, Tuple
+
+from langchain.agents.middleware import AgentMiddleware
+from langchain_core.messages import AIMessage, ToolMessage
+from langchain_core.tools import BaseTool
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from config.llm_factory import estimate_tokens
+from utils.aimd_limiter import get_limiter
+from utils.serialization import content_to_str
+from utils.state_filtering import trim_to_token_budget
+
+# orjson is faster than json for the per-call argument keys; fall back if absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps_sorted(value) -> str:
+    """Serialize a value to canonical (sorted-key) JSON."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, option=orjson.OPT_SORT_KEYS, default=str).decode()
+        except TypeError:
+            pass  # e.g. non-str dict keys; json handles those
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def _turn_key(request) -> Tuple[Tuple[Any, ...], str, str]:
+    """
+    Identify a tool call by the batch of calls it was issued in plus its name and arguments.
+
+    The batch is the tuple of tool-call ids of the AI message that issued the
+    call, so identical calls emitted in the same message share a key. A call
+    whose message is not in the state gets a key of its own.
+    """
+    call_id = request.tool_call.get("id")
+    batch = (call_id,)
+    messages = request.state.get("messages", []) if isinstance(request.state, dict) else []
+    for msg in reversed(messages):
+        if isinstance(msg, AIMessage) and any(tc.get("id") == call_id for tc in msg.tool_calls):
+            batch = tuple(tc.get("id") for tc in msg.tool_calls)
+            break
+    args = _dumps_sorted(request.tool_call.get("args", {}))
+    return batch, request.tool_call["name"], args
+
+
+def _as_reply(result, request):
+    """Re-address a shared tool result to the requesting tool call."""
+    if isinstance(result, ToolMessage):
+        return result.model_copy(update={"tool_call_id": request.tool_call["id"], "id": None})
+    return result
+
+
+class DedupToolCallsMiddleware(AgentMiddleware):
+    """
+    Execute identical tool calls from the same model turn only once.
+
+    Tool calls in one AI message are already dispatched concurrently by the
+    agent runtime; this middleware makes duplicate calls within that batch
+    wait on, and reuse, the first call's result. Results are only shared
+    while the first call is in flight: its entry is dropped as soon as it
+    finishes, so a later turn (or a later run replaying a cached AI message
+    with the same tool-call ids) always executes its tools against the
+    current data.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._in_flight: Dict[tuple, Future] = {}
+        self._async_in_flight: Dict[tuple, "asyncio.Future"] = {}
+        self._lock = threading.Lock()
+
+    def wrap_tool_call(self, request, handler):
+        key = _turn_key(request)
+        with self._lock:
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = self._in_flight[key] = Future()
+
+        if not owner:
+            return _as_reply(future.result(), request)
+
+        try:
+            result = handler(request)
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+        return result
+
+    async def awrap_tool_call(self, request, handler):
+        loop = asyncio.get_running_loop()
+        # Futures belong to one event loop; runs on other loops must not await them
+        key = (id(loop), *_turn_key(request))
+        future = self._async_in_flight.get(key)
+        if future is not None:
+            return _as_reply(await asyncio.shield(future), request)
+
+        future = self._async_in_flight[key] = loop.create_future()
+        try:
+            result = await handler(request)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved; duplicates re-raise it via await
+            raise
+        else:
+            future.set_result(result)
+        finally:
+            self._async_in_flight.pop(key, None)
+        return result
+
+
+class PrecomputedToolSchemasMiddleware(AgentMiddleware):
+    """
+    Send tool definitions as JSON schemas computed once, not on every model call.
+
+    The agent runtime binds its tools to the model before each call, which
+    regenerates every tool's JSON schema from its pydantic model. This
+    middleware swaps the tools for their pre-built OpenAI-format schemas, which
+    every provider integration accepts as-is. Tool execution is unaffected: the
+    tool node still dispatches calls to the original tools by name.
+
+    Args:
+        tools: The agent's tools
+    """
+
+    def __init__(self, tools: List[BaseTool]):
+        super().__init__()
+        self._schemas = {tool.name: convert_to_openai_tool(tool) for tool in tools}
+
+    def _with_schemas(self, request):
+        tools = [
+            self._schemas.get(tool.name, tool) if isinstance(tool, BaseTool) else tool
+            for tool in request.tools
+        ]
+        return request.override(tools=tools)
+
+    def wrap_model_call(self, request, handler):
+        return handler(self._with_schemas(request))
+
+    async def awrap_model_call(self, request, handler):
+        return await handler(self._with_schemas(request))
+
+
+class AdaptiveConcurrencyMiddleware(AgentMiddleware):
+    """
+    Run model calls through the provider's shared AIMD concurrency limiter.
+
+    Every agent's model calls count against one adaptive limit per provider,
+    so parallel agent branches and batched scenarios back off together when
+    the provider returns rate-limit/server errors or slows down.
+    """
+
+    def wrap_model_call(self, request, handler):
+        with get_limiter().slot():
+            return handler(request)
+
+    async def awrap_model_call(self, request, handler):
+        async with get_limiter().aslot():
+            return await handler(request)
+
+
+class TokenBudgetMiddleware(AgentMiddleware):
+    """
+    Trim the oldest turns of a model call's messages to an estimated token budget.
+
+    A worker's conversation grows by a tool round per step; once it would
+    exceed the budget, the oldest rounds after the delegation are dropped
+    (see trim_to_token_budget) instead of the provider rejecting the call.
+    The first message, the delegation itself, is always kept.
+
+    Args:
+        max_input_tokens: Estimated prompt budget per model call
+        system_tokens: Estimated size of the system prompt, counted against the budget
+    """
+
+    def __init__(self, max_input_tokens: int, system_tokens: int = 0):
+        super().__init__()
+        self._budget = max_input_tokens - system_tokens
+
+    def _trimmed(self, request):
+        head, rest = request.messages[:1], request.messages[1:]
+        if not rest:
+            return request
+        budget = self._budget - sum(estimate_tokens(content_to_str(msg.content)) for msg in head)
+        kept = trim_to_token_budget(rest, budget)
+        if kept is rest:
+            return request
+        return request.override(messages=head + kept)
+
+    def wrap_model_call(self, request, handler):
+        return handler(self._trimmed(request))
+
+    async def awrap_model_call(self, request, handler):
+        return await handler(self._trimmed(request))
@@ -0,0 +1,88 @@
+"""
+Agent registry - builds every worker agent from a single spec table
+
+Each agent module only declares its TOOLS and SYSTEM_PROMPT; construction
+(model, prompt caching, middleware, response cache) happens here, in one place.
+"""
+
+import functools
+
+from langchain.agents import create_agent
+
+from config import AGENT_NAMES
+from config.llm_factory import create_llm, cached_system_prompt
+from config.settings import MAX_INPUT_TOKENS
+from . import (
+    route_planner,
+    procurement_manager,
+    inventory_manager,
+    distribution_handler,
+    demand_forecaster,
+    cost_optimizer,
+)
+from ._cache import CachedAgent
+from ._middleware import (
+    AdaptiveConcurrencyMiddleware,
+    DedupToolCallsMiddleware,
+    PrecomputedToolSchemasMiddleware,
+    TokenBudgetMiddleware,
+)
+
+
+# (agent name, tools, system prompt, system prompt token estimate)
+AGENT_SPECS = [
+    ("route_planner", route_planner.TOOLS, route_planner.SYSTEM_PROMPT, route_planner.SYSTEM_TOKENS),
+    ("procurement_manager", procurement_manager.TOOLS, procurement_manager.SYSTEM_PROMPT, procurement_manager.SYSTEM_TOKENS),
+    ("inventory_manager", inventory_manager.TOOLS, inventory_manager.SYSTEM_PROMPT, inventory_manager.SYSTEM_TOKENS),
+    ("distribution_handler", distribution_handler.TOOLS, distribution_handler.SYSTEM_PROMPT, distribution_handler.SYSTEM_TOKENS),
+    ("demand_forecaster", demand_forecaster.TOOLS, demand_forecaster.SYSTEM_PROMPT, demand_forecaster.SYSTEM_TOKENS),
+    ("cost_optimizer", cost_optimizer.TOOLS, cost_optimizer.SYSTEM_PROMPT, cost_optimizer.SYSTEM_TOKENS),
+]
+
+_SPECS_BY_NAME = {spec[0]: spec for spec in AGENT_SPECS}
+
+# Model tier per agent: multi-constraint reasoning gets the strong model,
+# agents that mostly route to one of a few tools get the fast one
+MODEL_TIERS = {
+    "route_planner": "strong",
+    "procurement_manager": "strong",
+    "inventory_manager": "fast",
+    "distribution_handler": "fast",
+    "demand_forecaster": "fast",
+    "cost_optimizer": "fast",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def build_agent(name: str):
+    """
+    Build (once) the worker agent registered under ``name``.
+    
+    Args:
+        name: Agent name as listed in AGENT_SPECS (e.g. "route_planner")
+        
+    Returns:
+        The compiled agent wrapped with the shared response cache
+        
+    Raises:
+        KeyError: If no agent is registered under ``name``
+    """
+    _, tools, prompt, system_tokens = _SPECS_BY_NAME[name]
+    # Stable tool order keeps the serialized tools + system prefix byte-identical
+    # across runs, so the cache breakpoint on the system prompt keeps hitting
+    tools = sorted(tools, key=lambda t: t.name)
+    agent = create_agent(
+        model=create_llm(tier=MODEL_TIERS[name]),
+        tools=tools,
+        system_prompt=cached_system_prompt(prompt),
+        middleware=[
+            TokenBudgetMiddleware(MAX_INPUT_TOKENS, system_tokens),
+            PrecomputedToolSchemasMiddleware(tools),
+            DedupToolCallsMiddleware(),
+            AdaptiveConcurrencyMiddleware(),
+        ],
+        name=AGENT_NAMES[name],
+    )
+    cached = CachedAgent(agent, prompt, [t.name for t in tools])
+    cached.system_tokens = system_tokens
+    return cached
@@ -0,0 +1,89 @@
+"""
+Token streaming for worker agents.
+
+The first token is emitted as soon as it arrives; after that, deltas are
+batched (up to ``batch_tokens`` deltas or every ``flush_interval`` seconds)
+so callers handle a few larger chunks instead of one event per token.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Dict
+
+from langchain_core.messages import AIMessageChunk
+
+
+_DONE = object()
+
+
+def _chunk_text(chunk) -> str:
+    """Extract the text of a streamed message chunk (str or content blocks)."""
+    content = chunk.content
+    if isinstance(content, str):
+        return content
+    return "".join(
+        item if isinstance(item, str) else item.get("text", "")
+        for item in content
+        if isinstance(item, str) or item.get("type") == "text"
+    )
+
+
+async def stream_agent(
+    agent,
+    state: Dict[str, Any],
+    config=None,
+    batch_tokens: int = 32,
+    flush_interval: float = 0.02,
+) -> AsyncIterator[str]:
+    """
+    Run an agent and yield its generated text in batched chunks.
+    
+    Args:
+        agent: Compiled agent (or CachedAgent proxy) to run
+        state: Agent input, e.g. {"messages": [...]}
+        config: Optional runnable config
+        batch_tokens: Maximum number of token deltas per emitted chunk
+        flush_interval: Seconds between queue drains after the first token
+        
+    Yields:
+        Text chunks of the agent's model output
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def produce():
+        try:
+            async for chunk, _ in agent.astream(state, config, stream_mode="messages"):
+                if isinstance(chunk, AIMessageChunk):
+                    text = _chunk_text(chunk)
+                    if text:
+                        queue.put_nowait(text)
+        finally:
+            queue.put_nowait(_DONE)
+
+    producer = asyncio.create_task(produce())
+    try:
+        # First token goes out immediately (time-to-first-token)
+        first = await queue.get()
+        if first is _DONE:
+            return
+        yield first
+
+        done = False
+        while not done:
+            item = await queue.get()
+            if item is _DONE:
+                break
+            batch = [item]
+            await asyncio.sleep(flush_interval)
+            while len(batch) < batch_tokens and not queue.empty():
+                item = queue.get_nowait()
+                if item is _DONE:
+                    done = True
+                    break
+                batch.append(item)
+            yield "".join(batch)
+    finally:
+        if not producer.done():
+            producer.cancel()
+        # Surface errors raised by the agent run
+        if producer.done() and not producer.cancelled():
+            producer.result()
@@ -0,0 +1,76 @@
+"""
+Batch execution of independent LLM workloads.
+
+``BatchProcessor`` runs many independent jobs (scenario runs, one-shot
+prompts) concurrently, under a concurrency cap and a token-bucket rate
+limit.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Iterable, List, Optional
+
+from langchain_core.messages import BaseMessage
+from langchain_core.rate_limiters import InMemoryRateLimiter
+
+from config import MODEL_PROVIDER
+from config.llm_factory import create_llm
+from utils.aimd_limiter import get_limiter
+
+
+class BatchProcessor:
+    """
+    Run independent LLM workloads in bulk.
+
+    Jobs run against the configured MODEL_PROVIDER (the provider of ``create_llm``).
+
+    Args:
+        max_concurrency: Maximum number of jobs in flight
+        rate_limit: Maximum job starts per second (None = unlimited)
+    """
+
+    def __init__(self, max_concurrency: int = 4, rate_limit: Optional[float] = None):
+        self.max_concurrency = max_concurrency
+        self._rate_limiter = (
+            InMemoryRateLimiter(requests_per_second=rate_limit, max_bucket_size=max_concurrency)
+            if rate_limit else None
+        )
+
+    async def map(self, func: Callable[[Any], Awaitable[Any]], items: Iterable[Any]) -> List[Any]:
+        """
+        Apply an async function to every item concurrently.
+
+        Args:
+            func: Async function called once per item
+            items: Job inputs
+
+        Returns:
+            Results in input order; a job that raised yields its exception
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run_one(item):
+            async with semaphore:
+                if self._rate_limiter is not None:
+                    await self._rate_limiter.aacquire()
+                return await func(item)
+
+        return await asyncio.gather(*(run_one(item) for item in items), return_exceptions=True)
+
+    async def invoke_all(self, prompts: List[List[BaseMessage]]) -> List[Any]:
+        """
+        Run one-shot prompts (no tool loop) and return their text responses.
+
+        Args:
+            prompts: One message list per request
+
+        Returns:
+            Response text per prompt, in order (an exception for failed requests)
+        """
+        llm = create_llm()
+        limiter = get_limiter(MODEL_PROVIDER)
+
+        async def invoke(messages):
+            async with limiter.aslot():
+                return (await llm.ainvoke(messages)).text
+
+        return await self.map(invoke, prompts)
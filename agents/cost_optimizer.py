@@ -2,34 +2,38 @@
 Cost Optimizer Agent - Specialized in financial analysis and cost reduction
 """
 
-from langchain.agents import create_agent
-from config import AGENT_NAMES
-from config.llm_factory import create_llm
+import sys
+
+from config.llm_factory import estimate_tokens
 from tools import analyze_financial_costs, calculate_roi, identify_cost_savings
 
 
-cost_optimizer_agent = create_agent(
-    model=create_llm(),
-    tools=[analyze_financial_costs, calculate_roi, identify_cost_savings],
-    system_prompt=(
-        "You are a Cost Optimizer agent specialized in financial analysis and cost reduction.\n\n"
-        "RESPONSIBILITIES:\n"
-        "- Analyze operational costs and identify overruns\n"
-        "- Identify cost savings opportunities across all operations\n"
-        "- Calculate ROI for optimization initiatives\n"
-        "- Recommend specific cost reduction strategies\n\n"
-        "AVAILABLE TOOLS:\n"
-        "- analyze_financial_costs: Analyze the financial costs of an operation\n"
-        "- calculate_roi: Calculate the ROI of an optimization initiative\n"
-        "- identify_cost_savings: Identify the cost savings of an optimization initiative\n\n"
-        "INSTRUCTIONS:\n"
-        "- Use your tools to analyze cost data from multiple sources\n"
-        "- Quantify potential savings in dollar amounts\n"
-        "- Prioritize high-impact cost reduction opportunities\n"
-        "- Provide ROI calculations for major initiatives\n"
-        "- Respond with a concise summary of cost issues and optimization recommendations\n"
-        "- Do NOT include raw data dumps in your response\n"
-    ),
-    name=AGENT_NAMES["cost_optimizer"],
-)
+TOOLS = [analyze_financial_costs, calculate_roi, identify_cost_savings]
+
+SYSTEM_PROMPT = sys.intern("""\
+You are a Cost Optimizer agent specialized in financial analysis and cost reduction.
+
+RESPONSIBILITIES:
+- Analyze operational costs and identify overruns
+- Identify cost savings opportunities across all operations
+- Calculate ROI for optimization initiatives
+- Recommend specific cost reduction strategies
+
+AVAILABLE TOOLS:
+- analyze_financial_costs: Analyze the financial costs of an operation
+- calculate_roi: Calculate the ROI of an optimization initiative
+- identify_cost_savings: Identify the cost savings of an optimization initiative
+
+INSTRUCTIONS:
+- Use your tools to analyze cost data from multiple sources
+- Quantify potential savings in dollar amounts
+- Prioritize high-impact cost reduction opportunities
+- Provide ROI calculations for major initiatives
+- Respond with a concise summary of cost issues and optimization recommendations
+- Do NOT include raw data dumps in your response
+- When tool calls are independent, request them together in a single response so they run in parallel
+""")
+
+# Computed once so callers can budget context without re-tokenizing the prompt
+SYSTEM_TOKENS = estimate_tokens(SYSTEM_PROMPT)
 
@@ -2,34 +2,38 @@
 Route Planner Agent - Specialized in logistics route optimization
 """
 
-from langchain.agents import create_agent
-from config import AGENT_NAMES
-from config.llm_factory import create_llm
+import sys
+
+from config.llm_factory import estimate_tokens
 from tools import optimize_routes, assign_vehicle_to_route, check_traffic_conditions
 
 
-route_planner_agent = create_agent(
-    model=create_llm(),
-    tools=[optimize_routes, assign_vehicle_to_route, check_traffic_conditions],
-    system_prompt=(
-        "You are a Route Planner agent specialized in logistics route optimization.\n\n"
-        "RESPONSIBILITIES:\n"
-        "- Analyze route efficiency and identify optimization opportunities\n"
-        "- Evaluate traffic conditions and their impact on deliveries\n"
-        "- Recommend vehicle assignments and route adjustments\n"
-        "- Handle route disruptions and provide alternative routing solutions\n\n"
-        "AVAILABLE TOOLS:\n"
-        "- optimize_routes: Optimize the routes of a delivery\n"
-        "- assign_vehicle_to_route: Assign a vehicle to a route\n"
-        "- check_traffic_conditions: Check the traffic conditions of a route\n\n"
-        "INSTRUCTIONS:\n"
-        "- Use your tools to analyze route data from the provided scenario\n"
-        "- Provide clear, actionable recommendations\n"
-        "- Focus on minimizing delays and optimizing delivery times\n"
-        "- Consider traffic conditions in all recommendations\n"
-        "- Respond with a concise summary of findings and recommended actions\n"
-        "- Do NOT include raw data dumps in your response\n"
-    ),
-    name=AGENT_NAMES["route_planner"],
-)
+TOOLS = [optimize_routes, assign_vehicle_to_route, check_traffic_conditions]
+
+SYSTEM_PROMPT = sys.intern("""\
+You are a Route Planner agent specialized in logistics route optimization.
+
+RESPONSIBILITIES:
+- Analyze route efficiency and identify optimization opportunities
+- Evaluate traffic conditions and their impact on deliveries
+- Recommend vehicle assignments and route adjustments
+- Handle route disruptions and provide alternative routing solutions
+
+AVAILABLE TOOLS:
+- optimize_routes: Optimize the routes of a delivery
+- assign_vehicle_to_route: Assign a vehicle to a route
+- check_traffic_conditions: Check the traffic conditions of a route
+
+INSTRUCTIONS:
+- Use your tools to analyze route data from the provided scenario
+- Provide clear, actionable recommendations
+- Focus on minimizing delays and optimizing delivery times
+- Consider traffic conditions in all recommendations
+- Respond with a concise summary of findings and recommended actions
+- Do NOT include raw data dumps in your response
+- When tool calls are independent, request them together in a single response so they run in parallel
+""")
+
+# Computed once so callers can budget context without re-tokenizing the prompt
+SYSTEM_TOKENS = estimate_tokens(SYSTEM_PROMPT)
 
@@ -8,11 +8,17 @@ from .settings import (
     ANTHROPIC_API_KEY,
     GOOGLE_API_KEY,
     OPENAI_API_KEY,
+    BEDROCK_REGION,
     MODEL_PROVIDER,
     MODEL_NAME,
     CLAUDE_MODEL,
     GEMINI_MODEL,
     OPENAI_MODEL,
+    BEDROCK_MODEL,
+    CLAUDE_FAST_MODEL,
+    GEMINI_FAST_MODEL,
+    OPENAI_FAST_MODEL,
+    BEDROCK_FAST_MODEL,
     SCENARIO_DIRS,
     AGENT_NAMES,
 )
@@ -23,11 +29,17 @@ __all__ = [
     "ANTHROPIC_API_KEY",
     "GOOGLE_API_KEY",
     "OPENAI_API_KEY",
+    "BEDROCK_REGION",
     "MODEL_PROVIDER",
     "MODEL_NAME",
     "CLAUDE_MODEL",
     "GEMINI_MODEL",
     "OPENAI_MODEL",
+    "BEDROCK_MODEL",
+    "CLAUDE_FAST_MODEL",
+    "GEMINI_FAST_MODEL",
+    "OPENAI_FAST_MODEL",
+    "BEDROCK_FAST_MODEL",
     "SCENARIO_DIRS",
     "AGENT_NAMES",
 ]
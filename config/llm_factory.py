@@ -1,89 +1,233 @@
 """
 LLM Factory - Creates the appropriate LLM instance based on configuration
+
+Provider SDKs and LangChain message classes are imported on first use, so
+importing this module (e.g. for get_model_info) stays cheap.
 """
-from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_openai import ChatOpenAI
+import functools
+import importlib
+from typing import TYPE_CHECKING
 from config.settings import (
     MODEL_PROVIDER, 
     ANTHROPIC_API_KEY, 
     GOOGLE_API_KEY, 
     OPENAI_API_KEY,
+    AWS_ACCESS_KEY_ID,
+    AWS_PROFILE,
+    BEDROCK_REGION,
+    BEDROCK_LATENCY,
     CLAUDE_MODEL, 
     GEMINI_MODEL,
-    OPENAI_MODEL
+    OPENAI_MODEL,
+    BEDROCK_MODEL,
+    CLAUDE_FAST_MODEL,
+    GEMINI_FAST_MODEL,
+    OPENAI_FAST_MODEL,
+    BEDROCK_FAST_MODEL,
+    MODEL_TIERS,
 )
 
+if TYPE_CHECKING:
+    from langchain_core.messages import HumanMessage
+
+
+# Anthropic cache breakpoint. The 1-hour TTL keeps the shared prefix warm across
+# a whole batch of scenario runs; all breakpoints use it because longer TTLs
+# must not follow shorter ones within a request.
+_CACHE_CONTROL = {"type": "ephemeral", "ttl": "1h"}
+
+_WARMUP_TOKEN_ARG = {
+    "claude": "max_tokens",
+    "openai": "max_tokens",
+    "bedrock": "max_tokens",
+    "gemini": "max_output_tokens",
+}
 
-def create_llm(temperature: float = 0):
+
+def create_llm(temperature: float = 0, tier: str = "strong"):
     """
     Create an LLM instance based on the configured provider.
     
+    Instances are memoized per temperature, so every agent shares a single
+    client (and its HTTP connection pool) instead of opening its own.
+    Streaming is enabled so agents can emit tokens as they are generated.
+    Identical repeat requests are answered from the shared request cache.
+    
     Args:
         temperature: Temperature for generation (0 = deterministic, 1 = creative)
+        tier: "strong" for the provider's main model, "fast" for its cheaper,
+            lower-latency variant (for simple tool-routing agents)
         
     Returns:
-        LLM instance (ChatAnthropic, ChatGoogleGenerativeAI, or ChatOpenAI)
+        LLM instance (ChatAnthropic, ChatGoogleGenerativeAI, ChatOpenAI, or ChatBedrockConverse)
         
     Raises:
-        ValueError: If provider is not supported or API key is missing
+        ValueError: If provider or tier is not supported, or API key is missing
     """
-    if MODEL_PROVIDER == "claude":
-        if not ANTHROPIC_API_KEY:
-            raise ValueError("ANTHROPIC_API_KEY not set. Please set it in .streamlit/secrets.toml or environment.")
-        
-        return ChatAnthropic(
-            model=CLAUDE_MODEL,
-            temperature=temperature,
-            api_key=ANTHROPIC_API_KEY
+    if tier not in MODEL_TIERS:
+        raise ValueError(f"Unsupported model tier: {tier}. Supported tiers: {', '.join(MODEL_TIERS)}")
+    return _create_llm(float(temperature), tier == "fast")
+
+
+def _bedrock_client_class():
+    """Import the Bedrock client (optional dependency, only needed for this provider)."""
+    try:
+        from langchain_aws import ChatBedrockConverse
+    except ImportError:
+        raise ValueError("langchain-aws is not installed. Install it with: pip install langchain-aws")
+    return ChatBedrockConverse
+
+
+# provider -> (client class loader, (strong model, fast model),
+#              API key setting name, API key, API key kwarg, extra client kwargs)
+# Bedrock uses the AWS credential chain instead of an API key. Client classes
+# are imported on first use, so only the configured provider's SDK is loaded.
+_PROVIDERS = {
+    "claude": (
+        lambda: importlib.import_module("langchain_anthropic").ChatAnthropic, (CLAUDE_MODEL, CLAUDE_FAST_MODEL),
+        "ANTHROPIC_API_KEY", ANTHROPIC_API_KEY, "api_key", {"streaming": True},
+    ),
+    "gemini": (
+        lambda: importlib.import_module("langchain_google_genai").ChatGoogleGenerativeAI, (GEMINI_MODEL, GEMINI_FAST_MODEL),
+        "GOOGLE_API_KEY", GOOGLE_API_KEY, "google_api_key", {"streaming": True},
+    ),
+    "openai": (
+        lambda: importlib.import_module("langchain_openai").ChatOpenAI, (OPENAI_MODEL, OPENAI_FAST_MODEL),
+        "OPENAI_API_KEY", OPENAI_API_KEY, "api_key", {"streaming": True},
+    ),
+    "bedrock": (
+        _bedrock_client_class, (BEDROCK_MODEL, BEDROCK_FAST_MODEL),
+        None, None, None,
+        {"region_name": BEDROCK_REGION, "performance_config": {"latency": BEDROCK_LATENCY}},
+    ),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _create_llm(temperature: float, fast: bool):
+    """Build the provider client; see create_llm."""
+    spec = _PROVIDERS.get(MODEL_PROVIDER)
+    if spec is None:
+        raise ValueError(
+            f"Unsupported MODEL_PROVIDER: {MODEL_PROVIDER}. "
+            f"Supported providers: {', '.join(repr(p) for p in _PROVIDERS)}"
         )
+    from config.request_cache import request_cache
     
-    elif MODEL_PROVIDER == "gemini":
-        if not GOOGLE_API_KEY:
-            raise ValueError("GOOGLE_API_KEY not set. Please set it in .streamlit/secrets.toml or environment.")
+    load_class, models, key_name, api_key, key_kwarg, extra_kwargs = spec
+    
+    kwargs = {"model": models[fast], "temperature": temperature, "cache": request_cache, **extra_kwargs}
+    if key_name:
+        if not api_key:
+            raise ValueError(f"{key_name} not set. Please set it in .streamlit/secrets.toml or environment.")
+        kwargs[key_kwarg] = api_key
+    
+    return load_class()(**kwargs)
+
+
+def warmup_llm() -> bool:
+    """
+    Open the shared client's connection with a 1-token request.
+    
+    Pays the TLS handshake and client setup before the first real agent
+    call. Failures are ignored; the real call will surface them.
+    
+    Returns:
+        True if the warmup request succeeded
+    """
+    try:
+        llm = create_llm()
+        llm.invoke("ping", **{_WARMUP_TOKEN_ARG.get(MODEL_PROVIDER, "max_tokens"): 1})
+        return True
+    except Exception:
+        return False
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate the token count of a text without calling a tokenizer.
+    
+    Uses the common ~4 characters per token approximation, which is close
+    enough for context budgeting and needs no network or model download.
+    
+    Args:
+        text: Text to measure
         
-        return ChatGoogleGenerativeAI(
-            model=GEMINI_MODEL,
-            temperature=temperature,
-            google_api_key=GOOGLE_API_KEY
-        )
+    Returns:
+        Approximate number of tokens
+    """
+    return (len(text) + 3) // 4
+
+
+def cached_system_prompt(prompt: str):
+    """
+    Wrap a static system prompt so the provider can cache it across calls.
     
-    elif MODEL_PROVIDER == "openai":
-        if not OPENAI_API_KEY:
-            raise ValueError("OPENAI_API_KEY not set. Please set it in .streamlit/secrets.toml or environment.")
+    For Claude the prompt is sent as a single text block carrying a
+    cache_control breakpoint, so the tool definitions and system prompt prefix
+    are reused between turns instead of being re-processed on every call.
+    Other providers get the plain string (they cache long prefixes automatically).
+    
+    Args:
+        prompt: The static system prompt text
         
-        return ChatOpenAI(
-            model=OPENAI_MODEL,
-            temperature=temperature,
-            api_key=OPENAI_API_KEY
-        )
+    Returns:
+        SystemMessage with a cache breakpoint (Claude) or the original string
+    """
+    if MODEL_PROVIDER == "claude":
+        from langchain_core.messages import SystemMessage
+        return SystemMessage(content=[
+            {"type": "text", "text": prompt, "cache_control": _CACHE_CONTROL}
+        ])
+    return prompt
+
+
+def cached_user_message(text: str) -> "HumanMessage":
+    """
+    Build the scenario message so its prefix is cached across agents.
     
-    else:
-        raise ValueError(
-            f"Unsupported MODEL_PROVIDER: {MODEL_PROVIDER}. "
-            f"Supported providers: 'claude', 'gemini', 'openai'"
-        )
+    Every agent handling a scenario receives the same scenario message right
+    after its static tools + system prefix. For Claude the message carries a
+    1-hour cache breakpoint, so one cache write is reused by all agents and by
+    repeated runs of the scenario. Gemini and OpenAI cache repeated prefixes
+    implicitly; scenario messages are far below Gemini's minimum size for an
+    explicit CachedContent, so no cache handle is created for them.
+    
+    Args:
+        text: The scenario message text
+        
+    Returns:
+        HumanMessage with a cache breakpoint (Claude) or plain text content
+    """
+    from langchain_core.messages import HumanMessage
+    
+    if MODEL_PROVIDER == "claude":
+        return HumanMessage(content=[
+            {"type": "text", "text": text, "cache_control": _CACHE_CONTROL}
+        ])
+    return HumanMessage(content=text)
 
 
 def get_model_info():
     """
     Get information about the currently configured model.
     
+    A pure settings lookup: no client is created and no provider SDK is
+    imported, so CLI preflight checks and ``list``/``viz`` stay cheap.
+    
     Returns:
         Dictionary with provider, model name, and API key status
     """
-    if MODEL_PROVIDER == "claude":
-        api_key_set = bool(ANTHROPIC_API_KEY)
-        model_name = CLAUDE_MODEL
-    elif MODEL_PROVIDER == "gemini":
-        api_key_set = bool(GOOGLE_API_KEY)
-        model_name = GEMINI_MODEL
-    elif MODEL_PROVIDER == "openai":
-        api_key_set = bool(OPENAI_API_KEY)
-        model_name = OPENAI_MODEL
-    else:
+    spec = _PROVIDERS.get(MODEL_PROVIDER)
+    if spec is None:
         api_key_set = False
         model_name = "unknown"
+    elif MODEL_PROVIDER == "bedrock":
+        api_key_set = bool(AWS_ACCESS_KEY_ID or AWS_PROFILE)
+        model_name = spec[1][0]
+    else:
+        api_key_set = bool(spec[3])
+        model_name = spec[1][0]
     
     return {
         "provider": MODEL_PROVIDER,
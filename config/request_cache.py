@@ -0,0 +1,97 @@
+"""
+In-process request cache for LLM calls.
+
+The supervisor's tool-calling loop can re-issue a request the model has
+already answered (same messages, same model, same bound tools). Every client
+built by ``create_llm`` uses this cache, so such a repeat is answered from
+memory instead of making a second API call. Entries live for a few minutes
+and the cache is cleared at the start of each scenario run, so nothing leaks
+between scenarios.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Sequence, Tuple
+
+from langchain_core.caches import BaseCache
+
+
+logger = logging.getLogger(__name__)
+
+
+def _tokens_of(generations: Sequence[Any]) -> int:
+    """Tokens a cached response would have cost (reported usage, else an estimate)."""
+    from config.llm_factory import estimate_tokens
+
+    total = 0
+    for generation in generations:
+        usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+        total += usage["total_tokens"] if usage else estimate_tokens(generation.text)
+    return total
+
+
+class RequestCache(BaseCache):
+    """
+    Bounded TTL cache of LLM responses keyed on the exact request.
+
+    The key is a BLAKE2b hash of the serialized messages (ids stripped by
+    LangChain) and the model configuration string, which includes the model
+    name, sampling parameters, bound tools and tool_choice.
+
+    Args:
+        maxsize: Maximum number of cached responses (oldest evicted first)
+        ttl: Seconds an entry stays valid
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.tokens_saved = 0
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(prompt: str, llm_string: str) -> str:
+        """Hash a request into its cache key."""
+        return hashlib.blake2b(f"{llm_string}\x00{prompt}".encode("utf-8"), digest_size=16).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[Any]:
+        """Return the cached generations for a request, or None on a miss."""
+        key = self.make_key(prompt, llm_string)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, generations = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            saved = _tokens_of(generations)
+            self.hits += 1
+            self.tokens_saved += saved
+        logger.info("LLM request cache hit (tokens saved: %d)", saved)
+        return generations
+
+    def update(self, prompt: str, llm_string: str, return_val: Any) -> None:
+        """Store the generations returned for a request."""
+        key = self.make_key(prompt, llm_string)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, return_val)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self, **kwargs: Any) -> None:
+        """Drop all cached responses and reset the hit counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.tokens_saved = 0
+
+
+# Shared by every client created by create_llm
+request_cache = RequestCache()
@@ -0,0 +1,110 @@
+"""
+Lexical scenario router.
+
+Picks the agents for a scenario alert without an LLM call. The alert is
+compared (cosine similarity of term-frequency vectors over the templates'
+vocabulary) against one template per known scenario type, built from the
+scenario index at import time; a confident match returns that scenario's
+primary and secondary agents.
+Anything less certain returns an empty list so the caller can fall back to
+the LLM planner.
+"""
+
+import csv
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple
+
+from config.settings import MOCK_DATA_DIR, SCENARIO_DIRS, AGENT_NAMES
+
+
+# Minimum cosine similarity of the best template for a routing decision
+MIN_CONFIDENCE = 0.55
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Agent labels in the scenario index that differ from the agent names
+_AGENT_ALIASES = {"inventory_forecaster": "demand_forecaster"}
+
+
+def _embed(text: str, vocabulary: Optional[Set[str]] = None) -> Tuple[Counter, float]:
+    """Return a sparse term-frequency vector (optionally limited to a vocabulary) and its L2 norm."""
+    tokens = _TOKEN_RE.findall(text.lower())
+    if vocabulary is not None:
+        tokens = [token for token in tokens if token in vocabulary]
+    vector = Counter(tokens)
+    return vector, math.sqrt(sum(count * count for count in vector.values()))
+
+
+def _cosine(a: Tuple[Counter, float], b: Tuple[Counter, float]) -> float:
+    """Cosine similarity between two sparse vectors."""
+    (vec_a, norm_a), (vec_b, norm_b) = a, b
+    if not norm_a or not norm_b:
+        return 0.0
+    if len(vec_a) > len(vec_b):
+        vec_a, vec_b = vec_b, vec_a
+    return sum(count * vec_b.get(token, 0) for token, count in vec_a.items()) / (norm_a * norm_b)
+
+
+def _agent_names(labels: str) -> List[str]:
+    """Map '|'-separated agent labels from the scenario index to agent names."""
+    names = []
+    for label in labels.split("|"):
+        name = label.strip().lower().replace(" ", "_")
+        name = _AGENT_ALIASES.get(name, name)
+        if name in AGENT_NAMES and name not in names:
+            names.append(name)
+    return names
+
+
+def _load_templates() -> List[Dict]:
+    """Build one routing template per scenario in the scenario index."""
+    templates = []
+    try:
+        with open(MOCK_DATA_DIR / "scenario_index.csv", newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+    except OSError:
+        return templates
+
+    for row in rows:
+        try:
+            scenario_dir = SCENARIO_DIRS.get(int(row["scenario_id"]), "")
+        except (KeyError, ValueError):
+            continue
+        text = " ".join([
+            scenario_dir.replace("_", " "),
+            row.get("scenario_name", ""),
+            row.get("trigger_type", "").replace("_", " "),
+        ])
+        templates.append({
+            "vector": _embed(text),
+            "agents": _agent_names(f"{row.get('primary_agents', '')}|{row.get('secondary_agents', '')}"),
+        })
+    return templates
+
+
+_TEMPLATES = _load_templates()
+# Words outside every template carry no routing signal (alert boilerplate, data
+# values), so they are left out of the alert's vector
+_VOCABULARY = set().union(*(template["vector"][0] for template in _TEMPLATES))
+
+
+def route(scenario_message: str, min_confidence: float = MIN_CONFIDENCE) -> List[str]:
+    """
+    Select the agents for a scenario alert by nearest scenario template.
+
+    Args:
+        scenario_message: The scenario trigger message
+        min_confidence: Minimum similarity of the best template
+
+    Returns:
+        Agent names to consult, or an empty list when no template matches confidently
+    """
+    vector = _embed(scenario_message, _VOCABULARY)
+    best_score, best_agents = 0.0, []
+    for template in _TEMPLATES:
+        score = _cosine(vector, template["vector"])
+        if score > best_score:
+            best_score, best_agents = score, template["agents"]
+    return list(best_agents) if best_score >= min_confidence else []
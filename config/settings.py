@@ -2,22 +2,41 @@
 Configuration settings for the Logistics Multi-Agent System
 """
 
+import functools
 import os
+import sys
 from pathlib import Path
 
 # Project root directory (parent of config folder)
 PROJECT_ROOT = Path(__file__).parent.parent
 
+# Streamlit is optional: only used for st.secrets when running the web app or
+# when a secrets.toml exists (importing it otherwise slows down CLI startup)
+_SECRETS_FILES = (
+    PROJECT_ROOT / ".streamlit" / "secrets.toml",
+    Path.cwd() / ".streamlit" / "secrets.toml",
+    Path.home() / ".streamlit" / "secrets.toml",
+)
+_ST_SECRETS = None
+if "streamlit" in sys.modules or any(path.is_file() for path in _SECRETS_FILES):
+    try:
+        import streamlit as st
+        _ST_SECRETS = getattr(st, "secrets", None)
+    except ImportError:
+        pass
+
 # Mock data directory
 MOCK_DATA_DIR = PROJECT_ROOT / "mock_data"
 
 
+@functools.lru_cache(maxsize=None)
 def get_secret(key: str, default: str = "") -> str:
     """
     Get a secret value from Streamlit secrets or environment variables.
     
     This function provides a unified interface for accessing secrets that works both
     in Streamlit apps (using st.secrets) and in standalone scripts (using os.environ).
+    Results are memoized, so repeated lookups of the same key are dict hits.
     
     Args:
         key: The secret key to retrieve
@@ -26,13 +45,13 @@ def get_secret(key: str, default: str = "") -> str:
     Returns:
         The secret value or the default
     """
-    # Try to import streamlit and use st.secrets
-    try:
-        import streamlit as st
-        if hasattr(st, 'secrets') and key in st.secrets:
-            return st.secrets[key]
-    except (ImportError, FileNotFoundError, KeyError):
-        pass
+    if _ST_SECRETS is not None:
+        try:
+            if key in _ST_SECRETS:
+                return _ST_SECRETS[key]
+        except (FileNotFoundError, KeyError):
+            # No secrets.toml: fall back to the environment
+            pass
     
     # Fallback to environment variables
     return os.environ.get(key, default)
@@ -43,20 +62,42 @@ ANTHROPIC_API_KEY = get_secret("ANTHROPIC_API_KEY", "")
 GOOGLE_API_KEY = get_secret("GOOGLE_API_KEY", "")
 OPENAI_API_KEY = get_secret("OPENAI_API_KEY", "")
 
+# AWS Bedrock uses the standard AWS credential chain (env vars, profile, role)
+AWS_ACCESS_KEY_ID = get_secret("AWS_ACCESS_KEY_ID", "")
+AWS_PROFILE = get_secret("AWS_PROFILE", "")
+BEDROCK_REGION = get_secret("BEDROCK_REGION", "us-east-2")
+
 # Model Configuration
-# Supported: "claude", "gemini", or "openai"
+# Supported: "claude", "gemini", "openai", or "bedrock" (Claude via AWS Bedrock)
 MODEL_PROVIDER = get_secret("MODEL_PROVIDER", "claude").lower()
 
 # Claude Models
 CLAUDE_MODEL = "claude-sonnet-4-20250514"
 # CLAUDE_MODEL = "claude-3-5-sonnet-20241022"
+CLAUDE_FAST_MODEL = "claude-haiku-4-5-20251001"
 
 # Gemini Models
 GEMINI_MODEL = "gemini-2.5-flash"
+GEMINI_FAST_MODEL = "gemini-2.5-flash-lite"
 
 # OpenAI Models
 OPENAI_MODEL = "gpt-4o"  # GPT-4o (latest GPT-4 model)
 # OPENAI_MODEL = "gpt-5-mini"  # GPT-5 mini (latest GPT-5 model)
+OPENAI_FAST_MODEL = "gpt-4o-mini"
+
+# Bedrock Models (Claude served through AWS Bedrock)
+BEDROCK_MODEL = "us.anthropic.claude-sonnet-4-20250514-v1:0"
+BEDROCK_FAST_MODEL = "us.anthropic.claude-haiku-4-5-20251001-v1:0"
+
+# Model tiers: "strong" uses the *_MODEL above, "fast" the cheaper *_FAST_MODEL
+# (agents pick a tier in agents/_registry.py)
+MODEL_TIERS = ("strong", "fast")
+# "optimized" requests Bedrock latency-optimized inference, "standard" disables it
+BEDROCK_LATENCY = get_secret("BEDROCK_LATENCY", "optimized")
+# Estimated prompt budget per worker model call (system prompt included); the oldest
+# turns are trimmed above it. The default fits every configured model's context
+# window with room left for tool schemas and the reply.
+MAX_INPUT_TOKENS = int(get_secret("MAX_INPUT_TOKENS", "100000"))
 
 # Get the appropriate model name based on provider
 if MODEL_PROVIDER == "claude":
@@ -65,8 +106,15 @@ elif MODEL_PROVIDER == "gemini":
     MODEL_NAME = GEMINI_MODEL
 elif MODEL_PROVIDER == "openai":
     MODEL_NAME = OPENAI_MODEL
+elif MODEL_PROVIDER == "bedrock":
+    MODEL_NAME = BEDROCK_MODEL
 else:
     MODEL_NAME = CLAUDE_MODEL  # Default fallback
+
+# Warm up the LLM connection in the background when the agents package is imported
+# (opt-in: set LOGISTICS_WARMUP=1; keep it off in tests and offline environments)
+LOGISTICS_WARMUP = get_secret("LOGISTICS_WARMUP", "0") == "1"
+
 # Scenario mapping
 SCENARIO_DIRS = {
     1: "scenario_1_low_inventory",
@@ -1,152 +1,257 @@
 """
 Main entry point for the Logistics Multi-Agent System
 
-This refactored version uses langgraph-supervisor for simplified supervisor/worker coordination.
+Command-line interface: runs scenarios through the orchestrator graph
+(see orchestrator.py), interactively or in batches.
 """
 
+import asyncio
+import atexit
+import hashlib
+import logging
+import logging.handlers
 import os
-from langchain_core.messages import HumanMessage
-from langgraph_supervisor import create_supervisor
-
-from config import MODEL_PROVIDER
-from config.llm_factory import create_llm, get_model_info
-from agents import (
-    route_planner_agent,
-    procurement_manager_agent,
-    inventory_manager_agent,
-    distribution_handler_agent,
-    demand_forecaster_agent,
-    cost_optimizer_agent,
+import queue
+import sys
+from collections import deque
+
+from config import MOCK_DATA_DIR, MODEL_PROVIDER, PROJECT_ROOT
+from config.llm_factory import get_model_info
+from tools import warm_scenario
+from utils import (
+    load_scenario, list_available_scenarios, cached_scenario, clear_caches, content_to_str, content_to_text,
+    has_agent_error, mark_run_failed,
 )
-from utils import load_scenario, list_available_scenarios
 
-def create_logistics_graph():
+
+# The orchestrator (LLM clients, agents, langgraph) is only imported when a
+# graph is actually needed, so commands like ``list`` start quickly
+_ORCHESTRATOR_EXPORTS = ("create_logistics_graph", "create_supervisor_graph", "message_text")
+
+
+def __getattr__(name):
+    if name in _ORCHESTRATOR_EXPORTS:
+        import orchestrator
+        return getattr(orchestrator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _ConsoleHandler(logging.StreamHandler):
+    """Stream handler honouring a per-record line ending (``extra={"end": ""}`` for streamed tokens)."""
+    
+    def emit(self, record):
+        self.terminator = getattr(record, "end", "\n")
+        super().emit(record)
+
+
+# CLI output goes through a queue drained by a background thread, so writes to
+# the console never block the event loop between LLM calls and lines from
+# concurrent runs are emitted whole and in order.
+_LOG_QUEUE = queue.Queue(-1)
+logger = logging.getLogger("logistics")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+logger.addHandler(logging.handlers.QueueHandler(_LOG_QUEUE))
+_log_listener = logging.handlers.QueueListener(_LOG_QUEUE, _ConsoleHandler(sys.stdout))
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+
+def _flush_output():
+    """Wait until all queued log output has been written (before direct prints or input())."""
+    _LOG_QUEUE.join()
+
+
+class _TokenPrinter:
+    """
+    Print streamed LLM tokens for one node at a time.
+    
+    Parallel agent branches stream concurrently; the first node to produce
+    tokens is printed live while the others are buffered and printed, in
+    order, once the live node completes.
+    """
+    
+    def __init__(self):
+        self.live_node = None
+        self.buffers = {}
+        self.done = set()
+    
+    def token(self, node: str, text: str):
+        if self.live_node is None and not self.buffers:
+            self.live_node = node
+            logger.info("\n  [%s] ", node, extra={"end": ""})
+        if node == self.live_node:
+            logger.info("%s", text, extra={"end": ""})
+        else:
+            self.buffers.setdefault(node, []).append(text)
+    
+    def node_done(self, node: str):
+        self.done.add(node)
+        if node == self.live_node:
+            self.live_node = None
+    
+    def flush_next(self):
+        """Promote buffered nodes to live output until one is still running."""
+        while self.live_node is None and self.buffers:
+            node = next(iter(self.buffers))
+            logger.info("\n  [%s] %s", node, "".join(self.buffers.pop(node)), extra={"end": ""})
+            if node not in self.done:
+                self.live_node = node
+
+
+def extract_summary(final_state) -> str:
     """
-    Create the complete multi-agent logistics graph using langgraph-supervisor.
+    Extract the final summary from the last state emitted by the graph.
     
+    Args:
+        final_state: Last update yielded by graph.stream
+        
     Returns:
-        Compiled supervisor graph ready for execution
+        The last substantial message of the final node, or None if not found
     """
-    llm = create_llm(temperature=0)
-    
-    # Create supervisor using the prebuilt langgraph-supervisor package
-    supervisor = create_supervisor(
-        model=llm,
-        agents=[
-            route_planner_agent,
-            procurement_manager_agent,
-            inventory_manager_agent,
-            distribution_handler_agent,
-            demand_forecaster_agent,
-            cost_optimizer_agent,
-        ],
-        prompt=(
-            "You are the Main Orchestrator for a logistics multi-agent system.\n\n"
-            "ROLE:\n"
-            "You coordinate specialized agents to handle logistics scenarios including:\n"
-            "- Low inventory situations\n"
-            "- Route disruptions and traffic issues\n"
-            "- Demand spikes and forecasting\n"
-            "- Cost optimization opportunities\n"
-            "- Supplier issues and procurement\n"
-            "- Distribution delays and SLA management\n\n"
-            "AVAILABLE AGENTS:\n"
-            "- Route Planner Agent\n"
-            "- Procurement Manager Agent\n"
-            "- Inventory Manager Agent\n"
-            "- Distribution Handler Agent\n"
-            "- Demand Forecaster Agent\n"
-            "- Cost Optimizer Agent\n\n"
-            "WORKFLOW:\n"
-            "1. Analyze the trigger event and scenario data provided\n"
-            "2. Determine which specialized agents need to be called\n"
-            "3. Delegate tasks to agents ONE AT A TIME with clear instructions\n"
-            "4. Review agent responses and delegate follow-up tasks if needed\n"
-            "5. If the issue is not resolved, delegate the task to the next agent\n"
-            "6. Synthesize a final natural language summary including:\n"
-            "   - The issue that occurred\n"
-            "   - Actions taken by each agent\n"
-            "   - Overall recommendations and next steps: THIS SECTION MUST INCLUDE A FULLY DETAILED PLAN OF ACTION FOR THE NEXT STEPS\n\n"
-            "INSTRUCTIONS:\n"
-            "- When delegating, provide the agent with the scenario directory name and specific task\n"
-            "- ALL AGENTS REQUIRED TO SOLVE THE ISSUE MUST BE CALLED BEFORE YOU CAN RETURN A SUMMARY\n"
-            "- DO NOT RETURN ANY AGENT CALLS AS STEPS IN YOUR SUMMARY\n"
-            "- When solving an issue, make sure to call all the necessary agents to solve the issue\n"
-            "- Do NOT call multiple agents in parallel - delegate sequentially\n"
-            "- Wait for each agent's response before deciding on next steps\n"
-            "- The scenario directory follows the pattern: 'scenario_X_description'\n"
-            "- After all agents have completed their work, provide a comprehensive summary\n"
-            "- Your summary should be in natural language, suitable for management review\n"
-            "- When listing anything in your summary, use markdown formatting and a newline delimeter after each item and section\n"
-            "- Do NOT include raw data or tool outputs in your final summary\n"
-            "- Focus on insights, actions taken, and business impact\n\n"
-            "Remember: You are the coordinator. Do NOT perform the actual analysis yourself - "
-            "delegate to the appropriate specialized agents using the transfer tools."
-        ),
-        add_handoff_back_messages=True,
-        supervisor_name="Main_Orchestrator",  # No spaces for OpenAI compatibility
-        output_mode="full_history",
-    ).compile()
-    
-    return supervisor
-
-
-def run_scenario(scenario_id: int, verbose: bool = True):
+    if not final_state:
+        return None
+    
+    last_key = next(reversed(final_state))
+    if "messages" not in final_state[last_key]:
+        return None
+    
+    messages = final_state[last_key]["messages"]
+    # Find the last AI message from supervisor
+    for msg in reversed(messages):
+        if hasattr(msg, 'content') and msg.content:
+            content_str = content_to_text(msg.content).strip()
+            
+            # Check if this is a substantial response (not just a tool call)
+            if len(content_str) > 50:
+                return content_str
+    return None
+
+
+def run_scenario(scenario_id: int, verbose: bool = True, use_cache: bool = True):
     """
     Run a specific scenario through the multi-agent system.
     
+    Synchronous wrapper around run_scenario_async (must not be called from
+    a running event loop).
+    
     Args:
         scenario_id: Scenario ID (1-6)
         verbose: If True, print detailed progress
+        use_cache: If False, ignore the cached result and re-run the scenario
         
     Returns:
         Final state after scenario execution
     """
-    # Load the scenario
+    _flush_output()
+    try:
+        return asyncio.run(run_scenario_async(scenario_id, verbose=verbose, use_cache=use_cache))
+    finally:
+        _flush_output()
+
+
+@cached_scenario(summarize=extract_summary)
+async def run_scenario_async(scenario_id: int, verbose: bool = True):
+    """
+    Run a specific scenario through the multi-agent system, asynchronously.
+    
+    The graph is driven with astream, so the parallel agent branches overlap
+    their LLM round-trips on the event loop instead of blocking threads.
+    In verbose mode LLM output is printed token by token as it is generated.
+    
+    Results are cached on disk per scenario data and model (see
+    utils.scenario_cache); pass use_cache=False to force a fresh run.
+    
+    Args:
+        scenario_id: Scenario ID (1-6)
+        verbose: If True, print detailed progress
+        use_cache: If False, ignore the cached result and re-run the scenario
+        
+    Returns:
+        Final state after scenario execution
+    """
+    # Load the scenario (picking up data files added or removed since the last run)
+    clear_caches()
     scenario = load_scenario(scenario_id)
     if not scenario:
-        print(f"Failed to load scenario {scenario_id}")
+        logger.info(f"Failed to load scenario {scenario_id}")
         return None
     
+    # Parse the data files in the background while the graph is built
+    warm_scenario(scenario['scenario_dir'])
+    
     if verbose:
         # Show model information
         model_info = get_model_info()
         
-        print("\n" + "="*70)
-        print(f"RUNNING SCENARIO {scenario_id}")
-        print("="*70)
-        print(f"Model: {model_info['provider'].upper()} - {model_info['model']}")
-        print("="*70)
+        logger.info("\n" + "="*70)
+        logger.info(f"RUNNING SCENARIO {scenario_id}")
+        logger.info("="*70)
+        logger.info(f"Model: {model_info['provider'].upper()} - {model_info['model']}")
+        logger.info("="*70)
         if scenario['summary']:
-            print(scenario['summary'])
-        print("\n" + "-"*70)
-        print("TRIGGER EVENT")
-        print("-"*70)
-        print(scenario['message'])
-        print("\n" + "="*70)
-        print("AGENT EXECUTION")
-        print("="*70 + "\n")
+            logger.info(scenario['summary'])
+        logger.info("\n" + "-"*70)
+        logger.info("TRIGGER EVENT")
+        logger.info("-"*70)
+        logger.info(scenario['message'])
+        logger.info("\n" + "="*70)
+        logger.info("AGENT EXECUTION")
+        logger.info("="*70 + "\n")
+    
+    from langchain_core.messages import AIMessageChunk
+    from config.llm_factory import cached_user_message
+    from config.request_cache import request_cache
+    from orchestrator import create_logistics_graph, message_text
     
     # Create the graph
     graph = create_logistics_graph()
     
+    # Repeat-request dedup only applies within a single scenario run
+    request_cache.clear()
+    
     # Create initial state with the trigger message
     initial_state = {
-        "messages": [HumanMessage(content=scenario['message'])]
+        "messages": [cached_user_message(scenario['message'])]
     }
     
     # Run the graph
     final_state = None
-    all_messages = []
+    # Latest message per step for the fallback display; bounded, stringified only if shown
+    all_messages = deque(maxlen=200)
     
     try:
-        for step_num, state in enumerate(graph.stream(initial_state), 1):
+        step_num = 0
+        printer = _TokenPrinter()
+        # "messages" yields LLM tokens as they are generated (subgraphs=True includes
+        # those from inside the agents); "updates" yields each node's output once it completes
+        stream = graph.astream(initial_state, stream_mode=["updates", "messages"], subgraphs=True)
+        async for namespace, mode, payload in stream:
+            if mode == "updates" and namespace:
+                continue  # steps inside an agent/supervisor subgraph
+            if mode == "messages":
+                if verbose:
+                    chunk, metadata = payload
+                    text = message_text(chunk) if isinstance(chunk, AIMessageChunk) else ""
+                    if text:
+                        # Top-level node that produced the token (agents run nested graphs)
+                        node = metadata.get("langgraph_checkpoint_ns", "").split(":", 1)[0] or metadata.get("langgraph_node")
+                        printer.token(node, text)
+                continue
+            
+            state = payload
+            step_num += 1
+            # An agent that raised replies "[ERROR] ..." and the run goes on; don't cache its result
+            if has_agent_error(state):
+                mark_run_failed()
             if verbose:
                 # Print progress indicator with more detail
-                node_name = list(state.keys())[0] if state else "unknown"
-                print(f"\n[Step {step_num}] Processing node: {node_name}")
+                node_name = next(iter(state), "unknown")
+                printer.node_done(node_name)
+                logger.info(f"\n\n[Step {step_num}] Completed node: {node_name}")
+                printer.flush_next()
                 
-                # Show what messages were added in this step
+                # Collect the messages added in this step for the fallback display
                 if state and node_name in state:
                     node_state = state[node_name]
                     if "messages" in node_state:
@@ -154,83 +259,127 @@ def run_scenario(scenario_id: int, verbose: bool = True):
                         if messages:
                             latest_msg = messages[-1]
                             if hasattr(latest_msg, 'content') and latest_msg.content:
-                                # Handle both string and list content (Gemini returns list)
-                                content = latest_msg.content
-                                if isinstance(content, list):
-                                    # Extract text from list format (Gemini)
-                                    content = ' '.join([str(item) if isinstance(item, str) else item.get('text', '') 
-                                                       for item in content if item])
-                                
-                                # Show first 200 chars of the message
-                                content_str = str(content)
-                                content_preview = content_str[:200]
-                                if len(content_str) > 200:
-                                    content_preview += "..."
-                                print(f"  Message: {content_preview}")
-                                
-                                # Collect all messages for final display
-                                all_messages.append({
-                                    'step': step_num,
-                                    'node': node_name,
-                                    'content': content_str
-                                })
+                                all_messages.append((step_num, node_name, latest_msg))
             
             final_state = state
         
         if verbose and final_state:
-            print("\n" + "="*70)
-            print("FINAL SUMMARY")
-            print("="*70 + "\n")
+            logger.info("\n" + "="*70)
+            logger.info("FINAL SUMMARY")
+            logger.info("="*70 + "\n")
             
             # langgraph-supervisor stores final state differently
             # Try multiple extraction methods
             summary_found = False
             
             # Method 1: Check the last state's messages
-            if final_state:
-                last_key = list(final_state.keys())[-1]
-                if "messages" in final_state[last_key]:
-                    messages = final_state[last_key]["messages"]
-                    # Find the last AI message from supervisor
-                    for msg in reversed(messages):
-                        if hasattr(msg, 'content') and msg.content:
-                            # Handle both string and list content (Gemini returns list)
-                            content = msg.content
-                            if isinstance(content, list):
-                                # Extract text from list format (Gemini)
-                                content = ' '.join([str(item) if isinstance(item, str) else item.get('text', '') 
-                                                   for item in content if item])
-                            content_str = str(content).strip()
-                            
-                            # Check if this is a substantial response (not just a tool call)
-                            if len(content_str) > 50:
-                                print(content_str)
-                                summary_found = True
-                                break
+            summary = extract_summary(final_state)
+            if summary:
+                logger.info(summary)
+                summary_found = True
             
             # Method 2: If nothing found, show all collected messages
             if not summary_found and all_messages:
-                print("=== AGENT INTERACTIONS ===\n")
-                for msg_info in all_messages:
-                    print(f"\n[{msg_info['step']}] {msg_info['node']}:")
-                    print("-" * 70)
-                    print(msg_info['content'])
-                    print()
+                logger.info("=== AGENT INTERACTIONS ===\n")
+                for step, node, msg in all_messages:
+                    logger.info(f"\n[{step}] {node}:")
+                    logger.info("-" * 70)
+                    # Tool-call-only content has no text; show it as JSON instead
+                    logger.info(content_to_text(msg.content) or content_to_str(msg.content))
+                    logger.info("")
             
             if not summary_found and not all_messages:
-                print("[No summary generated - check if supervisor completed successfully]")
+                logger.info("[No summary generated - check if supervisor completed successfully]")
             
-            print("\n" + "="*70 + "\n")
+            logger.info("\n" + "="*70 + "\n")
     
     except Exception as e:
-        print(f"\n[ERROR] Error during scenario execution: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.error(f"\n[ERROR] Error during scenario execution: {e}", exc_info=True)
         return None
     
     return final_state
 
 
+def run_scenarios_batch(scenario_ids, max_concurrency: int = 3, use_cache: bool = True):
+    """
+    Run several scenarios concurrently and print their summaries.
+    
+    Scenario runs are multi-turn tool-calling loops, so they run concurrently
+    through BatchProcessor (semaphore + rate limiter).
+    
+    Args:
+        scenario_ids: Scenario IDs (1-6) to run
+        max_concurrency: Maximum number of scenarios running at once
+        use_cache: If False, ignore cached results and re-run every scenario
+        
+    Returns:
+        Dictionary mapping scenario ID to its final state (None if it failed)
+    """
+    from agents import BatchProcessor
+    
+    processor = BatchProcessor(max_concurrency=max_concurrency)
+    
+    async def run_one(scenario_id):
+        return await run_scenario_async(scenario_id, verbose=False, use_cache=use_cache)
+    
+    logger.info(f"\nRunning {len(scenario_ids)} scenarios (up to {max_concurrency} at a time)...")
+    results = asyncio.run(processor.map(run_one, scenario_ids))
+    
+    final_states = {}
+    for scenario_id, result in zip(scenario_ids, results):
+        logger.info("\n" + "="*70)
+        logger.info(f"SCENARIO {scenario_id} - FINAL SUMMARY")
+        logger.info("="*70 + "\n")
+        if isinstance(result, Exception):
+            logger.info(f"[ERROR] Scenario {scenario_id} failed: {result}")
+            result = None
+        else:
+            logger.info(extract_summary(result) or "[No summary generated]")
+        final_states[scenario_id] = result
+    logger.info("\n" + "="*70 + "\n")
+    
+    return final_states
+
+
+VIZ_CACHE_DIR = PROJECT_ROOT / ".viz_cache"
+
+
+def render_graph_png(graph) -> bytes:
+    """
+    Render a compiled graph to PNG, caching the image per graph topology.
+    
+    Rendering goes through the mermaid.ink web service, so the image is stored
+    under .viz_cache/ keyed by a hash of the Mermaid source (nodes and edges)
+    and reused until the topology changes. If the web service fails, the graph
+    is rendered locally with pyppeteer when it is installed.
+    
+    Args:
+        graph: Compiled LangGraph graph
+        
+    Returns:
+        PNG image bytes
+    """
+    from langchain_core.runnables.graph import MermaidDrawMethod
+    
+    drawable = graph.get_graph()
+    topo_hash = hashlib.sha256(drawable.draw_mermaid().encode("utf-8")).hexdigest()
+    cache_path = VIZ_CACHE_DIR / f"{topo_hash}.png"
+    if cache_path.exists():
+        return cache_path.read_bytes()
+    
+    try:
+        png_data = drawable.draw_mermaid_png()
+    except Exception as e:
+        try:
+            png_data = drawable.draw_mermaid_png(draw_method=MermaidDrawMethod.PYPPETEER)
+        except ImportError:
+            raise e
+    
+    VIZ_CACHE_DIR.mkdir(exist_ok=True)
+    cache_path.write_bytes(png_data)
+    return png_data
+
+
 def visualize_graph(output_path: str = "logistics_graph.png"):
     """
     Generate a visualization of the multi-agent graph.
@@ -239,34 +388,41 @@ def visualize_graph(output_path: str = "logistics_graph.png"):
         output_path: Path to save the visualization
     """
     try:
+        from orchestrator import create_logistics_graph
+        
         graph = create_logistics_graph()
-        png_data = graph.get_graph().draw_mermaid_png()
+        png_data = render_graph_png(graph)
         
         with open(output_path, "wb") as f:
             f.write(png_data)
         
-        print(f"[OK] Graph visualization saved to {output_path}")
+        logger.info(f"[OK] Graph visualization saved to {output_path}")
         
     except Exception as e:
-        print(f"Error generating visualization: {e}")
+        logger.info(f"Error generating visualization: {e}")
 
 
-def interactive_mode():
+def interactive_mode(use_cache: bool = True):
     """
     Interactive mode for running scenarios.
+    
+    Args:
+        use_cache: If False, always re-run scenarios instead of using cached results
     """
-    print("\n" + "="*70)
-    print("LOGISTICS MULTI-AGENT SYSTEM - INTERACTIVE MODE")
-    print("="*70 + "\n")
+    logger.info("\n" + "="*70)
+    logger.info("LOGISTICS MULTI-AGENT SYSTEM - INTERACTIVE MODE")
+    logger.info("="*70 + "\n")
     
+    _flush_output()
     list_available_scenarios()
     
     while True:
-        print("\n" + "-"*70)
+        logger.info("\n" + "-"*70)
+        _flush_output()
         choice = input("\nEnter scenario ID (1-6), 'list' to see scenarios, or 'quit' to exit: ").strip().lower()
         
         if choice == 'quit':
-            print("Exiting...")
+            logger.info("Exiting...")
             break
         
         if choice == 'list':
@@ -276,82 +432,103 @@ def interactive_mode():
         try:
             scenario_id = int(choice)
             if scenario_id < 1 or scenario_id > 6:
-                print("Invalid scenario ID. Please enter a number between 1 and 6.")
+                logger.info("Invalid scenario ID. Please enter a number between 1 and 6.")
                 continue
             
-            run_scenario(scenario_id, verbose=True)
+            run_scenario(scenario_id, verbose=True, use_cache=use_cache)
             
         except ValueError:
-            print("Invalid input. Please enter a number, 'list', or 'quit'.")
+            logger.info("Invalid input. Please enter a number, 'list', or 'quit'.")
 
 
 def main():
     """
     Main entry point.
     """
-    import sys
-    
     # Check for API key based on model provider
     model_info = get_model_info()
     
     if not model_info['api_key_set']:
-        print(f"[ERROR] API key not set for {model_info['provider'].upper()}")
-        print(f"\nCurrent model provider: {model_info['provider']}")
-        print(f"Current model: {model_info['model']}")
-        print("\nPlease set the appropriate API key:")
+        logger.info(f"[ERROR] API key not set for {model_info['provider'].upper()}")
+        logger.info(f"\nCurrent model provider: {model_info['provider']}")
+        logger.info(f"Current model: {model_info['model']}")
+        logger.info("\nPlease set the appropriate API key:")
         
         if MODEL_PROVIDER == "claude":
-            print("  Windows: set ANTHROPIC_API_KEY=your-key-here")
-            print("  Linux/Mac: export ANTHROPIC_API_KEY=your-key-here")
-            print("  Or add to .streamlit/secrets.toml: ANTHROPIC_API_KEY = \"your-key-here\"")
+            logger.info("  Windows: set ANTHROPIC_API_KEY=your-key-here")
+            logger.info("  Linux/Mac: export ANTHROPIC_API_KEY=your-key-here")
+            logger.info("  Or add to .streamlit/secrets.toml: ANTHROPIC_API_KEY = \"your-key-here\"")
         elif MODEL_PROVIDER == "gemini":
-            print("  Windows: set GOOGLE_API_KEY=your-key-here")
-            print("  Linux/Mac: export GOOGLE_API_KEY=your-key-here")
-            print("  Or add to .streamlit/secrets.toml: GOOGLE_API_KEY = \"your-key-here\"")
+            logger.info("  Windows: set GOOGLE_API_KEY=your-key-here")
+            logger.info("  Linux/Mac: export GOOGLE_API_KEY=your-key-here")
+            logger.info("  Or add to .streamlit/secrets.toml: GOOGLE_API_KEY = \"your-key-here\"")
         elif MODEL_PROVIDER == "openai":
-            print("  Windows: set OPENAI_API_KEY=your-key-here")
-            print("  Linux/Mac: export OPENAI_API_KEY=your-key-here")
-            print("  Or add to .streamlit/secrets.toml: OPENAI_API_KEY = \"your-key-here\"")
+            logger.info("  Windows: set OPENAI_API_KEY=your-key-here")
+            logger.info("  Linux/Mac: export OPENAI_API_KEY=your-key-here")
+            logger.info("  Or add to .streamlit/secrets.toml: OPENAI_API_KEY = \"your-key-here\"")
+        elif MODEL_PROVIDER == "bedrock":
+            logger.info("  Configure AWS credentials (AWS_ACCESS_KEY_ID/AWS_SECRET_ACCESS_KEY or AWS_PROFILE)")
+            logger.info("  Optionally set BEDROCK_REGION (default: us-east-2)")
         
-        print("\nTo switch model provider, set MODEL_PROVIDER environment variable:")
-        print("  For Claude: set MODEL_PROVIDER=claude")
-        print("  For Gemini: set MODEL_PROVIDER=gemini")
-        print("  For OpenAI (GPT): set MODEL_PROVIDER=openai")
+        logger.info("\nTo switch model provider, set MODEL_PROVIDER environment variable:")
+        logger.info("  For Claude: set MODEL_PROVIDER=claude")
+        logger.info("  For Gemini: set MODEL_PROVIDER=gemini")
+        logger.info("  For OpenAI (GPT): set MODEL_PROVIDER=openai")
+        logger.info("  For Claude on AWS Bedrock: set MODEL_PROVIDER=bedrock")
         
         sys.exit(1)
     
     # Display current model configuration
-    print(f"\n[INFO] Using {model_info['provider'].upper()} model: {model_info['model']}\n")
+    logger.info(f"\n[INFO] Using {model_info['provider'].upper()} model: {model_info['model']}\n")
     
     # Parse command line arguments
-    if len(sys.argv) > 1:
-        command = sys.argv[1]
+    args = [arg for arg in sys.argv[1:] if arg != "--no-cache"]
+    use_cache = "--no-cache" not in sys.argv[1:]
+    
+    if args:
+        command = args[0]
         
         if command == "list":
+            _flush_output()
             list_available_scenarios()
         
         elif command == "viz" or command == "visualize":
-            output_path = sys.argv[2] if len(sys.argv) > 2 else "logistics_graph.png"
+            output_path = args[1] if len(args) > 1 else "logistics_graph.png"
             visualize_graph(output_path)
         
         elif command.isdigit():
             scenario_id = int(command)
-            run_scenario(scenario_id, verbose=True)
+            run_scenario(scenario_id, verbose=True, use_cache=use_cache)
+        
+        elif command == "batch":
+            scenario_ids = [int(arg) for arg in args[1:] if arg.isdigit()] or list(range(1, 7))
+            run_scenarios_batch(scenario_ids, use_cache=use_cache)
         
         elif command == "interactive":
-            interactive_mode()
+            interactive_mode(use_cache=use_cache)
+        
+        elif command == "parquet":
+            from tools._csv_cache import HAVE_PYARROW, write_parquet_copies
+            if not HAVE_PYARROW:
+                logger.info("pyarrow is not installed; scenario data will be read from CSV")
+            else:
+                written = write_parquet_copies(MOCK_DATA_DIR)
+                logger.info(f"Parquet copies written: {written} (under {MOCK_DATA_DIR})")
         
         else:
-            print(f"Unknown command: {command}")
-            print("\nUsage:")
-            print("  python main.py [scenario_id]    - Run specific scenario")
-            print("  python main.py list             - List all scenarios")
-            print("  python main.py interactive      - Interactive mode")
-            print("  python main.py viz [filename]   - Generate graph visualization")
+            logger.info(f"Unknown command: {command}")
+            logger.info("\nUsage:")
+            logger.info("  python main.py [scenario_id]    - Run specific scenario")
+            logger.info("  python main.py list             - List all scenarios")
+            logger.info("  python main.py batch [ids...]   - Run several scenarios concurrently (default: all)")
+            logger.info("  python main.py interactive      - Interactive mode")
+            logger.info("  python main.py viz [filename]   - Generate graph visualization")
+            logger.info("  python main.py parquet          - Pre-build Parquet copies of the scenario CSVs")
+            logger.info("\n  Add --no-cache to re-run scenarios instead of using cached results")
     
     else:
         # No arguments - run interactive mode
-        interactive_mode()
+        interactive_mode(use_cache=use_cache)
 
 
 if __name__ == "__main__":
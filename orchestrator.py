@@ -0,0 +1,348 @@
+"""
+Orchestrator graph for the Logistics Multi-Agent System
+
+A planning step picks the specialized agents a scenario needs, independent
+agents run in parallel (LangGraph ``Send`` fan-out) and a synthesis step
+merges their answers. Scenarios whose tasks depend on each other fall back
+to the sequential langgraph-supervisor coordinator.
+"""
+
+import functools
+from typing import Annotated, List, Literal, TypedDict
+
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.runnables import RunnableLambda
+from langgraph.graph import StateGraph, START, END
+from langgraph.graph.message import add_messages
+from langgraph.types import Send
+from langgraph_supervisor import create_supervisor
+from pydantic import BaseModel, Field
+
+from config import MODEL_PROVIDER, MODEL_NAME, AGENT_NAMES
+from config.llm_factory import create_llm, cached_user_message, cached_system_prompt
+from config.router import route
+from agents import (
+    build_agent,
+    route_planner_agent,
+    procurement_manager_agent,
+    inventory_manager_agent,
+    distribution_handler_agent,
+    demand_forecaster_agent,
+    cost_optimizer_agent,
+)
+
+
+ORCHESTRATOR_NAME = "Main_Orchestrator"  # No spaces for OpenAI compatibility
+
+# Kept as a single frozen constant so its bytes (and the provider's prompt-cache
+# prefix) never change between supervisor turns or runs
+SUPERVISOR_PROMPT = (
+    "You are the Main Orchestrator for a logistics multi-agent system.\n\n"
+    "ROLE:\n"
+    "You coordinate specialized agents to handle logistics scenarios including:\n"
+    "- Low inventory situations\n"
+    "- Route disruptions and traffic issues\n"
+    "- Demand spikes and forecasting\n"
+    "- Cost optimization opportunities\n"
+    "- Supplier issues and procurement\n"
+    "- Distribution delays and SLA management\n\n"
+    "AVAILABLE AGENTS:\n"
+    "- Route Planner Agent\n"
+    "- Procurement Manager Agent\n"
+    "- Inventory Manager Agent\n"
+    "- Distribution Handler Agent\n"
+    "- Demand Forecaster Agent\n"
+    "- Cost Optimizer Agent\n\n"
+    "WORKFLOW:\n"
+    "1. Analyze the trigger event and scenario data provided\n"
+    "2. Determine which specialized agents need to be called\n"
+    "3. Delegate tasks to agents ONE AT A TIME with clear instructions\n"
+    "4. Review agent responses and delegate follow-up tasks if needed\n"
+    "5. If the issue is not resolved, delegate the task to the next agent\n"
+    "6. Synthesize a final natural language summary including:\n"
+    "   - The issue that occurred\n"
+    "   - Actions taken by each agent\n"
+    "   - Overall recommendations and next steps: THIS SECTION MUST INCLUDE A FULLY DETAILED PLAN OF ACTION FOR THE NEXT STEPS\n\n"
+    "INSTRUCTIONS:\n"
+    "- When delegating, provide the agent with the scenario directory name and specific task\n"
+    "- ALL AGENTS REQUIRED TO SOLVE THE ISSUE MUST BE CALLED BEFORE YOU CAN RETURN A SUMMARY\n"
+    "- DO NOT RETURN ANY AGENT CALLS AS STEPS IN YOUR SUMMARY\n"
+    "- When solving an issue, make sure to call all the necessary agents to solve the issue\n"
+    "- Do NOT call multiple agents in parallel - delegate sequentially\n"
+    "- Wait for each agent's response before deciding on next steps\n"
+    "- The scenario directory follows the pattern: 'scenario_X_description'\n"
+    "- After all agents have completed their work, provide a comprehensive summary\n"
+    "- Your summary should be in natural language, suitable for management review\n"
+    "- When listing anything in your summary, use markdown formatting and a newline delimeter after each item and section\n"
+    "- Do NOT include raw data or tool outputs in your final summary\n"
+    "- Focus on insights, actions taken, and business impact\n\n"
+    "Remember: You are the coordinator. Do NOT perform the actual analysis yourself - "
+    "delegate to the appropriate specialized agents using the transfer tools."
+)
+
+PLANNER_PROMPT = """\
+You are the planning step of a logistics multi-agent system.
+
+Given a logistics scenario alert, decide which specialized agents must work on it
+and write one specific task for each of them.
+
+AVAILABLE AGENTS:
+- route_planner: route optimization, vehicle assignment, traffic conditions
+- procurement_manager: supplier status, purchase orders, supplier delays
+- inventory_manager: stock levels, shortage predictions, reorder points
+- distribution_handler: delivery delays, rerouting, upcoming deliveries
+- demand_forecaster: demand spikes, forecasts, historical trends
+- cost_optimizer: financial costs, ROI, cost savings
+
+INSTRUCTIONS:
+- Select every agent required to solve the issue, and only those
+- Each task must name the scenario directory (pattern: 'scenario_X_description') and say exactly what to analyze
+- Set parallel to true when every task can be done without another agent's result
+- Set parallel to false when a task needs the output of another agent first"""
+
+SYNTHESIZER_PROMPT = """\
+You are the Main Orchestrator for a logistics multi-agent system.
+
+The specialized agents have analyzed a logistics scenario. Using the scenario alert
+and their responses, write a final natural language summary including:
+- The issue that occurred
+- Actions taken by each agent
+- Overall recommendations and next steps: THIS SECTION MUST INCLUDE A FULLY DETAILED PLAN OF ACTION FOR THE NEXT STEPS
+
+INSTRUCTIONS:
+- Your summary should be in natural language, suitable for management review
+- When listing anything in your summary, use markdown formatting and a newline delimeter after each item and section
+- Do NOT include raw data or tool outputs in your final summary
+- Focus on insights, actions taken, and business impact"""
+
+
+# Focus of each agent, used to write the tasks of router-selected agents
+AGENT_FOCUS = {
+    "route_planner": "route optimization, vehicle assignment, traffic conditions",
+    "procurement_manager": "supplier status, purchase orders, supplier delays",
+    "inventory_manager": "stock levels, shortage predictions, reorder points",
+    "distribution_handler": "delivery delays, rerouting, upcoming deliveries",
+    "demand_forecaster": "demand spikes, forecasts, historical trends",
+    "cost_optimizer": "financial costs, ROI, cost savings",
+}
+
+
+class AgentTask(BaseModel):
+    """A task delegated to one specialized agent."""
+    agent: Literal[tuple(AGENT_NAMES)] = Field(description="Name of the agent")
+    task: str = Field(description="Specific instructions for the agent, including the scenario directory")
+
+
+class ScenarioPlan(BaseModel):
+    """Agents to consult for a scenario."""
+    parallel: bool = Field(description="True if all tasks are independent and can run at the same time")
+    tasks: List[AgentTask] = Field(description="One task per agent to consult")
+
+
+class OrchestratorState(TypedDict, total=False):
+    """Graph state; the messages reducer merges updates from parallel agent branches."""
+    messages: Annotated[list, add_messages]
+    plan: dict
+
+
+class AgentTaskState(TypedDict):
+    """Input sent to a single agent branch."""
+    scenario: str
+    task: str
+
+
+def message_text(message) -> str:
+    """Return the text of a message whose content may be a string or content blocks."""
+    content = message.content
+    if isinstance(content, str):
+        return content
+    return "".join(
+        item if isinstance(item, str) else item.get("text", "")
+        for item in content
+        if isinstance(item, str) or item.get("type") == "text"
+    )
+
+
+def _routed_plan(state: OrchestratorState):
+    """Plan known scenario types with the lexical router (no LLM call); None if it is not confident."""
+    agents = route(message_text(state["messages"][0]))
+    if not agents:
+        return None
+    tasks = [
+        AgentTask(
+            agent=agent,
+            task=f"Analyze the scenario above from the {agent} perspective ({AGENT_FOCUS[agent]}) "
+                 "using the scenario directory named in the alert, and recommend specific actions.",
+        )
+        for agent in agents
+    ]
+    return {"plan": ScenarioPlan(parallel=True, tasks=tasks).model_dump()}
+
+
+def _plan(state: OrchestratorState, temperature: float = 0) -> dict:
+    """
+    Decide which agents to consult and whether their tasks are independent.
+    
+    Known scenario types are routed without an LLM call; anything else is
+    planned by the fast model tier (a classification over six agents).
+    """
+    routed = _routed_plan(state)
+    if routed is not None:
+        return routed
+    planner = create_llm(temperature=temperature, tier="fast").with_structured_output(ScenarioPlan)
+    plan = planner.invoke([cached_system_prompt(PLANNER_PROMPT), *state["messages"]])
+    return {"plan": plan.model_dump()}
+
+
+async def _aplan(state: OrchestratorState, temperature: float = 0) -> dict:
+    """Async version of _plan."""
+    routed = _routed_plan(state)
+    if routed is not None:
+        return routed
+    planner = create_llm(temperature=temperature, tier="fast").with_structured_output(ScenarioPlan)
+    plan = await planner.ainvoke([cached_system_prompt(PLANNER_PROMPT), *state["messages"]])
+    return {"plan": plan.model_dump()}
+
+
+def _dispatch(state: OrchestratorState):
+    """Fan out independent tasks to their agents, or hand dependent ones to the supervisor."""
+    plan = state.get("plan") or {}
+    tasks = plan.get("tasks") or []
+    if not plan.get("parallel") or not tasks:
+        return "supervisor"
+    
+    scenario = message_text(state["messages"][0])
+    return [Send(task["agent"], {"scenario": scenario, "task": task["task"]}) for task in tasks]
+
+
+def _agent_input(state: AgentTaskState) -> dict:
+    """Build an agent's input: the (cached) scenario message followed by its task."""
+    return {"messages": [cached_user_message(state["scenario"]), HumanMessage(content=state["task"])]}
+
+
+def _agent_reply(name: str, output: dict) -> dict:
+    """Reduce an agent's output to its final answer, tagged with the agent name."""
+    content = next(
+        (message_text(msg) for msg in reversed(output["messages"]) if isinstance(msg, AIMessage) and msg.content),
+        "",
+    )
+    return {"messages": [AIMessage(content=content, name=name)]}
+
+
+def _make_agent_node(name: str):
+    """Build the graph node (sync and async) that runs one specialized agent on its task."""
+    def run_agent(state: AgentTaskState) -> dict:
+        try:
+            return _agent_reply(name, build_agent(name).invoke(_agent_input(state)))
+        except Exception as e:
+            return {"messages": [AIMessage(content=f"[ERROR] {name} failed: {e}", name=name)]}
+    
+    async def arun_agent(state: AgentTaskState) -> dict:
+        try:
+            return _agent_reply(name, await build_agent(name).ainvoke(_agent_input(state)))
+        except Exception as e:
+            return {"messages": [AIMessage(content=f"[ERROR] {name} failed: {e}", name=name)]}
+    
+    return RunnableLambda(run_agent, afunc=arun_agent, name=name)
+
+
+def _synthesis_messages(state: OrchestratorState) -> list:
+    """Build the synthesis prompt from the scenario and the agents' responses."""
+    scenario, *responses = state["messages"]
+    report = "\n\n".join(f"## {msg.name}\n{message_text(msg)}" for msg in responses)
+    return [
+        cached_system_prompt(SYNTHESIZER_PROMPT),
+        scenario,
+        HumanMessage(content=f"AGENT RESPONSES:\n\n{report}"),
+    ]
+
+
+def _synthesize(state: OrchestratorState, temperature: float = 0) -> dict:
+    """Merge the agents' responses into the final summary."""
+    summary = create_llm(temperature=temperature).invoke(_synthesis_messages(state))
+    return {"messages": [AIMessage(content=summary.content, name=ORCHESTRATOR_NAME)]}
+
+
+async def _asynthesize(state: OrchestratorState, temperature: float = 0) -> dict:
+    """Async version of _synthesize."""
+    summary = await create_llm(temperature=temperature).ainvoke(_synthesis_messages(state))
+    return {"messages": [AIMessage(content=summary.content, name=ORCHESTRATOR_NAME)]}
+
+
+def create_logistics_graph(temperature: float = 0):
+    """
+    Create the complete multi-agent logistics graph.
+    
+    A planning step selects the agents for the scenario. Independent tasks
+    run in parallel, one branch per agent, and a synthesis step merges the
+    results; dependent tasks go to the sequential supervisor instead.
+    
+    The compiled graph is memoized per provider, model and temperature, so
+    repeated scenario runs reuse it instead of recompiling.
+    
+    Args:
+        temperature: Temperature for the orchestrator LLM calls
+        
+    Returns:
+        Compiled orchestrator graph ready for execution
+    """
+    return _build_graph(MODEL_PROVIDER, MODEL_NAME, float(temperature))
+
+
+@functools.lru_cache(maxsize=4)
+def _build_graph(provider: str, model: str, temperature: float):
+    """Compile the orchestrator graph; see create_logistics_graph."""
+    builder = StateGraph(OrchestratorState)
+    builder.add_node("plan", RunnableLambda(
+        functools.partial(_plan, temperature=temperature),
+        afunc=functools.partial(_aplan, temperature=temperature),
+    ))
+    for name in AGENT_NAMES.values():
+        builder.add_node(name, _make_agent_node(name))
+        builder.add_edge(name, "synthesize")
+    builder.add_node("synthesize", RunnableLambda(
+        functools.partial(_synthesize, temperature=temperature),
+        afunc=functools.partial(_asynthesize, temperature=temperature),
+    ))
+    builder.add_node("supervisor", create_supervisor_graph(temperature))
+    
+    builder.add_edge(START, "plan")
+    builder.add_conditional_edges("plan", _dispatch, [*AGENT_NAMES.values(), "supervisor"])
+    builder.add_edge("synthesize", END)
+    builder.add_edge("supervisor", END)
+    
+    return builder.compile()
+
+
+def create_supervisor_graph(temperature: float = 0):
+    """
+    Create the sequential multi-agent graph using langgraph-supervisor.
+    
+    Used when the scenario's tasks depend on each other's results.
+    
+    Args:
+        temperature: Temperature for the supervisor LLM
+        
+    Returns:
+        Compiled supervisor graph ready for execution
+    """
+    llm = create_llm(temperature=temperature)
+    
+    # Create supervisor using the prebuilt langgraph-supervisor package
+    supervisor = create_supervisor(
+        model=llm,
+        agents=[
+            route_planner_agent,
+            procurement_manager_agent,
+            inventory_manager_agent,
+            distribution_handler_agent,
+            demand_forecaster_agent,
+            cost_optimizer_agent,
+        ],
+        prompt=cached_system_prompt(SUPERVISOR_PROMPT),
+        add_handoff_back_messages=True,
+        supervisor_name=ORCHESTRATOR_NAME,
+        output_mode="full_history",
+    ).compile()
+    
+    return supervisor
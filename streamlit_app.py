@@ -7,28 +7,23 @@ This application provides a visual interface for:
 """
 
 import os
-import streamlit as st
+import threading
+import time
+import traceback
 from pathlib import Path
+from types import SimpleNamespace
+
 import pandas as pd
-from io import StringIO
-import sys
-from contextlib import contextmanager
-
-from langchain_anthropic import ChatAnthropic
-from langchain_core.messages import HumanMessage
-from langgraph_supervisor import create_supervisor
-
-from config import MODEL_NAME, MOCK_DATA_DIR
-from agents import (
-    route_planner_agent,
-    procurement_manager_agent,
-    inventory_manager_agent,
-    distribution_handler_agent,
-    demand_forecaster_agent,
-    cost_optimizer_agent,
-)
-from utils import load_scenario, list_available_scenarios
-from main import create_logistics_graph
+import streamlit as st
+
+from config import MOCK_DATA_DIR
+from tools import warm_scenario
+from utils import load_scenario, clear_caches, content_to_str
+from utils.aimd_limiter import get_limiter
+
+# Minimum seconds between UI refreshes while a scenario streams (each refresh
+# is a message to the browser; tokens and steps in between are coalesced)
+UI_UPDATE_INTERVAL = 0.1
 
 
 # Page configuration
@@ -39,72 +34,131 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for better UI
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        font-weight: bold;
-        color: #1f77b4;
-        text-align: center;
-        padding: 1rem 0;
-        border-bottom: 3px solid #1f77b4;
-        margin-bottom: 2rem;
-    }
-    .scenario-card {
-        background-color: #f0f2f6;
-        padding: 1.5rem;
-        border-radius: 10px;
-        border-left: 5px solid #1f77b4;
-        margin: 1rem 0;
-    }
-    .agent-status {
-        background-color: #e8f4f8;
-        padding: 1rem;
-        border-radius: 5px;
-        border-left: 4px solid #4CAF50;
-        margin: 0.5rem 0;
-        font-weight: bold;
-    }
-    .output-box {
-        background-color: #ffffff;
-        padding: 1.5rem;
-        border-radius: 10px;
-        border: 2px solid #ddd;
-        margin: 1rem 0;
-        max-height: 600px;
-        overflow-y: auto;
-    }
-    .metric-card {
-        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white;
-        padding: 1rem;
-        border-radius: 10px;
-        text-align: center;
-    }
-    .stButton>button {
-        width: 100%;
-        background-color: #1f77b4;
-        color: white;
-        font-weight: bold;
-        padding: 0.75rem;
-        border-radius: 5px;
-    }
-    .stButton>button:hover {
-        background-color: #155a8a;
-    }
-</style>
-""", unsafe_allow_html=True)
+# Custom CSS for better UI (read once, cached across reruns)
+@st.cache_data
+def load_css() -> str:
+    """Load the app stylesheet from static/app.css"""
+    return (Path(__file__).parent / "static" / "app.css").read_text(encoding="utf-8")
+
+
+st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
+
+
+# Scenario card markup (System Visualization overview / Scenario Runner details)
+SCENARIO_CARD_TMPL = (
+    '<div class="scenario-card">'
+    '<h4>Scenario {sid}: {name}</h4>'
+    '<p><strong>Severity:</strong> {severity} | '
+    '<strong>Complexity:</strong> {complexity}</p>'
+    '<p><strong>Primary Agents:</strong> {agents}</p>'
+    '<p><strong>Key Metrics:</strong> {metrics}</p>'
+    '</div>'
+)
+SCENARIO_DETAILS_TMPL = (
+    '<div class="scenario-card">'
+    '<h4>{name}</h4>'
+    '<p><strong>Complexity:</strong> {complexity} | '
+    '<strong>Severity:</strong> {severity} | '
+    '<strong>Trigger:</strong> {trigger}</p>'
+    '<p><strong>Primary Agents:</strong> {agents}</p>'
+    '<p><strong>Key Metrics:</strong> {metrics}</p>'
+    '</div>'
+)
 
+AGENTS_INFO = [
+    ("Route Planner", "🗺️", "Optimizes delivery routes and handles traffic disruptions"),
+    ("Procurement Manager", "📦", "Manages supplier relationships and purchase orders"),
+    ("Inventory Manager", "📊", "Monitors stock levels and reorder points"),
+    ("Distribution Handler", "🚛", "Coordinates deliveries and manages SLAs"),
+    ("Demand Forecaster", "📈", "Predicts demand spikes and trends"),
+    ("Cost Optimizer", "💰", "Identifies cost-saving opportunities"),
+]
 
+WORKFLOW_STEPS = [
+    ("1️⃣", "Trigger Event", "Scenario event occurs"),
+    ("2️⃣", "Orchestrator", "Analyzes situation"),
+    ("3️⃣", "Agent Delegation", "Routes to specialists"),
+    ("4️⃣", "Agent Processing", "Agents analyze & act"),
+    ("5️⃣", "Final Summary", "Consolidated results"),
+]
+
+
+@st.cache_data
+def render_agents_html() -> str:
+    """Render the agent descriptions as collapsible HTML sections (no widgets)"""
+    return "".join(
+        f'<details class="agent-info"><summary>{emoji} {name}</summary><p>{desc}</p></details>'
+        for name, emoji, desc in AGENTS_INFO
+    )
+
+
+@st.cache_data
+def render_workflow_html() -> str:
+    """Render the static workflow step cards as one HTML row"""
+    cards = "".join(
+        f'<div class="metric-card">'
+        f'<div style="font-size: 2rem;">{num}</div>'
+        f'<div style="font-weight: bold; margin: 0.5rem 0;">{title}</div>'
+        f'<div style="font-size: 0.9rem;">{desc}</div>'
+        f'</div>'
+        for num, title, desc in WORKFLOW_STEPS
+    )
+    return f'<div class="workflow-row">{cards}</div>'
+
+
+@st.cache_data(max_entries=32)
+def md_to_html(text: str) -> str:
+    """Convert a summary from markdown to HTML (cached by content, so reruns skip the parse)"""
+    import markdown
+    return markdown.markdown(text, extensions=['extra', 'nl2br', 'sane_lists'])
+
+
+@st.cache_data(ttl=3600)
 def load_scenario_index():
-    """Load scenario index from CSV"""
+    """Load scenario index from CSV (parsed once, reused across reruns)"""
     index_path = MOCK_DATA_DIR / "scenario_index.csv"
     if index_path.exists():
         return pd.read_csv(index_path)
     return None
 
 
+@st.cache_resource
+def _deps():
+    """Import the LLM/graph stack once per process, only when a scenario is run"""
+    from langchain_core.messages import AIMessageChunk
+    from config.llm_factory import cached_user_message
+    from orchestrator import create_logistics_graph, ORCHESTRATOR_NAME
+    
+    return SimpleNamespace(
+        AIMessageChunk=AIMessageChunk,
+        cached_user_message=cached_user_message,
+        create_logistics_graph=create_logistics_graph,
+        ORCHESTRATOR_NAME=ORCHESTRATOR_NAME,
+    )
+
+
+@st.cache_resource
+def _graph_prewarm():
+    """Start compiling the logistics graph in the background (once per process)"""
+    def build():
+        try:
+            from orchestrator import create_logistics_graph
+            create_logistics_graph()  # memoized, so get_logistics_graph reuses it
+        except Exception:
+            pass  # get_logistics_graph reports the error when a run starts
+    
+    thread = threading.Thread(target=build, daemon=True)
+    thread.start()
+    return thread
+
+
+@st.cache_resource
+def get_logistics_graph():
+    """Compile the logistics graph once and reuse it across reruns and sessions"""
+    _graph_prewarm().join()
+    return _deps().create_logistics_graph()
+
+
 def check_api_key():
     """Check if API key is set"""
     # Check st.secrets first, then fall back to environment
@@ -209,127 +263,89 @@ else:
     st.sidebar.error("❌ API Key Missing")
     st.sidebar.info("Please set ANTHROPIC_API_KEY in .streamlit/secrets.toml")
 
+# Adaptive LLM concurrency (grows while calls are healthy, backs off on errors)
+limiter_status = get_limiter().status()
+st.sidebar.caption(
+    f"LLM concurrency: {limiter_status['in_flight']} in flight / {limiter_status['limit']} slots"
+)
 
-# ============================================================================
-# PAGE 1: SYSTEM VISUALIZATION
-# ============================================================================
-if page == "System Visualization":
-    st.markdown('<div class="main-header">🔍 System Visualization</div>', unsafe_allow_html=True)
-    
-    st.markdown("""
-    This page provides an overview of the multi-agent logistics system architecture,
-    showing how different specialized agents work together to handle logistics scenarios.
-    """)
-    
-    # System Overview
-    col1, col2 = st.columns([2, 1])
+
+def render_scenario_details(trigger_event: dict):
+    """Render the collapsed trigger event details of a scenario."""
+    with st.expander("📄 Scenario Details", expanded=False):
+        st.markdown(f"**Event Type:** {trigger_event.get('event_type', 'N/A')}")
+        st.markdown(f"**Severity:** {trigger_event.get('severity', 'N/A')}")
+        st.markdown(f"**Description:**")
+        st.text(trigger_event.get('description', 'N/A'))
+
+
+def render_run_results(run: dict, log_placeholder, final_output):
+    """
+    Render the execution log and final summary card of a completed run.
     
-    with col1:
-        st.subheader("📊 System Architecture")
-        
-        # Check if graph visualization exists
-        graph_path = Path("logistics_graph.png")
-        if graph_path.exists():
-            st.image(str(graph_path), caption="Multi-Agent System Graph", use_container_width=True)
-        else:
-            st.info("Graph visualization not available. Generate it using: `python main.py viz`")
-            
-            if st.button("🎨 Generate Graph Visualization", key="gen_graph"):
-                with st.spinner("Generating graph visualization..."):
-                    try:
-                        from main import visualize_graph
-                        visualize_graph()
-                        st.success("✅ Graph generated successfully!")
-                        st.rerun()
-                    except Exception as e:
-                        st.error(f"❌ Error generating graph: {e}")
+    Args:
+        run: Run results ('messages' log entries and 'summary' text)
+        log_placeholder: Placeholder for the execution log expander
+        final_output: Placeholder for the final output card
+    """
+    # Show step-by-step execution log first
+    with log_placeholder.container():
+        with st.expander("🔍 Detailed Execution Log", expanded=False):
+            for msg in run['messages']:
+                st.markdown(f"**[Step {msg['step']}] {msg['node']}**")
+                st.text(msg['preview'])
+                st.markdown("---")
     
-    with col2:
-        st.subheader("🤖 Agents")
-        
-        agents_info = [
-            ("Route Planner", "🗺️", "Optimizes delivery routes and handles traffic disruptions"),
-            ("Procurement Manager", "📦", "Manages supplier relationships and purchase orders"),
-            ("Inventory Manager", "📊", "Monitors stock levels and reorder points"),
-            ("Distribution Handler", "🚛", "Coordinates deliveries and manages SLAs"),
-            ("Demand Forecaster", "📈", "Predicts demand spikes and trends"),
-            ("Cost Optimizer", "💰", "Identifies cost-saving opportunities"),
-        ]
+    # Then replace the streamed text with the final output in a styled card
+    summary = run['summary']
+    if summary:
+        # Convert markdown to HTML
+        html_content = md_to_html(summary)
         
-        for name, emoji, desc in agents_info:
-            with st.expander(f"{emoji} {name}"):
-                st.write(desc)
-    
-    # System Workflow
-    st.markdown("---")
-    st.subheader("🔄 System Workflow")
-    
-    workflow_cols = st.columns(5)
-    workflow_steps = [
-        ("1️⃣", "Trigger Event", "Scenario event occurs"),
-        ("2️⃣", "Orchestrator", "Analyzes situation"),
-        ("3️⃣", "Agent Delegation", "Routes to specialists"),
-        ("4️⃣", "Agent Processing", "Agents analyze & act"),
-        ("5️⃣", "Final Summary", "Consolidated results"),
-    ]
-    
-    for col, (num, title, desc) in zip(workflow_cols, workflow_steps):
-        with col:
-            st.markdown(f"""
-            <div class="metric-card">
-                <div style="font-size: 2rem;">{num}</div>
-                <div style="font-weight: bold; margin: 0.5rem 0;">{title}</div>
-                <div style="font-size: 0.9rem;">{desc}</div>
-            </div>
-            """, unsafe_allow_html=True)
-    
-    # Scenario Overview
-    st.markdown("---")
-    st.subheader("📋 Available Scenarios")
-    
-    scenario_df = load_scenario_index()
-    if scenario_df is not None:
-        # Display as formatted cards
-        for _, row in scenario_df.iterrows():
-            with st.container():
-                st.markdown(f"""
-                <div class="scenario-card">
-                    <h4>Scenario {row['scenario_id']}: {row['scenario_name']}</h4>
-                    <p><strong>Severity:</strong> {row['severity']} | 
-                       <strong>Complexity:</strong> {row['complexity']}</p>
-                    <p><strong>Primary Agents:</strong> {row['primary_agents']}</p>
-                    <p><strong>Key Metrics:</strong> {row['key_metrics']}</p>
-                </div>
-                """, unsafe_allow_html=True)
+        # Display in styled card
+        final_output.markdown(f"""
+        <div style="
+            background: linear-gradient(135deg, rgba(46, 134, 171, 0.08) 0%, rgba(46, 134, 171, 0.03) 100%);
+            border-left: 5px solid #2E86AB;
+            border-radius: 10px;
+            padding: 2rem;
+            margin: 1rem 0;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        ">
+            {html_content}
+        </div>
+        """, unsafe_allow_html=True)
     else:
-        st.warning("Scenario index not found")
+        final_output.warning("No final summary generated")
 
 
-# ============================================================================
-# PAGE 2: SCENARIO RUNNER
-# ============================================================================
-elif page == "Scenario Runner":
-    st.markdown('<div class="main-header">▶️ Scenario Runner</div>', unsafe_allow_html=True)
+@st.fragment
+def scenario_runner_fragment(scenario_df):
+    """
+    Scenario selection, progress and results of the Scenario Runner page.
     
-    if not check_api_key():
-        st.error("⚠️ Cannot run scenarios: ANTHROPIC_API_KEY not configured")
-        st.info("Please set your Anthropic API key in .streamlit/secrets.toml to use this feature.")
-        st.stop()
+    Runs as a fragment: widget interactions inside it (selecting a scenario,
+    pressing Run) rerun only this part of the page, not the whole script.
     
+    Args:
+        scenario_df: Scenario index DataFrame
+    """
     # ========================================================================
     # SECTION 1: SCENARIO SELECTION AND EXECUTION
     # ========================================================================
     st.subheader("1️⃣ Scenario Selection")
     
-    scenario_df = load_scenario_index()
-    
     col1, col2 = st.columns([3, 1])
     
     with col1:
         if scenario_df is not None:
             scenario_options = [
-                f"Scenario {row['scenario_id']}: {row['scenario_name']} (Severity: {row['severity']})"
-                for _, row in scenario_df.iterrows()
+                f"Scenario {sid}: {name} (Severity: {sev})"
+                for sid, name, sev in zip(
+                    scenario_df['scenario_id'].to_numpy(),
+                    scenario_df['scenario_name'].to_numpy(),
+                    scenario_df['severity'].to_numpy(),
+                )
             ]
             selected_scenario = st.selectbox(
                 "Select a scenario to run:",
@@ -351,16 +367,14 @@ elif page == "Scenario Runner":
     # Show selected scenario details
     if scenario_df is not None:
         selected_row = scenario_df.iloc[selected_scenario]
-        st.markdown(f"""
-        <div class="scenario-card">
-            <h4>{selected_row['scenario_name']}</h4>
-            <p><strong>Complexity:</strong> {selected_row['complexity']} | 
-               <strong>Severity:</strong> {selected_row['severity']} | 
-               <strong>Trigger:</strong> {selected_row['trigger_type']}</p>
-            <p><strong>Primary Agents:</strong> {selected_row['primary_agents']}</p>
-            <p><strong>Key Metrics:</strong> {selected_row['key_metrics']}</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(SCENARIO_DETAILS_TMPL.format(
+            name=selected_row['scenario_name'],
+            complexity=selected_row['complexity'],
+            severity=selected_row['severity'],
+            trigger=selected_row['trigger_type'],
+            agents=selected_row['primary_agents'],
+            metrics=selected_row['key_metrics'],
+        ), unsafe_allow_html=True)
     
     st.markdown("---")
     
@@ -387,6 +401,7 @@ elif page == "Scenario Runner":
     # ========================================================================
     # RUN SCENARIO LOGIC
     # ========================================================================
+    run_key = f"run_{scenario_id}"
     if run_button:
         with output_container:
             # Scenario details expander
@@ -396,63 +411,130 @@ elif page == "Scenario Runner":
             results_container = st.container()
         
         try:
-            # Load scenario
+            # Load scenario (picking up data files added or removed since the last run)
+            clear_caches()
             scenario = load_scenario(scenario_id)
             
             if not scenario:
                 st.error(f"Failed to load scenario {scenario_id}")
                 st.stop()
             
+            # Parse the data files in the background while the graph is built
+            warm_scenario(scenario['scenario_dir'])
+            
             # Display scenario details
             with scenario_details_container:
-                with st.expander("📄 Scenario Details", expanded=False):
-                    st.markdown(f"**Event Type:** {scenario['trigger_event'].get('event_type', 'N/A')}")
-                    st.markdown(f"**Severity:** {scenario['trigger_event'].get('severity', 'N/A')}")
-                    st.markdown(f"**Description:**")
-                    st.text(scenario['trigger_event'].get('description', 'N/A'))
+                render_scenario_details(scenario['trigger_event'])
             
             # Create and run the graph
-            graph = create_logistics_graph()
+            graph = get_logistics_graph()
             
             initial_state = {
-                "messages": [HumanMessage(content=scenario['message'])]
+                "messages": [_deps().cached_user_message(scenario['message'])]
             }
             
             all_messages = []
             step_count = 0
             total_steps = 10  # Estimate, will adjust dynamically
             
-            # Stream execution
-            for state in graph.stream(initial_state):
+            # Live token output, one placeholder per node
+            with progress_container:
+                live_output = st.container()
+            live_placeholders = {}
+            live_text = {}
+            dirty_nodes = set()
+            
+            # The summary is painted into the final output area as it is generated
+            with results_container:
+                log_placeholder = st.empty()
+                st.markdown("### 📋 Final Agent Output")
+                final_output = st.empty()
+            summary_ns = None
+            summary_text = ""
+            summary_dirty = False
+            pending_status = None
+            last_ui_update = 0.0
+            
+            def update_ui(force: bool = False):
+                """Push buffered tokens and the latest step to the page, at most every UI_UPDATE_INTERVAL"""
+                nonlocal pending_status, last_ui_update, summary_dirty
+                now = time.monotonic()
+                if not force and now - last_ui_update < UI_UPDATE_INTERVAL:
+                    return
+                last_ui_update = now
+                for node in dirty_nodes:
+                    live_placeholders[node].markdown(f"**{node}**\n\n{live_text[node]}")
+                dirty_nodes.clear()
+                if summary_dirty:
+                    final_output.markdown(summary_text)
+                    summary_dirty = False
+                if pending_status is not None:
+                    step, node_name = pending_status
+                    progress_bar.progress(min(step / total_steps, 0.95))
+                    status_box.markdown(
+                        f'<div class="agent-status">🔄 Step {step}: {node_name}</div>',
+                        unsafe_allow_html=True
+                    )
+                    pending_status = None
+            
+            # Stream execution: "messages" yields LLM tokens as they are generated
+            # (including inside the agents), "updates" each node's output
+            stream = graph.stream(initial_state, stream_mode=["updates", "messages"], subgraphs=True)
+            for namespace, mode, payload in stream:
+                if mode == "messages":
+                    chunk, metadata = payload
+                    text = chunk.text if isinstance(chunk, _deps().AIMessageChunk) else ""
+                    if text:
+                        checkpoint_ns = metadata.get("langgraph_checkpoint_ns", "")
+                        node = checkpoint_ns.split(":", 1)[0] or metadata.get("langgraph_node")
+                        # Summary tokens: the synthesis step, or the supervisor's own LLM turns
+                        path = [part.split(":", 1)[0] for part in checkpoint_ns.split("|")]
+                        if node == "synthesize" or path[:2] == ["supervisor", _deps().ORCHESTRATOR_NAME]:
+                            if checkpoint_ns != summary_ns:
+                                summary_ns, summary_text = checkpoint_ns, ""  # new turn
+                            summary_text += text
+                            summary_dirty = True
+                            update_ui()
+                            continue
+                        if node not in live_placeholders:
+                            with live_output:
+                                live_placeholders[node] = st.empty()
+                        live_text[node] = live_text.get(node, "") + text
+                        dirty_nodes.add(node)
+                        update_ui()
+                    continue
+                if namespace:
+                    continue  # steps inside an agent/supervisor subgraph
+                
+                state = payload
                 step_count += 1
                 
                 if state:
-                    node_name = list(state.keys())[0]
+                    node_name = next(iter(state))
                     
                     # Update progress
-                    progress_value = min(step_count / total_steps, 0.95)
-                    progress_bar.progress(progress_value)
-                    
-                    status_box.markdown(
-                        f'<div class="agent-status">🔄 Step {step_count}: {node_name}</div>',
-                        unsafe_allow_html=True
-                    )
+                    pending_status = (step_count, node_name)
+                    update_ui()
                     
                     # Extract message
                     node_state = state[node_name]
                     if "messages" in node_state:
                         messages = node_state["messages"]
                         if messages:
-                            latest_msg = messages[-1]
-                            if hasattr(latest_msg, 'content') and latest_msg.content:
+                            content = getattr(messages[-1], 'content', None)
+                            if content:
+                                # Only a preview is kept; content blocks (e.g. tool calls) are shown as JSON
+                                content = content_to_str(content)
                                 all_messages.append({
                                     'step': step_count,
                                     'node': node_name,
-                                    'content': latest_msg.content
+                                    'preview': content if len(content) <= 500 else content[:500] + "..."
                                 })
                 
                 final_state = state
             
+            update_ui(force=True)
+            
             # Complete progress
             progress_bar.progress(1.0)
             status_box.success("✅ Scenario execution completed!")
@@ -460,72 +542,148 @@ elif page == "Scenario Runner":
             # Extract final summary
             summary = None
             if final_state:
-                last_key = list(final_state.keys())[-1]
+                last_key = next(reversed(final_state))
                 if "messages" in final_state[last_key]:
                     messages = final_state[last_key]["messages"]
                     for msg in reversed(messages):
-                        if hasattr(msg, 'content') and msg.content:
+                        content = getattr(msg, 'content', None)
+                        if content:
                             # Parse content based on its type
                             content_str = ""
                             
-                            if isinstance(msg.content, str):
-                                content_str = msg.content
-                            elif isinstance(msg.content, list):
+                            if isinstance(content, str):
+                                content_str = content
+                            elif isinstance(content, list):
                                 # Handle list of content blocks (e.g., [{'type': 'text', 'text': '...'}])
-                                for block in msg.content:
+                                for block in content:
                                     if isinstance(block, dict) and 'text' in block:
                                         content_str += block['text']
                                     elif isinstance(block, str):
                                         content_str += block
                             else:
                                 # Fallback to string conversion
-                                content_str = str(msg.content)
+                                content_str = str(content)
                             
                             if len(content_str.strip()) > 50:
                                 summary = content_str
                                 break
             
+            # Keep the results so reruns (sidebar clicks, selecting another
+            # scenario and back) show them without running the graph again
+            last_run = {
+                'trigger_event': scenario['trigger_event'],
+                'messages': all_messages,
+                'summary': summary,
+            }
+            st.session_state[run_key] = last_run
+            
             # Display results directly
             with results_container:
-                # Show step-by-step execution log first
-                with st.expander("🔍 Detailed Execution Log", expanded=False):
-                    for msg in all_messages:
-                        st.markdown(f"**[Step {msg['step']}] {msg['node']}**")
-                        st.text(msg['content'][:500] + "..." if len(msg['content']) > 500 else msg['content'])
-                        st.markdown("---")
-                
-                # Then show final model output in a styled card
-                st.markdown("### 📋 Final Agent Output")
-                if summary:
-                    # Convert markdown to HTML and display in a styled card
-                    import markdown
-                    
-                    # Convert markdown to HTML
-                    html_content = markdown.markdown(
-                        summary,
-                        extensions=['extra', 'nl2br', 'sane_lists']
-                    )
-                    
-                    # Display in styled card
-                    st.markdown(f"""
-                    <div style="
-                        background: linear-gradient(135deg, rgba(46, 134, 171, 0.08) 0%, rgba(46, 134, 171, 0.03) 100%);
-                        border-left: 5px solid #2E86AB;
-                        border-radius: 10px;
-                        padding: 2rem;
-                        margin: 1rem 0;
-                        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-                    ">
-                        {html_content}
-                    </div>
-                    """, unsafe_allow_html=True)
-                else:
-                    st.warning("No final summary generated")
+                render_run_results(last_run, log_placeholder, final_output)
             
         except Exception as e:
             st.error(f"❌ Error during scenario execution: {e}")
-            import traceback
             st.code(traceback.format_exc())
+    
+    elif run_key in st.session_state:
+        # Show the last run of this scenario (press Run again to refresh it)
+        last_run = st.session_state[run_key]
+        progress_bar.progress(1.0)
+        status_box.success("✅ Showing results of the last run of this scenario")
+        with output_container:
+            render_scenario_details(last_run['trigger_event'])
+            log_placeholder = st.empty()
+            st.markdown("### 📋 Final Agent Output")
+            final_output = st.empty()
+            render_run_results(last_run, log_placeholder, final_output)
+
+
+# Scenario index, shared by both pages
+scenario_df = load_scenario_index()
+
+
+# ============================================================================
+# PAGE 1: SYSTEM VISUALIZATION
+# ============================================================================
+if page == "System Visualization":
+    st.markdown('<div class="main-header">🔍 System Visualization</div>', unsafe_allow_html=True)
+    
+    st.markdown("""
+    This page provides an overview of the multi-agent logistics system architecture,
+    showing how different specialized agents work together to handle logistics scenarios.
+    """)
+    
+    # System Overview
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.subheader("📊 System Architecture")
+        
+        # Check if graph visualization exists
+        graph_path = Path("logistics_graph.png")
+        if graph_path.exists():
+            st.image(str(graph_path), caption="Multi-Agent System Graph", use_container_width=True)
+        else:
+            st.info("Graph visualization not available. Generate it using: `python main.py viz`")
+            
+            if st.button("🎨 Generate Graph Visualization", key="gen_graph"):
+                with st.spinner("Generating graph visualization..."):
+                    try:
+                        from main import visualize_graph
+                        visualize_graph()
+                        st.success("✅ Graph generated successfully!")
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"❌ Error generating graph: {e}")
+    
+    with col2:
+        st.subheader("🤖 Agents")
+        
+        st.markdown(render_agents_html(), unsafe_allow_html=True)
+    
+    # System Workflow
+    st.markdown("---")
+    st.subheader("🔄 System Workflow")
+    
+    st.markdown(render_workflow_html(), unsafe_allow_html=True)
+    
+    # Scenario Overview
+    st.markdown("---")
+    st.subheader("📋 Available Scenarios")
+    
+    if scenario_df is not None:
+        # Display as formatted cards, sent to the browser as a single element
+        cards_html = "".join(
+            SCENARIO_CARD_TMPL.format(
+                sid=row.scenario_id,
+                name=row.scenario_name,
+                severity=row.severity,
+                complexity=row.complexity,
+                agents=row.primary_agents,
+                metrics=row.key_metrics,
+            )
+            for row in scenario_df.itertuples(index=False)
+        )
+        st.markdown(cards_html, unsafe_allow_html=True)
+    else:
+        st.warning("Scenario index not found")
+
+
+# ============================================================================
+# PAGE 2: SCENARIO RUNNER
+# ============================================================================
+elif page == "Scenario Runner":
+    st.markdown('<div class="main-header">▶️ Scenario Runner</div>', unsafe_allow_html=True)
+    
+    if not check_api_key():
+        st.error("⚠️ Cannot run scenarios: ANTHROPIC_API_KEY not configured")
+        st.info("Please set your Anthropic API key in .streamlit/secrets.toml to use this feature.")
+        st.stop()
+    
+    # Compile the graph while the user picks a scenario
+    _graph_prewarm()
+    
+    scenario_runner_fragment(scenario_df)
 
 
 # Footer
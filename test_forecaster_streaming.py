@@ -0,0 +1,88 @@
+"""
+Tests that the forecaster's large-file paths (chunked pandas, polars scans) match the in-memory pandas path
+
+STREAM_MIN_BYTES is lowered so the mock data takes the large-file paths.
+"""
+
+import pytest
+
+import tools.forecaster_tools as forecaster_tools
+from config import MOCK_DATA_DIR
+
+
+HISTORY = "date,product_id,demand\n" + "".join(
+    f"2025-10-{day:02d},P{product:03d},{'' if (day + product) % 7 == 0 else 10 * product + day % 5}\n"
+    for day in range(1, 9)
+    for product in range(1, 13)
+) + "2025-10-09,P099,42\n"
+
+FORECAST = (
+    "product_id,current_demand,predicted_demand,predicted_demand_change_pct,confidence,spike_reason\n"
+    "P001,100,250,150.0,0.9,Contract\n"
+    "P002,80,88,10.0,0.8,Noise\n"
+    "P003,50,80,60.0,0.7,Season\n"
+    "P004,40,50,25.0,0.6,\n"
+)
+
+
+@pytest.fixture(params=["mock", "synthetic"])
+def scenario_path(request, tmp_path):
+    """The mock demand spike scenario, and a synthetic one with a demand column and a change column"""
+    if request.param == "mock":
+        return MOCK_DATA_DIR / "scenario_3_demand_spike"
+    (tmp_path / "historical_demand.csv").write_text(HISTORY)
+    (tmp_path / "demand_forecast.csv").write_text(FORECAST)
+    return tmp_path
+
+
+def run_tools(scenario_path, monkeypatch):
+    """Output of the forecaster tools for a scenario directory"""
+    monkeypatch.setattr(forecaster_tools, "_get_scenario_path", lambda scenario_dir: scenario_path)
+    calls = [
+        (forecaster_tools.analyze_historical_trends, {}),
+        (forecaster_tools.predict_demand_spike, {}),
+        (forecaster_tools.predict_demand_spike, {"product_id": "P001"}),
+        (forecaster_tools.predict_demand_spike, {"product_id": "P999"}),
+    ]
+    return [tool.invoke({"scenario_dir": "scenario", **kwargs}) for tool, kwargs in calls]
+
+
+def record_failures(monkeypatch, name, failures):
+    """Record a polars helper's exceptions (the tools would silently fall back to pandas)"""
+    scan = getattr(forecaster_tools, name)
+
+    def checked(*args):
+        try:
+            return scan(*args)
+        except Exception as e:
+            failures.append(e)
+            raise
+
+    monkeypatch.setattr(forecaster_tools, name, checked)
+
+
+@pytest.mark.parametrize("chunk_rows", [1, 5, 1000])
+def test_chunked_history_matches_pandas(scenario_path, monkeypatch, chunk_rows):
+    """Streaming the history in chunks (merging stats across chunks) gives the in-memory result"""
+    expected = run_tools(scenario_path, monkeypatch)
+
+    monkeypatch.setattr(forecaster_tools, "STREAM_MIN_BYTES", 0)
+    monkeypatch.setattr(forecaster_tools, "HAVE_POLARS", False)
+    monkeypatch.setattr(forecaster_tools, "STREAM_CHUNK_ROWS", chunk_rows)
+
+    assert run_tools(scenario_path, monkeypatch) == expected
+
+
+def test_polars_scans_match_pandas(scenario_path, monkeypatch):
+    """The polars history and spike scans give the in-memory result"""
+    pytest.importorskip("polars")
+    expected = run_tools(scenario_path, monkeypatch)
+
+    monkeypatch.setattr(forecaster_tools, "STREAM_MIN_BYTES", 0)
+    monkeypatch.setattr(forecaster_tools, "HAVE_POLARS", True)
+    failures = []
+    record_failures(monkeypatch, "_scan_history", failures)
+    record_failures(monkeypatch, "_scan_spikes", failures)
+
+    assert run_tools(scenario_path, monkeypatch) == expected
+    assert failures == []
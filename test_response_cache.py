@@ -0,0 +1,71 @@
+"""
+Tests for the worker agents' response cache (no LLM calls: a stub agent answers)
+"""
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+import utils.scenario_cache
+from agents._cache import CachedAgent, ResponseCache
+
+
+class StubAgent:
+    """Agent stand-in that answers with the number of calls it has served."""
+
+    name = "inventory_manager"
+
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, state, config=None, **kwargs):
+        self.calls += 1
+        return {"messages": list(state["messages"]) + [AIMessage(f"answer {self.calls}")]}
+
+
+def make_agent():
+    agent = StubAgent()
+    return agent, CachedAgent(agent, "You manage inventory.", ["check_stock_levels"], cache=ResponseCache())
+
+
+def delegation(scenario_dir):
+    return {"messages": [HumanMessage(
+        f"Use scenario_dir={scenario_dir}. Check the current stock levels of every product, list the "
+        "products that are below their reorder point with their priority and days until stockout, "
+        "predict which products will run short within the next two weeks and recommend updated "
+        "reorder points for the products whose demand has changed."
+    )]}
+
+
+def test_repeat_delegation_hits():
+    """The same delegation on unchanged data is served from the cache"""
+    agent, cached = make_agent()
+    first = cached.invoke(delegation("scenario_1_low_inventory"))
+    second = cached.invoke(delegation("scenario_1_low_inventory"))
+
+    assert agent.calls == 1
+    assert second["messages"][-1].content == first["messages"][-1].content
+
+
+def test_other_scenario_misses():
+    """A delegation differing only in the scenario directory is not answered from another scenario"""
+    agent, cached = make_agent()
+    cached.invoke(delegation("scenario_1_low_inventory"))
+    result = cached.invoke(delegation("scenario_3_demand_spike"))
+
+    assert agent.calls == 2
+    assert result["messages"][-1].content == "answer 2"
+
+
+def test_data_edit_invalidates(tmp_path, monkeypatch):
+    """Editing a scenario's data files invalidates its cached responses"""
+    scenario_path = tmp_path / "scenario_1_low_inventory"
+    scenario_path.mkdir()
+    inventory_path = scenario_path / "inventory.csv"
+    inventory_path.write_text("product_id,current_stock\nP001,5\n")
+    monkeypatch.setattr(utils.scenario_cache, "MOCK_DATA_DIR", tmp_path)
+
+    agent, cached = make_agent()
+    cached.invoke(delegation("scenario_1_low_inventory"))
+    inventory_path.write_text("product_id,current_stock\nP001,500\n")
+    cached.invoke(delegation("scenario_1_low_inventory"))
+
+    assert agent.calls == 2
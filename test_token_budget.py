@@ -0,0 +1,60 @@
+"""
+Tests for trimming worker model calls to a token budget (no LLM calls: the handler records the request)
+"""
+
+from langchain.agents.middleware.types import ModelRequest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from agents._middleware import TokenBudgetMiddleware
+from utils.state_filtering import trim_to_token_budget
+
+
+def tool_round(call_id, result_size):
+    """An AI message calling a tool, and the tool's result"""
+    call = {"name": "check_stock_levels", "args": {}, "id": call_id}
+    return [AIMessage("", tool_calls=[call]), ToolMessage("x" * result_size, tool_call_id=call_id)]
+
+
+def test_within_budget_unchanged():
+    """Messages that fit are returned as they are"""
+    messages = [HumanMessage("check stock")] + tool_round("call_1", 40)
+    assert trim_to_token_budget(messages, 1000) is messages
+
+
+def test_leading_tool_message_dropped():
+    """A ToolMessage whose AI message was trimmed away is dropped too"""
+    messages = [HumanMessage("x" * 400), AIMessage("x" * 40), ToolMessage("x" * 40, tool_call_id="call_1"),
+                AIMessage("x" * 40), HumanMessage("next task")]
+    kept = trim_to_token_budget(messages, 25)
+
+    assert kept == messages[3:]
+
+
+def test_only_tool_results_left_keeps_their_call():
+    """If only tool results would be left, the AI message that called them is kept with them"""
+    messages = [HumanMessage("x" * 400)] + tool_round("call_1", 400)
+    kept = trim_to_token_budget(messages, 10)
+
+    assert kept == messages[1:]
+
+
+def test_middleware_keeps_delegation():
+    """The middleware trims the oldest tool rounds but always sends the delegation"""
+    delegation = HumanMessage("check stock for scenario_1_low_inventory")
+    messages = [delegation] + tool_round("call_1", 4000) + tool_round("call_2", 40)
+    request = ModelRequest(model=None, messages=messages)
+    sent = []
+
+    TokenBudgetMiddleware(max_input_tokens=500, system_tokens=100).wrap_model_call(request, sent.append)
+
+    assert sent[0].messages == [delegation] + messages[3:]
+
+
+def test_middleware_within_budget_passes_request():
+    """A call that fits the budget is passed on untouched"""
+    request = ModelRequest(model=None, messages=[HumanMessage("check stock")] + tool_round("call_1", 40))
+    sent = []
+
+    TokenBudgetMiddleware(max_input_tokens=500).wrap_model_call(request, sent.append)
+
+    assert sent[0] is request
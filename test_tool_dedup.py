@@ -0,0 +1,81 @@
+"""
+Tests for the duplicate tool call middleware (no LLM calls: fake tool requests)
+"""
+
+import threading
+from types import SimpleNamespace
+
+from langchain_core.messages import AIMessage, ToolMessage
+
+from agents._middleware import DedupToolCallsMiddleware
+
+
+def tool_call(call_id):
+    return {"name": "check_stock_levels", "args": {"scenario_dir": "scenario_1_low_inventory"}, "id": call_id}
+
+
+def requests_for(message):
+    """One tool request per tool call of an AI message, as the agent runtime issues them"""
+    state = {"messages": [message]}
+    return [SimpleNamespace(tool_call=call, state=state) for call in message.tool_calls]
+
+
+def counting_handler(results):
+    def handler(request):
+        results.append(request.tool_call["id"])
+        return ToolMessage(f"stock #{len(results)}", tool_call_id=request.tool_call["id"])
+    return handler
+
+
+def test_second_run_executes_again():
+    """A replayed AI message (same message and tool-call ids) does not reuse the first run's results"""
+    middleware = DedupToolCallsMiddleware()
+    message = AIMessage("", id="run-msg", tool_calls=[tool_call("call_1")])
+    calls = []
+
+    first = middleware.wrap_tool_call(requests_for(message)[0], counting_handler(calls))
+    second = middleware.wrap_tool_call(requests_for(message)[0], counting_handler(calls))
+
+    assert calls == ["call_1", "call_1"]
+    assert first.content == "stock #1"
+    assert second.content == "stock #2"
+
+
+def test_in_flight_duplicates_share_result():
+    """Identical calls in one AI message run once while the first is in flight"""
+    middleware = DedupToolCallsMiddleware()
+    message = AIMessage("", tool_calls=[tool_call("call_1"), tool_call("call_2")])
+    owner_request, duplicate_request = requests_for(message)
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def slow_handler(request):
+        calls.append(request.tool_call["id"])
+        started.set()
+        release.wait(5)
+        return ToolMessage("stock", tool_call_id=request.tool_call["id"])
+
+    results = {}
+    owner = threading.Thread(target=lambda: results.setdefault(
+        "owner", middleware.wrap_tool_call(owner_request, slow_handler)))
+    owner.start()
+    started.wait(5)
+
+    # Let the owner finish only once the duplicate is waiting on its result
+    (future,) = middleware._in_flight.values()
+    wait_result = future.result
+
+    def result(timeout=None):
+        release.set()
+        return wait_result(timeout)
+
+    future.result = result
+    duplicate = threading.Thread(target=lambda: results.setdefault(
+        "duplicate", middleware.wrap_tool_call(duplicate_request, slow_handler)))
+    duplicate.start()
+    owner.join(5)
+    duplicate.join(5)
+
+    assert calls == ["call_1"]
+    assert results["duplicate"].content == "stock"
+    assert results["duplicate"].tool_call_id == "call_2"
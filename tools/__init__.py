@@ -2,37 +2,78 @@
 Tools package for logistics agents
 """
 
-from .route_planner_tools import optimize_routes, assign_vehicle_to_route, check_traffic_conditions
-from .procurement_tools import check_supplier_status, place_purchase_order, predict_supplier_delays
-from .inventory_tools import check_stock_levels, predict_inventory_shortage, update_reorder_points
-from .distribution_tools import detect_traffic_delays, reroute_delivery, get_upcoming_deliveries
-from .forecaster_tools import predict_demand_spike, get_demand_forecast, analyze_historical_trends
-from .cost_optimizer_tools import analyze_financial_costs, calculate_roi, identify_cost_savings
-
-__all__ = [
+import importlib
+
+from config import MOCK_DATA_DIR
+
+
+# Tool name -> submodule defining it. Submodules are imported on first access
+# (PEP 562), so e.g. importing calculate_roi does not load pandas for the
+# data tools.
+_EXPORTS = {
     # Route Planner
-    "optimize_routes",
-    "assign_vehicle_to_route",
-    "check_traffic_conditions",
+    "optimize_routes": "route_planner_tools",
+    "assign_vehicle_to_route": "route_planner_tools",
+    "check_traffic_conditions": "route_planner_tools",
     # Procurement Manager
-    "check_supplier_status",
-    "place_purchase_order",
-    "predict_supplier_delays",
+    "check_supplier_status": "procurement_tools",
+    "place_purchase_order": "procurement_tools",
+    "predict_supplier_delays": "procurement_tools",
     # Inventory Manager
-    "check_stock_levels",
-    "predict_inventory_shortage",
-    "update_reorder_points",
+    "check_stock_levels": "inventory_tools",
+    "predict_inventory_shortage": "inventory_tools",
+    "update_reorder_points": "inventory_tools",
     # Distribution Handler
-    "detect_traffic_delays",
-    "reroute_delivery",
-    "get_upcoming_deliveries",
+    "detect_traffic_delays": "distribution_tools",
+    "reroute_delivery": "distribution_tools",
+    "get_upcoming_deliveries": "distribution_tools",
     # Demand Forecaster
-    "predict_demand_spike",
-    "get_demand_forecast",
-    "analyze_historical_trends",
+    "predict_demand_spike": "forecaster_tools",
+    "get_demand_forecast": "forecaster_tools",
+    "analyze_historical_trends": "forecaster_tools",
     # Cost Optimizer
-    "analyze_financial_costs",
-    "calculate_roi",
-    "identify_cost_savings",
-]
+    "analyze_financial_costs": "cost_optimizer_tools",
+    "calculate_roi": "roi_tool",
+    "identify_cost_savings": "cost_optimizer_tools",
+}
+
+
+def __getattr__(name):
+    """Import the submodule defining ``name`` on first access (PEP 562)."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+# Submodules that read scenario files through the CSV cache
+_CACHED_READERS = (
+    "cost_optimizer_tools", "distribution_tools", "forecaster_tools",
+    "inventory_tools", "procurement_tools", "route_planner_tools",
+)
+
+
+def warm_scenario(scenario_dir: str) -> None:
+    """
+    Start parsing a scenario's data files in the background.
+
+    Every file the tools read through the CSV cache is parsed on a shared
+    thread pool with the tools' own column selections, while the agents are
+    being built and the orchestrator makes its first LLM call. The tools'
+    first reads are then served from the cache. Returns immediately.
+
+    Args:
+        scenario_dir: Scenario directory name
+    """
+    from ._csv_cache import prefetch
+
+    scenario_path = MOCK_DATA_DIR / scenario_dir
+    files = []
+    for module_name in _CACHED_READERS:
+        module = importlib.import_module(f".{module_name}", __name__)
+        files.extend((scenario_path / name, columns) for name, columns in module.SCENARIO_FILES.items())
+    prefetch(files)
+
 
+__all__ = list(_EXPORTS)
@@ -0,0 +1,323 @@
+"""
+Parsed-CSV cache shared by the agent tools.
+
+Agents call the same tools on the same scenario files many times per run.
+``read_csv`` parses each file once and serves later calls from memory; the
+cache key includes the file's modification time, so an edited file is
+parsed again on its next read. Callers pass the columns they use so only
+those are parsed.
+
+pandas (and pyarrow) are imported on the first read rather than when the
+tool modules are imported, so building the agents does not pay for them.
+
+When pyarrow is installed, the first read of a CSV also writes a Parquet
+copy next to it (``X.csv`` -> ``X.parquet``); later processes read the
+typed binary copy instead of parsing text, for as long as it is newer
+than the CSV. ``write_parquet_copies`` builds the copies for a whole data
+directory ahead of time (``python main.py parquet``).
+
+``column_stat`` memoizes whole-column reductions (sums, means, value
+counts, or a tool's own function computing several results in one pass)
+the same way, so repeated tool calls on an unchanged file reuse
+the totals instead of reducing the column again; ``frame_stat`` does the
+same for results that need several columns (e.g. rows at or below their
+reorder point, shared by the inventory tools). ``category_mask`` builds
+on it to filter low-cardinality text columns (status, priority, severity)
+by their factorized integer codes, and ``row_position`` to look up rows by
+ID through a hash table built once per file version.
+
+``read_csvs`` reads several independent files at once on a shared thread
+pool; pandas' C parser and pyarrow release the GIL while parsing, so the
+reads overlap instead of adding up. ``prefetch`` submits reads to the same
+pool without waiting, so a scenario's files can be parsed while the agents
+are still being set up.
+
+``file_exists`` (from ``_files``) remembers which scenario files exist, so
+the tools' repeated probes for optional files cost one ``stat`` per path
+until ``clear_file_checks`` is called (between scenario runs).
+"""
+
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from ._files import file_exists
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Parquet copies need pyarrow; without it every read parses the CSV
+HAVE_PYARROW = find_spec("pyarrow") is not None
+
+# Shared by every tool call in the process; threads are only started on first use
+_READ_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="csv-read")
+
+
+def _write_parquet(df: "pd.DataFrame", parquet_path: Path) -> None:
+    """Write the Parquet copy of a CSV atomically; failures only cost the speedup."""
+    fd, tmp_path = tempfile.mkstemp(dir=parquet_path.parent, suffix=".parquet.tmp")
+    os.close(fd)
+    try:
+        df.to_parquet(tmp_path, engine="pyarrow", compression="zstd", index=False)
+        os.replace(tmp_path, parquet_path)
+    except (OSError, ValueError, TypeError):
+        # Read-only data directory, or a column pyarrow cannot store
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def _parquet_is_fresh(path: Path, parquet_path: Path) -> bool:
+    """Whether a CSV's Parquet copy exists and is at least as new as the CSV."""
+    try:
+        return parquet_path.stat().st_mtime_ns >= path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
+def write_parquet_copies(directory: Path) -> int:
+    """
+    Write Parquet copies of every CSV under a directory that lacks an up-to-date one.
+
+    Args:
+        directory: Data directory to walk (e.g. MOCK_DATA_DIR)
+
+    Returns:
+        Number of copies written (0 when pyarrow is not installed)
+    """
+    if not HAVE_PYARROW:
+        return 0
+    import pandas as pd
+    
+    written = 0
+    for path in sorted(directory.rglob("*.csv")):
+        parquet_path = path.with_suffix(".parquet")
+        if not _parquet_is_fresh(path, parquet_path):
+            _write_parquet(pd.read_csv(path, engine="c"), parquet_path)
+            written += parquet_path.exists()
+    return written
+
+
+def _read_table(path: Path, columns: Optional[Tuple[str, ...]]) -> "pd.DataFrame":
+    """Read a CSV (or its up-to-date Parquet copy), limited to the given columns that exist."""
+    import pandas as pd
+    
+    parquet_path = path.with_suffix(".parquet")
+    if HAVE_PYARROW:
+        if _parquet_is_fresh(path, parquet_path):
+            import pyarrow.parquet as pq
+            selected = None
+            if columns is not None:
+                selected = [col for col in pq.read_schema(parquet_path).names if col in columns] or None
+            return pd.read_parquet(parquet_path, engine="pyarrow", columns=selected)
+
+        # Parse the whole file once so the Parquet copy serves every column selection.
+        # The C engine on purpose: engine="pyarrow" infers time and timestamp columns
+        # (a "10:00" deadline reads back as 10:00:00), which changes the reports
+        df = pd.read_csv(path, engine="c")
+        _write_parquet(df, parquet_path)
+        selected = [col for col in df.columns if columns is None or col in columns]
+        return df[selected] if selected else df
+
+    if columns is None:
+        return pd.read_csv(path, engine="c")
+    # A callable usecols skips absent columns instead of raising, as the
+    # tools treat most columns as optional
+    wanted = frozenset(columns)
+    df = pd.read_csv(path, engine="c", usecols=lambda col: col in wanted)
+    if len(df.columns) == 0:
+        # None of the columns exist: parse everything so the row count is kept
+        df = pd.read_csv(path, engine="c")
+    return df
+
+
+@lru_cache(maxsize=64)
+def _load_csv(path_str: str, mtime_ns: int, columns: Optional[Tuple[str, ...]]) -> "pd.DataFrame":
+    """Parse a CSV file (cached per path, modification time and column selection)."""
+    return _read_table(Path(path_str), columns)
+
+
+def read_csv(path: Path, columns: Optional[Tuple[str, ...]] = None) -> "pd.DataFrame":
+    """
+    Read a scenario CSV file, reusing the parsed DataFrame while the file is unchanged.
+
+    The returned DataFrame is shared between callers and must not be modified
+    in place (filtering and selecting columns create new frames and are fine).
+
+    Args:
+        path: Path to the CSV file
+        columns: Columns to parse (None = all); columns missing from the file are skipped
+
+    Returns:
+        Parsed DataFrame
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    return _load_csv(str(path), path.stat().st_mtime_ns, columns)
+
+
+def read_csvs(files: List[Tuple[Path, Optional[Tuple[str, ...]]]]) -> List[Optional["pd.DataFrame"]]:
+    """
+    Read several scenario CSV files concurrently, like ``read_csv`` on each.
+
+    Args:
+        files: (path, columns) pairs, as passed to ``read_csv``
+
+    Returns:
+        One DataFrame per file, in order; None for files that do not exist
+
+    Raises:
+        Whatever the first failing read (in list order) raised
+    """
+    existing = [(path, columns) for path, columns in files if file_exists(path)]
+    if len(existing) > 1:
+        futures = {path: _READ_POOL.submit(read_csv, path, columns) for path, columns in existing}
+        frames = {path: future.result() for path, future in futures.items()}
+    else:
+        frames = {path: read_csv(path, columns) for path, columns in existing}
+    return [frames.get(path) for path, _ in files]
+
+
+def prefetch(files: List[Tuple[Path, Optional[Tuple[str, ...]]]]) -> None:
+    """
+    Start reading scenario CSV files in the background and return immediately.
+
+    Later ``read_csv`` calls with the same column selection are served from
+    the cache. Read errors are ignored here; the tool that reads the file
+    reports them.
+
+    Args:
+        files: (path, columns) pairs, as passed to ``read_csv``; missing files are skipped
+    """
+    for path, columns in files:
+        if file_exists(path):
+            _READ_POOL.submit(read_csv, path, columns)
+
+
+@lru_cache(maxsize=256)
+def _column_stat(
+    path_str: str, mtime_ns: int, columns: Optional[Tuple[str, ...]], column: str,
+    stat: Union[str, Callable[["pd.Series"], Any]],
+) -> Any:
+    """Reduce one column of a cached CSV (cached per file version, column and reduction)."""
+    series = _load_csv(path_str, mtime_ns, columns)[column]
+    return getattr(series, stat)() if isinstance(stat, str) else stat(series)
+
+
+def column_stat(
+    path: Path, columns: Optional[Tuple[str, ...]], column: str, stat: Union[str, Callable[["pd.Series"], Any]]
+) -> Any:
+    """
+    Reduce a column of a scenario CSV, reusing the result while the file is unchanged.
+
+    A reduction that fails (e.g. the mean of a text column) raises on every
+    call, as it would without the cache. Series results such as value counts
+    are shared between callers and must not be modified.
+
+    Args:
+        path: Path to the CSV file
+        columns: Column selection the file is read with (as passed to ``read_csv``)
+        column: Column to reduce
+        stat: Name of the Series reduction, e.g. "sum", "mean" or "value_counts", or
+            a module-level function taking the Series (it is part of the cache key)
+
+    Returns:
+        The reduction's result
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        KeyError: If the column is not in the file
+    """
+    return _column_stat(str(path), path.stat().st_mtime_ns, columns, column, stat)
+
+
+@lru_cache(maxsize=64)
+def _frame_stat(
+    path_str: str, mtime_ns: int, columns: Optional[Tuple[str, ...]], stat: Callable[["pd.DataFrame"], Any]
+) -> Any:
+    """Reduce a cached CSV as a whole (cached per file version and reduction)."""
+    return stat(_load_csv(path_str, mtime_ns, columns))
+
+
+def frame_stat(path: Path, columns: Optional[Tuple[str, ...]], stat: Callable[["pd.DataFrame"], Any]) -> Any:
+    """
+    Compute a result over several columns of a scenario CSV, reusing it while the file is unchanged.
+
+    The multi-column counterpart of ``column_stat``. Results are shared
+    between callers and must not be modified.
+
+    Args:
+        path: Path to the CSV file
+        columns: Column selection the file is read with (as passed to ``read_csv``)
+        stat: Module-level function taking the DataFrame (it is part of the cache key)
+
+    Returns:
+        The function's result
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    return _frame_stat(str(path), path.stat().st_mtime_ns, columns, stat)
+
+
+def category_mask(
+    path: Path, columns: Optional[Tuple[str, ...]], column: str, values: Tuple[Any, ...]
+) -> np.ndarray:
+    """
+    Mask of the rows of a scenario CSV whose value in a column is one of ``values``.
+
+    The column is factorized into integer codes once per file version (like a
+    ``category`` dtype), so each filter looks up small ints in a table of
+    matching categories instead of comparing every string.
+
+    Args:
+        path: Path to the CSV file
+        columns: Column selection the file is read with (as passed to ``read_csv``)
+        column: Column to filter on
+        values: Values to keep
+
+    Returns:
+        Boolean array with one entry per row
+    """
+    codes, categories = column_stat(path, columns, column, "factorize")
+    # Missing values have code -1, which picks the trailing False
+    matches = np.append(np.isin(categories.to_numpy(), values), False)
+    return matches[codes]
+
+
+def _first_positions(series: "pd.Series") -> Dict[Any, int]:
+    """Map each value of a column to the position of its first row."""
+    values = series.tolist()
+    # Walk backwards so the first occurrence of a repeated value is kept
+    return dict(zip(reversed(values), range(len(values) - 1, -1, -1)))
+
+
+def row_position(path: Path, columns: Optional[Tuple[str, ...]], column: str, value: Any) -> Optional[int]:
+    """
+    Position of the first row of a scenario CSV whose value in a column equals ``value``.
+
+    Equivalent to ``np.flatnonzero(df[column] == value)[0]``, but the
+    value -> position table is built once per file version, so each lookup
+    is a dict access instead of a scan of the column.
+
+    Args:
+        path: Path to the CSV file
+        columns: Column selection the file is read with (as passed to ``read_csv``)
+        column: Column to search, e.g. an ID column
+        value: Value to look up
+
+    Returns:
+        Row position, or None if no row has the value
+
+    Raises:
+        KeyError: If the column is not in the file
+    """
+    return column_stat(path, columns, column, _first_positions).get(value)
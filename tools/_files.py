@@ -0,0 +1,30 @@
+"""
+Remembered file existence checks for scenario data.
+
+``file_exists`` remembers which scenario files exist, so the tools'
+repeated probes for optional files cost one ``stat`` per path until
+``clear_file_checks`` is called (between scenario runs). Kept apart from
+``_csv_cache`` so the scenario loader can use it without importing pandas.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=256)
+def file_exists(path: Path) -> bool:
+    """
+    Whether a scenario file exists, remembered until ``clear_file_checks()``.
+
+    Args:
+        path: Path to check
+
+    Returns:
+        True if the path exists
+    """
+    return path.exists()
+
+
+def clear_file_checks() -> None:
+    """Forget the results of ``file_exists`` (files may have been added or removed)."""
+    file_exists.cache_clear()
@@ -0,0 +1,83 @@
+"""
+Row iteration and formatting helpers for the agent tools.
+
+``DataFrame.iterrows()`` builds a Series for every row, which dominates the
+cost of the tools' report loops. ``iter_rows`` pulls the needed columns out
+as numpy arrays once and yields plain dicts instead, which support the same
+``row.get(col, default)`` / ``col in row`` access the tools use.
+
+``format_counts`` renders the small status histograms in the reports
+without going through pandas' Series formatter.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def iter_rows(
+    df: "pd.DataFrame", columns: List[str], rows: Optional[np.ndarray] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over the rows of a DataFrame as dicts of selected columns.
+
+    Columns missing from the DataFrame are left out of the dicts, so
+    ``col in row`` tells whether the column exists, as with ``iterrows()``.
+
+    Args:
+        df: DataFrame to iterate
+        columns: Columns to include
+        rows: Positions of the rows to yield, e.g. from ``np.flatnonzero(mask)``
+            (default: all rows). Selecting rows this way avoids building a
+            filtered DataFrame first.
+
+    Yields:
+        One dict per row, mapping each present column to its value
+    """
+    present = [col for col in columns if col in df.columns]
+    if not present:
+        for _ in range(len(df) if rows is None else len(rows)):
+            yield {}
+        return
+    arrays = (df[col].to_numpy() for col in present)
+    if rows is not None:
+        arrays = (array[rows] for array in arrays)
+    for values in zip(*arrays):
+        yield dict(zip(present, values))
+
+
+def _is_plain_label(label: Any) -> bool:
+    """Whether pandas prints a label as ``str(label)``, with no alignment or escaping of its own."""
+    if isinstance(label, str):
+        return label.isprintable() and not label[:1].isspace()
+    # Negative numbers make pandas indent the other labels to line up the digits
+    return isinstance(label, bool) or (isinstance(label, int) and label >= 0)
+
+
+def format_counts(counts: "pd.Series") -> str:
+    """
+    Render value counts exactly as ``counts.to_string()`` does.
+
+    Labels are left-aligned and counts right-aligned, under the name of
+    the counted column. Float or unusual labels (which pandas formats or escapes) fall
+    back to ``to_string()``.
+
+    Args:
+        counts: Result of ``Series.value_counts()``
+
+    Returns:
+        The formatted counts
+    """
+    labels = counts.index.tolist()
+    if not labels or not all(map(_is_plain_label, labels)):
+        return counts.to_string()
+    labels = [str(label) for label in labels]
+    values = [str(value) for value in counts.tolist()]
+    label_width = max(map(len, labels))
+    value_width = max(map(len, values))
+    lines = [] if counts.index.name is None else [str(counts.index.name)]
+    lines.extend(f"{label:<{label_width}}    {value:>{value_width}}" for label, value in zip(labels, values))
+    return "\n".join(lines)
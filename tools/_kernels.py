@@ -0,0 +1,155 @@
+"""
+Numeric scans over forecast and inventory columns.
+
+``above`` (threshold mask), ``top_k`` (indices of the largest values) and
+``reorder_points`` (reorder point recommendations) run as compiled numba
+kernels for large numeric columns when numba is installed, and as numpy
+expressions otherwise. Small columns always use
+numpy: calling into a kernel costs more than the scan itself.
+"""
+
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Tuple, Union
+
+import numpy as np
+
+# Columns shorter than this are scanned with numpy
+JIT_MIN_ROWS = 10_000
+
+# numba is optional and slow to import, so it is only loaded for the first large column
+HAVE_NUMBA = find_spec("numba") is not None
+
+
+@lru_cache(maxsize=1)
+def _jit_kernels():
+    """Compile (once, cached on disk by numba) and return the scan kernels."""
+    from numba import njit, prange
+
+    @njit(parallel=True, cache=True)
+    def above_jit(values, threshold):
+        mask = np.empty(values.shape[0], np.bool_)
+        for i in prange(values.shape[0]):
+            mask[i] = values[i] > threshold
+        return mask
+
+    @njit(cache=True)
+    def top_k_jit(values, k):
+        # Insertion into a k-slot buffer kept in descending order; a value only
+        # displaces strictly smaller ones, so ties keep the earlier row
+        best = np.empty(k, np.int64)
+        count = 0
+        for i in range(values.shape[0]):
+            value = values[i]
+            if value != value:  # NaN
+                continue
+            if count == k and not value > values[best[k - 1]]:
+                continue
+            pos = count if count < k else k - 1
+            while pos > 0 and value > values[best[pos - 1]]:
+                best[pos] = best[pos - 1]
+                pos -= 1
+            best[pos] = i
+            if count < k:
+                count += 1
+        return best[:count]
+
+    # No fastmath: it assumes there are no NaNs, which would change the comparisons
+    @njit(parallel=True, cache=True)
+    def reorder_points_jit(daily_demand, lead_time, current, safety_days):
+        n = daily_demand.shape[0]
+        recommended = np.empty(n, np.float64)
+        adjust = np.empty(n, np.bool_)
+        change_pct = np.empty(n, np.float64)
+        for i in prange(n):
+            value = daily_demand[i] * (lead_time[i] + safety_days)
+            recommended[i] = value
+            adjust[i] = abs(value - current[i]) > daily_demand[i]
+            change_pct[i] = (value - current[i]) / current[i] * 100 if current[i] > 0 else 0.0
+        return recommended, adjust, change_pct
+
+    return above_jit, top_k_jit, reorder_points_jit
+
+
+def _use_jit(values: np.ndarray) -> bool:
+    """Whether a column is large and numeric enough for the compiled kernels."""
+    return HAVE_NUMBA and values.shape[0] >= JIT_MIN_ROWS and values.dtype.kind in "fi"
+
+
+def above(values: np.ndarray, threshold: float) -> np.ndarray:
+    """
+    Mask of the values greater than a threshold (NaN counts as not greater).
+
+    Args:
+        values: 1-D numeric array
+        threshold: Threshold to compare against
+
+    Returns:
+        Boolean array, same length as ``values``
+    """
+    if _use_jit(values):
+        return _jit_kernels()[0](values, threshold)
+    return values > threshold
+
+
+def top_k(values: np.ndarray, k: int) -> np.ndarray:
+    """
+    Positions of the ``k`` largest values, largest first, like ``DataFrame.nlargest``.
+
+    Ties keep the earlier position. NaN values rank below every number, so
+    they are only included (in row order) when there are fewer than ``k``
+    other values.
+
+    Args:
+        values: 1-D numeric array
+        k: Number of positions to return
+
+    Returns:
+        Integer array of positions into ``values``
+    """
+    if k <= 0:
+        return np.empty(0, np.int64)
+    if _use_jit(values):
+        top = _jit_kernels()[1](values, k)
+    else:
+        valid = np.flatnonzero(~np.isnan(values)) if values.dtype.kind == "f" else np.arange(values.shape[0])
+        candidates = values[valid]
+        if candidates.shape[0] > k:
+            # O(n) partial partition finds the k-th largest value; only values at or
+            # above it (k plus any ties) are sorted
+            kth = candidates[np.argpartition(candidates, -k)[-k:]].min()
+            keep = np.flatnonzero(candidates >= kth)
+            valid, candidates = valid[keep], candidates[keep]
+        top = valid[np.argsort(-candidates, kind="stable")[:k]]
+    if top.shape[0] < k and values.dtype.kind == "f":
+        top = np.concatenate([top, np.flatnonzero(np.isnan(values))[:k - top.shape[0]]])
+    return top
+
+
+def reorder_points(
+    daily_demand: np.ndarray, lead_time: Union[np.ndarray, int], current: np.ndarray, safety_days: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Recommended reorder points (demand over the lead time plus safety stock).
+
+    Args:
+        daily_demand: Daily demand per product
+        lead_time: Lead time in days per product, or one value for all
+        current: Current reorder point per product
+        safety_days: Days of safety stock
+
+    Returns:
+        (recommended reorder points, mask of the products whose recommendation
+        differs from the current point by more than a day of demand, change in
+        percent of the current point, 0 where it is not positive)
+    """
+    if _use_jit(daily_demand) and np.ndim(lead_time) == 0:
+        lead_time = np.full(daily_demand.shape[0], lead_time)
+    arrays = (daily_demand, lead_time, current)
+    if all(_use_jit(values) for values in arrays):
+        return _jit_kernels()[2](*arrays, safety_days)
+    recommended = daily_demand * (lead_time + safety_days)
+    adjust = np.abs(recommended - current) > daily_demand
+    with np.errstate(divide='ignore', invalid='ignore'):
+        change_pct = np.where(current > 0, (recommended - current) / current * 100, 0)
+    return recommended, adjust, change_pct
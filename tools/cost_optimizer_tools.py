@@ -2,18 +2,47 @@
 Cost Optimizer Agent Tools
 """
 
-import pandas as pd
+import numpy as np
+from functools import lru_cache
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated, Tuple
 from langchain_core.tools import tool
 from config import MOCK_DATA_DIR
+from ._csv_cache import column_stat, read_csv, read_csvs
+from ._files import file_exists
+from ._frames import iter_rows
 
+if TYPE_CHECKING:
+    import pandas as pd
 
+
+# Columns the tools read from each scenario file (only these are parsed)
+COST_COLUMNS = ("category", "actual_cost", "budgeted_cost", "potential_savings")
+ROUTE_EFFICIENCY_COLUMNS = ("route_id", "optimization_suggestion", "potential_savings")
+SUPPLIER_PRICING_COLUMNS = ("supplier_name", "savings_vs_current", "potential_savings")
+WAREHOUSE_COLUMNS = ("utilization_pct", "potential_savings")
+
+# Files read through the CSV cache, with their column selections (see tools.warm_scenario)
+SCENARIO_FILES = {
+    "cost_analysis.csv": COST_COLUMNS,
+    "route_efficiency.csv": ROUTE_EFFICIENCY_COLUMNS,
+    "supplier_pricing.csv": SUPPLIER_PRICING_COLUMNS,
+    "warehouse_utilization.csv": WAREHOUSE_COLUMNS,
+}
+
+
+@lru_cache(maxsize=16)
 def _get_scenario_path(scenario_dir: str) -> Path:
-    """Helper to get scenario directory path"""
+    """Helper to get scenario directory path (built once per scenario)"""
     return MOCK_DATA_DIR / scenario_dir
 
 
+def _utilization_summary(utilization: "pd.Series") -> Tuple[float, int, int]:
+    """Mean utilization and the number of under- (<60%) and over-utilized (>90%) warehouses."""
+    values = utilization.to_numpy()
+    return utilization.mean(), int((values < 60).sum()), int((values > 90).sum())
+
+
 @tool
 def analyze_financial_costs(scenario_dir: Annotated[str, "Scenario directory name"]) -> str:
     """
@@ -24,46 +53,67 @@ def analyze_financial_costs(scenario_dir: Annotated[str, "Scenario directory nam
     
     try:
         cost_path = scenario_path / "cost_analysis.csv"
-        if not cost_path.exists():
+        if not file_exists(cost_path):
             return "No cost analysis data available for this scenario"
         
-        cost_df = pd.read_csv(cost_path)
+        cost_df = read_csv(cost_path, COST_COLUMNS)
+        cost_cols = set(cost_df.columns)
+        # Which of the optional columns the file has, checked once
+        has_actual = 'actual_cost' in cost_cols
+        has_budgeted = 'budgeted_cost' in cost_cols
+        has_category = 'category' in cost_cols
+        has_savings = 'potential_savings' in cost_cols
+        
+        parts = [f"Financial Cost Analysis:\n"]
+        parts.append(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
         
-        result = f"Financial Cost Analysis:\n"
-        result += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+        if cost_df.empty:
+            parts.append("No records in cost_analysis.csv\n")
+            return "".join(parts)
         
-        if 'actual_cost' in cost_df.columns:
-            total_actual = cost_df['actual_cost'].sum()
-            result += f"Total Actual Costs: ${total_actual:,.2f}\n"
+        if has_actual:
+            total_actual = column_stat(cost_path, COST_COLUMNS, 'actual_cost', 'sum')
+            parts.append(f"Total Actual Costs: ${total_actual:,.2f}\n")
         
-        if 'budgeted_cost' in cost_df.columns:
-            total_budget = cost_df['budgeted_cost'].sum()
-            result += f"Total Budgeted Costs: ${total_budget:,.2f}\n"
+        if has_budgeted:
+            total_budget = column_stat(cost_path, COST_COLUMNS, 'budgeted_cost', 'sum')
+            parts.append(f"Total Budgeted Costs: ${total_budget:,.2f}\n")
             
-            if 'actual_cost' in cost_df.columns:
+            if has_actual:
                 overrun = total_actual - total_budget
                 overrun_pct = (overrun / total_budget * 100) if total_budget > 0 else 0
                 
                 if overrun > 0:
-                    result += f"💰 Budget Overrun: ${overrun:,.2f} ({overrun_pct:+.1f}%)\n"
+                    parts.append(f"💰 Budget Overrun: ${overrun:,.2f} ({overrun_pct:+.1f}%)\n")
                 else:
-                    result += f"✓ Under Budget: ${abs(overrun):,.2f} ({overrun_pct:+.1f}%)\n"
+                    parts.append(f"✓ Under Budget: ${abs(overrun):,.2f} ({overrun_pct:+.1f}%)\n")
         
         # Cost breakdown by category
-        if 'category' in cost_df.columns:
-            result += f"\n📊 Cost Breakdown by Category:\n"
+        if has_category:
+            parts.append(f"\n📊 Cost Breakdown by Category:\n")
             
-            for _, cost_item in cost_df.iterrows():
-                category = cost_item.get('category', 'N/A')
-                actual = cost_item.get('actual_cost', 0)
-                budgeted = cost_item.get('budgeted_cost', 0)
-                
-                result += f"\n{category}:\n"
-                result += f"   Actual: ${actual:,.2f}\n"
-                result += f"   Budget: ${budgeted:,.2f}\n"
+            # Pull the columns out once; variances are computed for all rows together
+            no_values = np.zeros(len(cost_df))
+            actuals = cost_df['actual_cost'].to_numpy() if has_actual else no_values
+            budgets = cost_df['budgeted_cost'].to_numpy() if has_budgeted else no_values
+            savings = cost_df['potential_savings'].to_numpy() if has_savings else no_values
+            budgeted_rows = budgets > 0
+            with np.errstate(divide='ignore', invalid='ignore'):
+                variances = np.where(budgeted_rows, (actuals - budgets) / budgets * 100, 0)
+            
+            # Each column is formatted in one pass over plain Python numbers (faster
+            # to format than numpy scalars); the loop only picks the pieces
+            actual_text = [f"   Actual: ${actual:,.2f}\n" for actual in actuals.tolist()]
+            budget_text = [f"   Budget: ${budgeted:,.2f}\n" for budgeted in budgets.tolist()]
+            for category, actual, budgeted, show_variance, variance, show_savings, saving in zip(
+                cost_df['category'].to_numpy().tolist(), actual_text, budget_text,
+                budgeted_rows.tolist(), variances.tolist(), (savings > 0).tolist(), savings.tolist(),
+            ):
+                parts.append(f"\n{category}:\n")
+                parts.append(actual)
+                parts.append(budgeted)
                 
-                if budgeted > 0:
-                    variance = ((actual - budgeted) / budgeted * 100)
+                if show_variance:
                     if variance > 10:
                         status = "🚨 Over Budget"
                     elif variance > 5:
@@ -71,82 +121,23 @@ def analyze_financial_costs(scenario_dir: Annotated[str, "Scenario directory nam
                     else:
                         status = "✓ On Track"
                     
-                    result += f"   Variance: {variance:+.1f}% {status}\n"
+                    parts.append(f"   Variance: {variance:+.1f}% {status}\n")
                 
-                if 'potential_savings' in cost_item and cost_item['potential_savings'] > 0:
-                    result += f"   💡 Potential Savings: ${cost_item['potential_savings']:,.2f}\n"
+                if show_savings:
+                    parts.append(f"   💡 Potential Savings: ${saving:,.2f}\n")
         
         # Total potential savings
-        if 'potential_savings' in cost_df.columns:
-            total_savings = cost_df['potential_savings'].sum()
+        if has_savings:
+            total_savings = column_stat(cost_path, COST_COLUMNS, 'potential_savings', 'sum')
             if total_savings > 0:
-                result += f"\n💰 Total Potential Savings: ${total_savings:,.2f}\n"
+                parts.append(f"\n💰 Total Potential Savings: ${total_savings:,.2f}\n")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         return f"Error analyzing financial costs: {str(e)}"
 
 
-@tool
-def calculate_roi(
-    scenario_dir: Annotated[str, "Scenario directory name"],
-    investment_amount: Annotated[float, "Investment amount to calculate ROI for"],
-    expected_savings: Annotated[float, "Expected monthly savings from investment"]
-) -> str:
-    """
-    Calculate return on investment for cost optimization initiatives.
-    Provides ROI analysis and payback period calculations.
-    """
-    try:
-        # Calculate annual savings
-        annual_savings = expected_savings * 12
-        
-        # Calculate ROI percentage
-        roi_pct = ((annual_savings - investment_amount) / investment_amount * 100) if investment_amount > 0 else 0
-        
-        # Calculate payback period in months
-        payback_months = (investment_amount / expected_savings) if expected_savings > 0 else float('inf')
-        
-        result = f"ROI Analysis:\n"
-        result += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-        result += f"Investment Amount: ${investment_amount:,.2f}\n"
-        result += f"Expected Monthly Savings: ${expected_savings:,.2f}\n"
-        result += f"Expected Annual Savings: ${annual_savings:,.2f}\n"
-        result += f"\n📊 Financial Metrics:\n"
-        result += f"   ROI (1 year): {roi_pct:+.1f}%\n"
-        
-        if payback_months != float('inf'):
-            result += f"   Payback Period: {payback_months:.1f} months\n"
-            
-            if payback_months <= 6:
-                assessment = "🟢 Excellent - Quick payback"
-            elif payback_months <= 12:
-                assessment = "🟡 Good - Reasonable payback"
-            elif payback_months <= 24:
-                assessment = "🟠 Fair - Long payback"
-            else:
-                assessment = "🔴 Poor - Very long payback"
-            
-            result += f"   Assessment: {assessment}\n"
-        else:
-            result += f"   Payback Period: Not achievable with current savings\n"
-            result += f"   Assessment: 🔴 Not recommended\n"
-        
-        # 3-year projection
-        three_year_savings = annual_savings * 3
-        three_year_roi = ((three_year_savings - investment_amount) / investment_amount * 100) if investment_amount > 0 else 0
-        
-        result += f"\n📈 3-Year Projection:\n"
-        result += f"   Total Savings: ${three_year_savings:,.2f}\n"
-        result += f"   ROI: {three_year_roi:+.1f}%\n"
-        
-        return result
-        
-    except Exception as e:
-        return f"Error calculating ROI: {str(e)}"
-
-
 @tool
 def identify_cost_savings(scenario_dir: Annotated[str, "Scenario directory name"]) -> str:
     """
@@ -156,89 +147,96 @@ def identify_cost_savings(scenario_dir: Annotated[str, "Scenario directory name"
     scenario_path = _get_scenario_path(scenario_dir)
     
     try:
-        result = f"Cost Savings Opportunities:\n"
-        result += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+        parts = [f"Cost Savings Opportunities:\n"]
+        parts.append(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
         
         total_potential_savings = 0
         
-        # Route efficiency analysis
+        # The three files are independent, so they are read concurrently
         route_efficiency_path = scenario_path / "route_efficiency.csv"
-        if route_efficiency_path.exists():
-            route_df = pd.read_csv(route_efficiency_path)
+        supplier_pricing_path = scenario_path / "supplier_pricing.csv"
+        warehouse_path = scenario_path / "warehouse_utilization.csv"
+        route_df, supplier_df, warehouse_df = read_csvs([
+            (route_efficiency_path, ROUTE_EFFICIENCY_COLUMNS),
+            (supplier_pricing_path, SUPPLIER_PRICING_COLUMNS),
+            (warehouse_path, WAREHOUSE_COLUMNS),
+        ])
+        
+        # Route efficiency analysis
+        if route_df is not None:
+            route_cols = set(route_df.columns)
             
-            result += f"\n🚚 Route Optimization Opportunities:\n"
-            result += f"   Routes analyzed: {len(route_df)}\n"
+            parts.append(f"\n🚚 Route Optimization Opportunities:\n")
+            parts.append(f"   Routes analyzed: {len(route_df)}\n")
             
-            if 'potential_savings' in route_df.columns:
-                route_savings = route_df['potential_savings'].sum()
+            if 'potential_savings' in route_cols:
+                route_savings = column_stat(route_efficiency_path, ROUTE_EFFICIENCY_COLUMNS, 'potential_savings', 'sum')
                 total_potential_savings += route_savings
-                result += f"   Potential savings: ${route_savings:,.2f}/month\n"
+                parts.append(f"   Potential savings: ${route_savings:,.2f}/month\n")
             
-            if 'optimization_suggestion' in route_df.columns:
-                suggestions = route_df[route_df['optimization_suggestion'].notna()]
-                if not suggestions.empty:
-                    result += f"\n   Top suggestions:\n"
-                    for _, route in suggestions.head(3).iterrows():
-                        result += f"   • Route {route.get('route_id', 'N/A')}: {route['optimization_suggestion']}"
+            if 'optimization_suggestion' in route_cols:
+                suggestions = np.flatnonzero(route_df['optimization_suggestion'].notna().to_numpy())
+                if suggestions.size:
+                    parts.append(f"\n   Top suggestions:\n")
+                    route_columns = ['route_id', 'optimization_suggestion', 'potential_savings']
+                    for route in iter_rows(route_df, route_columns, suggestions[:3]):
+                        parts.append(f"   • Route {route.get('route_id', 'N/A')}: {route['optimization_suggestion']}")
                         if 'potential_savings' in route:
-                            result += f" (Save: ${route['potential_savings']:.2f}/month)"
-                        result += "\n"
+                            parts.append(f" (Save: ${route['potential_savings']:.2f}/month)")
+                        parts.append("\n")
         
         # Supplier pricing analysis
-        supplier_pricing_path = scenario_path / "supplier_pricing.csv"
-        if supplier_pricing_path.exists():
-            supplier_df = pd.read_csv(supplier_pricing_path)
+        if supplier_df is not None:
+            supplier_cols = set(supplier_df.columns)
             
-            result += f"\n💼 Supplier Cost Optimization:\n"
-            result += f"   Suppliers compared: {len(supplier_df)}\n"
+            parts.append(f"\n💼 Supplier Cost Optimization:\n")
+            parts.append(f"   Suppliers compared: {len(supplier_df)}\n")
             
-            if 'potential_savings' in supplier_df.columns:
-                supplier_savings = supplier_df['potential_savings'].sum()
+            if 'potential_savings' in supplier_cols:
+                supplier_savings = column_stat(supplier_pricing_path, SUPPLIER_PRICING_COLUMNS, 'potential_savings', 'sum')
                 total_potential_savings += supplier_savings
-                result += f"   Potential savings: ${supplier_savings:,.2f}/month\n"
+                parts.append(f"   Potential savings: ${supplier_savings:,.2f}/month\n")
             
             # Find alternative suppliers with better pricing
-            if 'savings_vs_current' in supplier_df.columns:
-                better_options = supplier_df[supplier_df['savings_vs_current'] > 0]
-                if not better_options.empty:
-                    result += f"\n   Alternative suppliers with better pricing: {len(better_options)}\n"
-                    for _, supplier in better_options.head(3).iterrows():
-                        result += f"   • {supplier.get('supplier_name', 'N/A')}: "
-                        result += f"Save ${supplier.get('savings_vs_current', 0):.2f}/month\n"
+            if 'savings_vs_current' in supplier_cols:
+                better_options = np.flatnonzero(supplier_df['savings_vs_current'].to_numpy() > 0)
+                if better_options.size:
+                    parts.append(f"\n   Alternative suppliers with better pricing: {better_options.size}\n")
+                    for supplier in iter_rows(supplier_df, ['supplier_name', 'savings_vs_current'], better_options[:3]):
+                        parts.append(f"   • {supplier.get('supplier_name', 'N/A')}: ")
+                        parts.append(f"Save ${supplier.get('savings_vs_current', 0):.2f}/month\n")
         
         # Warehouse utilization analysis
-        warehouse_path = scenario_path / "warehouse_utilization.csv"
-        if warehouse_path.exists():
-            warehouse_df = pd.read_csv(warehouse_path)
+        if warehouse_df is not None:
+            warehouse_cols = set(warehouse_df.columns)
             
-            result += f"\n🏭 Warehouse Optimization:\n"
-            result += f"   Warehouses analyzed: {len(warehouse_df)}\n"
+            parts.append(f"\n🏭 Warehouse Optimization:\n")
+            parts.append(f"   Warehouses analyzed: {len(warehouse_df)}\n")
             
-            if 'utilization_pct' in warehouse_df.columns:
-                avg_utilization = warehouse_df['utilization_pct'].mean()
-                result += f"   Average utilization: {avg_utilization:.1f}%\n"
-                
-                # Identify under/over utilized warehouses
-                underutilized = warehouse_df[warehouse_df['utilization_pct'] < 60]
-                overutilized = warehouse_df[warehouse_df['utilization_pct'] > 90]
+            if 'utilization_pct' in warehouse_cols and not warehouse_df.empty:
+                # Mean and under/over utilized counts, computed once per file version
+                avg_utilization, underutilized, overutilized = column_stat(
+                    warehouse_path, WAREHOUSE_COLUMNS, 'utilization_pct', _utilization_summary
+                )
+                parts.append(f"   Average utilization: {avg_utilization:.1f}%\n")
                 
-                if not underutilized.empty:
-                    result += f"   ⚠️ Underutilized warehouses: {len(underutilized)}\n"
+                if underutilized:
+                    parts.append(f"   ⚠️ Underutilized warehouses: {underutilized}\n")
                 
-                if not overutilized.empty:
-                    result += f"   ⚠️ Overutilized warehouses: {len(overutilized)}\n"
+                if overutilized:
+                    parts.append(f"   ⚠️ Overutilized warehouses: {overutilized}\n")
             
-            if 'potential_savings' in warehouse_df.columns:
-                warehouse_savings = warehouse_df['potential_savings'].sum()
+            if 'potential_savings' in warehouse_cols:
+                warehouse_savings = column_stat(warehouse_path, WAREHOUSE_COLUMNS, 'potential_savings', 'sum')
                 total_potential_savings += warehouse_savings
-                result += f"   Potential savings: ${warehouse_savings:,.2f}/month\n"
+                parts.append(f"   Potential savings: ${warehouse_savings:,.2f}/month\n")
         
         # Summary
-        result += f"\n" + "="*40 + "\n"
-        result += f"💰 TOTAL POTENTIAL SAVINGS: ${total_potential_savings:,.2f}/month\n"
-        result += f"📅 Annual Savings Projection: ${total_potential_savings * 12:,.2f}\n"
+        parts.append(f"\n" + "="*40 + "\n")
+        parts.append(f"💰 TOTAL POTENTIAL SAVINGS: ${total_potential_savings:,.2f}/month\n")
+        parts.append(f"📅 Annual Savings Projection: ${total_potential_savings * 12:,.2f}\n")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         return f"Error identifying cost savings: {str(e)}"
@@ -2,15 +2,44 @@
 Distribution Handler Agent Tools
 """
 
-import pandas as pd
+import numpy as np
+from functools import lru_cache
 from pathlib import Path
 from typing import Annotated
 from langchain_core.tools import tool
 from config import MOCK_DATA_DIR
+from ._csv_cache import category_mask, column_stat, read_csv
+from ._files import file_exists
+from ._frames import format_counts, iter_rows
 
 
+# Columns the tools read from each scenario file (only these are parsed)
+DELIVERY_COLUMNS = (
+    "delivery_id", "status", "customer_id", "priority", "delay_minutes", "sla_breach",
+    "current_route", "destination", "time_window_end",
+)
+INCIDENT_COLUMNS = ("severity",)
+ALT_ROUTE_COLUMNS = (
+    "delivery_id", "route_id", "estimated_time", "distance_km", "feasibility_score", "traffic_conditions",
+)
+SLA_COLUMNS = ("customer_id", "sla_status", "customer_tier", "penalty_amount")
+
+# Files read through the CSV cache, with their column selections (see tools.warm_scenario)
+SCENARIO_FILES = {
+    "deliveries.csv": DELIVERY_COLUMNS,
+    "traffic_incidents.csv": INCIDENT_COLUMNS,
+    "alternative_routes.csv": ALT_ROUTE_COLUMNS,
+    "customer_sla.csv": SLA_COLUMNS,
+}
+
+DELAYED_STATUSES = ("DELAYED", "AT_RISK")
+HIGH_PRIORITIES = ("HIGH", "CRITICAL")
+CRITICAL_LEVELS = ("HIGH", "CRITICAL")
+
+
+@lru_cache(maxsize=16)
 def _get_scenario_path(scenario_dir: str) -> Path:
-    """Helper to get scenario directory path"""
+    """Helper to get scenario directory path (built once per scenario)"""
     return MOCK_DATA_DIR / scenario_dir
 
 
@@ -23,49 +52,53 @@ def detect_traffic_delays(scenario_dir: Annotated[str, "Scenario directory name"
     scenario_path = _get_scenario_path(scenario_dir)
     
     try:
-        deliveries_df = pd.read_csv(scenario_path / "deliveries.csv")
+        deliveries_path = scenario_path / "deliveries.csv"
+        deliveries_df = read_csv(deliveries_path, DELIVERY_COLUMNS)
+        deliveries_cols = set(deliveries_df.columns)
         
-        result = f"Traffic Delay Impact Analysis:\n"
-        result += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-        result += f"Total active deliveries: {len(deliveries_df)}\n"
+        parts = [f"Traffic Delay Impact Analysis:\n"]
+        parts.append(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
+        parts.append(f"Total active deliveries: {len(deliveries_df)}\n")
         
         # Check for delayed deliveries
-        if 'status' in deliveries_df.columns:
-            delayed = deliveries_df[deliveries_df['status'].isin(['DELAYED', 'AT_RISK'])]
+        if 'status' in deliveries_cols and not deliveries_df.empty:
+            delayed = np.flatnonzero(category_mask(deliveries_path, DELIVERY_COLUMNS, 'status', DELAYED_STATUSES))
             
-            if not delayed.empty:
-                result += f"\n⚠️ Delayed deliveries: {len(delayed)}\n\n"
+            if delayed.size:
+                parts.append(f"\n⚠️ Delayed deliveries: {delayed.size}\n\n")
                 
-                for _, delivery in delayed.iterrows():
-                    result += f"🚚 Delivery {delivery.get('delivery_id', 'N/A')}:\n"
-                    result += f"   Status: {delivery.get('status', 'N/A')}\n"
+                delivery_columns = ['delivery_id', 'status', 'customer_id', 'priority', 'delay_minutes', 'sla_breach']
+                for delivery in iter_rows(deliveries_df, delivery_columns, delayed):
+                    parts.append(f"🚚 Delivery {delivery.get('delivery_id', 'N/A')}:\n")
+                    parts.append(f"   Status: {delivery.get('status', 'N/A')}\n")
                     
                     if 'customer_id' in delivery:
-                        result += f"   Customer: {delivery['customer_id']}\n"
+                        parts.append(f"   Customer: {delivery['customer_id']}\n")
                     
                     if 'priority' in delivery:
-                        result += f"   Priority: {delivery['priority']}\n"
+                        parts.append(f"   Priority: {delivery['priority']}\n")
                     
                     if 'delay_minutes' in delivery:
-                        result += f"   Delay: {delivery['delay_minutes']} minutes\n"
+                        parts.append(f"   Delay: {delivery['delay_minutes']} minutes\n")
                     
                     if 'sla_breach' in delivery and delivery['sla_breach']:
-                        result += f"   🚨 SLA BREACH RISK\n"
+                        parts.append(f"   🚨 SLA BREACH RISK\n")
                     
-                    result += "\n"
+                    parts.append("\n")
         
         # Check traffic incidents
         incidents_path = scenario_path / "traffic_incidents.csv"
-        if incidents_path.exists():
-            incidents_df = pd.read_csv(incidents_path)
-            result += f"Active traffic incidents: {len(incidents_df)}\n"
+        if file_exists(incidents_path):
+            incidents_df = read_csv(incidents_path, INCIDENT_COLUMNS)
+            incidents_cols = set(incidents_df.columns)
+            parts.append(f"Active traffic incidents: {len(incidents_df)}\n")
             
-            if 'severity' in incidents_df.columns:
-                critical = incidents_df[incidents_df['severity'].isin(['HIGH', 'CRITICAL'])]
-                if not critical.empty:
-                    result += f"Critical incidents: {len(critical)}\n"
+            if 'severity' in incidents_cols and not incidents_df.empty:
+                critical = int(category_mask(incidents_path, INCIDENT_COLUMNS, 'severity', CRITICAL_LEVELS).sum())
+                if critical:
+                    parts.append(f"Critical incidents: {critical}\n")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         return f"Error detecting traffic delays: {str(e)}"
@@ -83,50 +116,53 @@ def reroute_delivery(
     scenario_path = _get_scenario_path(scenario_dir)
     
     try:
-        deliveries_df = pd.read_csv(scenario_path / "deliveries.csv")
+        deliveries_df = read_csv(scenario_path / "deliveries.csv", DELIVERY_COLUMNS)
         
         # Find the delivery
-        delivery = deliveries_df[deliveries_df['delivery_id'] == delivery_id]
-        if delivery.empty:
+        matches = np.flatnonzero(deliveries_df['delivery_id'].to_numpy() == delivery_id)
+        if not matches.size:
             return f"Delivery {delivery_id} not found"
         
-        delivery_info = delivery.iloc[0]
+        delivery_info = next(iter_rows(deliveries_df, ['status', 'current_route', 'destination'], matches[:1]))
         
-        result = f"Rerouting Options for Delivery {delivery_id}:\n"
-        result += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-        result += f"Current Status: {delivery_info.get('status', 'N/A')}\n"
+        parts = [f"Rerouting Options for Delivery {delivery_id}:\n"]
+        parts.append(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
+        parts.append(f"Current Status: {delivery_info.get('status', 'N/A')}\n")
         
         if 'current_route' in delivery_info:
-            result += f"Current Route: {delivery_info['current_route']}\n"
+            parts.append(f"Current Route: {delivery_info['current_route']}\n")
         
         if 'destination' in delivery_info:
-            result += f"Destination: {delivery_info['destination']}\n"
+            parts.append(f"Destination: {delivery_info['destination']}\n")
         
         # Check for alternative routes
         alt_routes_path = scenario_path / "alternative_routes.csv"
-        if alt_routes_path.exists():
-            alt_routes_df = pd.read_csv(alt_routes_path)
+        if file_exists(alt_routes_path):
+            alt_routes_df = read_csv(alt_routes_path, ALT_ROUTE_COLUMNS)
+            alt_routes_cols = set(alt_routes_df.columns)
             
             # Filter for this delivery if possible
-            if 'delivery_id' in alt_routes_df.columns:
-                relevant_routes = alt_routes_df[alt_routes_df['delivery_id'] == delivery_id]
+            if 'delivery_id' in alt_routes_cols:
+                relevant_routes = np.flatnonzero(alt_routes_df['delivery_id'].to_numpy() == delivery_id)
             else:
-                relevant_routes = alt_routes_df
+                relevant_routes = np.arange(len(alt_routes_df))
             
-            if not relevant_routes.empty:
-                result += f"\nAvailable Alternative Routes: {len(relevant_routes)}\n\n"
+            if relevant_routes.size:
+                parts.append(f"\nAvailable Alternative Routes: {relevant_routes.size}\n\n")
                 
-                for idx, route in relevant_routes.iterrows():
-                    result += f"🛣️ Option {idx + 1}:\n"
+                route_columns = ['route_id', 'estimated_time', 'distance_km', 'feasibility_score', 'traffic_conditions']
+                routes = iter_rows(alt_routes_df, route_columns, relevant_routes)
+                for idx, route in zip(alt_routes_df.index.to_numpy()[relevant_routes], routes):
+                    parts.append(f"🛣️ Option {idx + 1}:\n")
                     
                     if 'route_id' in route:
-                        result += f"   Route ID: {route['route_id']}\n"
+                        parts.append(f"   Route ID: {route['route_id']}\n")
                     
                     if 'estimated_time' in route:
-                        result += f"   Estimated Time: {route['estimated_time']} min\n"
+                        parts.append(f"   Estimated Time: {route['estimated_time']} min\n")
                     
                     if 'distance_km' in route:
-                        result += f"   Distance: {route['distance_km']} km\n"
+                        parts.append(f"   Distance: {route['distance_km']} km\n")
                     
                     if 'feasibility_score' in route:
                         score = route['feasibility_score']
@@ -136,18 +172,18 @@ def reroute_delivery(
                             feasibility = "⚡ Medium"
                         else:
                             feasibility = "⚠️ Low"
-                        result += f"   Feasibility: {feasibility} ({score:.2f})\n"
+                        parts.append(f"   Feasibility: {feasibility} ({score:.2f})\n")
                     
                     if 'traffic_conditions' in route:
-                        result += f"   Traffic: {route['traffic_conditions']}\n"
+                        parts.append(f"   Traffic: {route['traffic_conditions']}\n")
                     
-                    result += "\n"
+                    parts.append("\n")
             else:
-                result += f"\n⚠️ No alternative routes available for this delivery\n"
+                parts.append(f"\n⚠️ No alternative routes available for this delivery\n")
         else:
-            result += f"\n⚠️ No alternative routes data available\n"
+            parts.append(f"\n⚠️ No alternative routes data available\n")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         return f"Error finding alternative routes: {str(e)}"
@@ -162,61 +198,65 @@ def get_upcoming_deliveries(scenario_dir: Annotated[str, "Scenario directory nam
     scenario_path = _get_scenario_path(scenario_dir)
     
     try:
-        deliveries_df = pd.read_csv(scenario_path / "deliveries.csv")
+        deliveries_path = scenario_path / "deliveries.csv"
+        deliveries_df = read_csv(deliveries_path, DELIVERY_COLUMNS)
+        deliveries_cols = set(deliveries_df.columns)
         
-        result = f"Upcoming Deliveries Overview:\n"
-        result += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-        result += f"Total deliveries: {len(deliveries_df)}\n"
+        parts = [f"Upcoming Deliveries Overview:\n"]
+        parts.append(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
+        parts.append(f"Total deliveries: {len(deliveries_df)}\n")
         
-        if 'status' in deliveries_df.columns:
-            status_counts = deliveries_df['status'].value_counts()
-            result += f"\nDelivery Status:\n{status_counts.to_string()}\n"
+        if 'status' in deliveries_cols and not deliveries_df.empty:
+            status_counts = column_stat(deliveries_path, DELIVERY_COLUMNS, 'status', 'value_counts')
+            parts.append(f"\nDelivery Status:\n{format_counts(status_counts)}\n")
         
         # Priority deliveries
-        if 'priority' in deliveries_df.columns:
-            high_priority = deliveries_df[deliveries_df['priority'].isin(['HIGH', 'CRITICAL'])]
+        if 'priority' in deliveries_cols and not deliveries_df.empty:
+            high_priority = np.flatnonzero(category_mask(deliveries_path, DELIVERY_COLUMNS, 'priority', HIGH_PRIORITIES))
             
-            if not high_priority.empty:
-                result += f"\n🎯 High Priority Deliveries: {len(high_priority)}\n\n"
+            if high_priority.size:
+                parts.append(f"\n🎯 High Priority Deliveries: {high_priority.size}\n\n")
                 
-                for _, delivery in high_priority.head(10).iterrows():
-                    result += f"📦 {delivery.get('delivery_id', 'N/A')}: "
-                    result += f"{delivery.get('priority', 'N/A')} priority, "
-                    result += f"Status: {delivery.get('status', 'N/A')}"
+                delivery_columns = ['delivery_id', 'priority', 'status', 'time_window_end', 'sla_breach']
+                for delivery in iter_rows(deliveries_df, delivery_columns, high_priority[:10]):
+                    parts.append(f"📦 {delivery.get('delivery_id', 'N/A')}: ")
+                    parts.append(f"{delivery.get('priority', 'N/A')} priority, ")
+                    parts.append(f"Status: {delivery.get('status', 'N/A')}")
                     
                     if 'time_window_end' in delivery:
-                        result += f", Due: {delivery['time_window_end']}"
+                        parts.append(f", Due: {delivery['time_window_end']}")
                     
                     if 'sla_breach' in delivery and delivery['sla_breach']:
-                        result += " 🚨 SLA BREACH"
+                        parts.append(" 🚨 SLA BREACH")
                     
-                    result += "\n"
+                    parts.append("\n")
         
         # SLA analysis
         sla_path = scenario_path / "customer_sla.csv"
-        if sla_path.exists():
-            sla_df = pd.read_csv(sla_path)
+        if file_exists(sla_path):
+            sla_df = read_csv(sla_path, SLA_COLUMNS)
+            sla_cols = set(sla_df.columns)
             
-            result += f"\n📋 Customer SLA Summary:\n"
-            result += f"Customers tracked: {len(sla_df)}\n"
+            parts.append(f"\n📋 Customer SLA Summary:\n")
+            parts.append(f"Customers tracked: {len(sla_df)}\n")
             
-            if 'sla_status' in sla_df.columns:
-                breaches = sla_df[sla_df['sla_status'] == 'BREACH']
-                if not breaches.empty:
-                    result += f"\n🚨 SLA Breaches: {len(breaches)}\n"
+            if 'sla_status' in sla_cols and not sla_df.empty:
+                breaches = np.flatnonzero(category_mask(sla_path, SLA_COLUMNS, 'sla_status', ('BREACH',)))
+                if breaches.size:
+                    parts.append(f"\n🚨 SLA Breaches: {breaches.size}\n")
                     
-                    for _, customer in breaches.iterrows():
-                        result += f"   • Customer {customer.get('customer_id', 'N/A')}: "
+                    for customer in iter_rows(sla_df, ['customer_id', 'customer_tier', 'penalty_amount'], breaches):
+                        parts.append(f"   • Customer {customer.get('customer_id', 'N/A')}: ")
                         
                         if 'customer_tier' in customer:
-                            result += f"{customer['customer_tier']} tier, "
+                            parts.append(f"{customer['customer_tier']} tier, ")
                         
                         if 'penalty_amount' in customer:
-                            result += f"Penalty: ${customer['penalty_amount']}"
+                            parts.append(f"Penalty: ${customer['penalty_amount']}")
                         
-                        result += "\n"
+                        parts.append("\n")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         return f"Error getting upcoming deliveries: {str(e)}"
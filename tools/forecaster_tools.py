@@ -2,18 +2,142 @@
 Demand Forecaster Agent Tools
 """
 
-import pandas as pd
+import numpy as np
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated, Any, Dict, List, Optional, Tuple
 from langchain_core.tools import tool
 from config import MOCK_DATA_DIR
+from ._csv_cache import column_stat, read_csv
+from ._files import file_exists
+from ._frames import iter_rows
+from ._kernels import above, top_k
 
+if TYPE_CHECKING:
+    import pandas as pd
 
+
+# Columns the tools read from each scenario file (only these are parsed)
+FORECAST_COLUMNS = (
+    "product_id", "current_demand", "predicted_demand", "predicted_demand_change_pct",
+    "demand_change_pct", "confidence", "spike_reason", "forecast_horizon_days",
+)
+HISTORICAL_COLUMNS = ("date", "product_id", "demand")
+
+# Files read through the CSV cache, with their column selections (see tools.warm_scenario).
+# Historical demand is left out: large history files are streamed instead of cached
+SCENARIO_FILES = {
+    "demand_forecast.csv": FORECAST_COLUMNS,
+}
+
+# Demand change columns, in order of preference
+CHANGE_COLUMNS = ("predicted_demand_change_pct", "demand_change_pct")
+
+# Files at least this large are scanned with polars when it is installed (filters and
+# projections run inside the scan), or else historical files are streamed in chunks
+# of STREAM_CHUNK_ROWS rows; smaller files go through the parsed-CSV cache
+STREAM_MIN_BYTES = 64 * 1024 * 1024
+STREAM_CHUNK_ROWS = 200_000
+
+# polars is optional and slow to import, so it is only loaded for the first large file
+HAVE_POLARS = find_spec("polars") is not None
+
+# Strings pandas.read_csv reads as missing values; polars scans are given the same list
+_NA_STRINGS = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+# Stands in for a missing product id as a dict key (NaN never equals itself)
+_MISSING = object()
+
+
+@lru_cache(maxsize=16)
 def _get_scenario_path(scenario_dir: str) -> Path:
-    """Helper to get scenario directory path"""
+    """Helper to get scenario directory path (built once per scenario)"""
     return MOCK_DATA_DIR / scenario_dir
 
 
+def _change_column(columns) -> Optional[str]:
+    """The demand change column a forecast has (the predicted one first), or None."""
+    return next((col for col in CHANGE_COLUMNS if col in columns), None)
+
+
+def _scan_csv(path: Path, columns: Tuple[str, ...]) -> Tuple[Any, List[str]]:
+    """
+    Lazy polars scan of a CSV and which of the given columns it has.
+    
+    Queries on the scan only read the columns they use (projection pushdown).
+    """
+    import polars as pl
+    
+    # Infer the column types once; a later value that does not fit makes the query
+    # raise, and the caller falls back to pandas
+    schema = pl.scan_csv(path, null_values=_NA_STRINGS, infer_schema_length=10_000).collect_schema()
+    scan = pl.scan_csv(path, null_values=_NA_STRINGS, schema=schema)
+    # pandas skips blank lines, which polars reads as rows of nulls
+    scan = scan.filter(~pl.all_horizontal(pl.all().is_null()))
+    present = [col for col in schema.names() if col in columns]
+    return scan, present
+
+
+def _scan_spikes(forecast_path: Path, product_id: Optional[str]) -> Optional[Tuple["pd.DataFrame", np.ndarray]]:
+    """polars version of _find_spikes: only the spike rows are materialized."""
+    import polars as pl
+    
+    scan, columns = _scan_csv(forecast_path, FORECAST_COLUMNS)
+    if product_id:
+        if scan.collect_schema()['product_id'] != pl.String:
+            # A numeric id column never equals the requested (string) id
+            return None
+        scan = scan.filter(pl.col('product_id') == product_id)
+    
+    change_col = _change_column(columns)
+    spikes = scan.filter(pl.col(change_col) > 20) if change_col else scan
+    
+    matched, spikes = pl.collect_all([scan.select(pl.len()), spikes.select(columns)])
+    if product_id and not matched.item():
+        return None
+    spike_df = spikes.to_pandas()
+    return spike_df, np.arange(len(spike_df))
+
+
+def _find_spikes(forecast_path: Path, product_id: Optional[str]) -> Optional[Tuple["pd.DataFrame", np.ndarray]]:
+    """
+    Find the forecast rows with a predicted demand increase above 20%.
+    
+    Args:
+        forecast_path: Path to demand_forecast.csv
+        product_id: Only consider this product (None = all products)
+    
+    Returns:
+        (frame, positions of the spike rows in it), or None if the product has no rows.
+        Without a change column every (product) row counts as a spike.
+    """
+    if HAVE_POLARS and forecast_path.stat().st_size >= STREAM_MIN_BYTES:
+        try:
+            return _scan_spikes(forecast_path, product_id)
+        except Exception:
+            pass  # Unsupported by the polars reader (e.g. duplicate headers): use pandas
+    
+    forecast_df = read_csv(forecast_path, FORECAST_COLUMNS)
+    forecast_cols = set(forecast_df.columns)
+    
+    # Rows are selected by position; no filtered frames are built
+    if product_id:
+        rows = np.flatnonzero(forecast_df['product_id'].to_numpy() == product_id)
+        if not rows.size:
+            return None
+    else:
+        rows = np.arange(len(forecast_df))
+    
+    # Identify significant spikes (e.g., >20% increase)
+    change_col = _change_column(forecast_cols)
+    spikes = rows[above(forecast_df[change_col].to_numpy()[rows], 20)] if change_col else rows
+    return forecast_df, spikes
+
+
 @tool
 def predict_demand_spike(
     scenario_dir: Annotated[str, "Scenario directory name"],
@@ -27,41 +151,49 @@ def predict_demand_spike(
     
     try:
         forecast_path = scenario_path / "demand_forecast.csv"
-        if not forecast_path.exists():
+        if not file_exists(forecast_path):
             return "No demand forecast data available for this scenario"
         
-        forecast_df = pd.read_csv(forecast_path)
+        found = _find_spikes(forecast_path, product_id)
+        if found is None:
+            return f"No forecast data for product {product_id}"
+        forecast_df, spikes = found
         
-        if product_id:
-            forecast_df = forecast_df[forecast_df['product_id'] == product_id]
-            if forecast_df.empty:
-                return f"No forecast data for product {product_id}"
+        parts = [f"Demand Spike Predictions:\n"]
+        parts.append(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
         
-        result = f"Demand Spike Predictions:\n"
-        result += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-        
-        # Identify significant spikes (e.g., >20% increase)
-        if 'predicted_demand_change_pct' in forecast_df.columns:
-            spikes = forecast_df[forecast_df['predicted_demand_change_pct'] > 20]
-        elif 'demand_change_pct' in forecast_df.columns:
-            spikes = forecast_df[forecast_df['demand_change_pct'] > 20]
-        else:
-            spikes = forecast_df
-        
-        if not spikes.empty:
-            result += f"Products with significant demand increases: {len(spikes)}\n\n"
+        if spikes.size:
+            parts.append(f"Products with significant demand increases: {spikes.size}\n\n")
             
-            for _, item in spikes.iterrows():
-                product_id = item.get('product_id', 'N/A')
-                result += f"📈 Product {product_id}:\n"
-                
-                if 'current_demand' in item:
-                    result += f"   Current Demand: {item['current_demand']:.0f} units/day\n"
-                
-                if 'predicted_demand' in item:
-                    result += f"   Predicted Demand: {item['predicted_demand']:.0f} units/day\n"
+            forecast_cols = set(forecast_df.columns)
+            
+            def column_lines(column: str, template: str) -> Optional[List[str]]:
+                """One formatted line per spike row (None if the column is missing)."""
+                if column not in forecast_cols:
+                    return None
+                return [template.format(value) for value in forecast_df[column].to_numpy()[spikes].tolist()]
+            
+            # Each line is formatted per column in one pass over plain Python values
+            # (faster to format than numpy scalars); the loop only picks the pieces
+            headers = column_lines('product_id', "📈 Product {}:\n") or ["📈 Product N/A:\n"] * spikes.size
+            leading = [
+                column_lines('current_demand', "   Current Demand: {:.0f} units/day\n"),
+                column_lines('predicted_demand', "   Predicted Demand: {:.0f} units/day\n"),
+            ]
+            trailing = [
+                column_lines('confidence', "   Confidence: {:.1%}\n"),
+                column_lines('spike_reason', "   Reason: {}\n"),
+                column_lines('forecast_horizon_days', "   Timeframe: {} days\n"),
+            ]
+            leading = [lines for lines in leading if lines is not None]
+            trailing = [lines for lines in trailing if lines is not None]
+            change_col = _change_column(forecast_cols)
+            changes = forecast_df[change_col].to_numpy()[spikes].tolist() if change_col else [0] * spikes.size
+            
+            for j, change_pct in enumerate(changes):
+                parts.append(headers[j])
+                parts.extend(lines[j] for lines in leading)
                 
-                change_pct = item.get('predicted_demand_change_pct', item.get('demand_change_pct', 0))
                 if change_pct >= 100:
                     urgency = "🚨 CRITICAL"
                 elif change_pct >= 50:
@@ -69,22 +201,13 @@ def predict_demand_spike(
                 else:
                     urgency = "⚡ MODERATE"
                 
-                result += f"   Increase: {change_pct:+.1f}% {urgency}\n"
-                
-                if 'confidence' in item:
-                    result += f"   Confidence: {item['confidence']:.1%}\n"
-                
-                if 'spike_reason' in item:
-                    result += f"   Reason: {item['spike_reason']}\n"
-                
-                if 'forecast_horizon_days' in item:
-                    result += f"   Timeframe: {item['forecast_horizon_days']} days\n"
-                
-                result += "\n"
+                parts.append(f"   Increase: {change_pct:+.1f}% {urgency}\n")
+                parts.extend(lines[j] for lines in trailing)
+                parts.append("\n")
         else:
-            result += "No significant demand spikes predicted\n"
+            parts.append("No significant demand spikes predicted\n")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         return f"Error predicting demand spike: {str(e)}"
@@ -100,60 +223,242 @@ def get_demand_forecast(scenario_dir: Annotated[str, "Scenario directory name"])
     
     try:
         forecast_path = scenario_path / "demand_forecast.csv"
-        if not forecast_path.exists():
+        if not file_exists(forecast_path):
             return "No demand forecast data available for this scenario"
         
-        forecast_df = pd.read_csv(forecast_path)
+        forecast_df = read_csv(forecast_path, FORECAST_COLUMNS)
+        forecast_cols = set(forecast_df.columns)
+        change_col = _change_column(forecast_cols)
+        
+        parts = [f"Demand Forecast Overview:\n"]
+        parts.append(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
+        
+        if forecast_df.empty:
+            parts.append("No records in demand_forecast.csv\n")
+            return "".join(parts)
         
-        result = f"Demand Forecast Overview:\n"
-        result += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-        result += f"Products tracked: {len(forecast_df)}\n"
+        parts.append(f"Products tracked: {len(forecast_df)}\n")
         
-        if 'predicted_demand' in forecast_df.columns:
-            total_predicted = forecast_df['predicted_demand'].sum()
-            result += f"Total predicted demand: {total_predicted:.0f} units\n"
+        if 'predicted_demand' in forecast_cols:
+            total_predicted = column_stat(forecast_path, FORECAST_COLUMNS, 'predicted_demand', 'sum')
+            parts.append(f"Total predicted demand: {total_predicted:.0f} units\n")
         
-        if 'current_demand' in forecast_df.columns:
-            total_current = forecast_df['current_demand'].sum()
-            result += f"Current demand: {total_current:.0f} units\n"
+        if 'current_demand' in forecast_cols:
+            total_current = column_stat(forecast_path, FORECAST_COLUMNS, 'current_demand', 'sum')
+            parts.append(f"Current demand: {total_current:.0f} units\n")
             
-            if 'predicted_demand' in forecast_df.columns:
+            if 'predicted_demand' in forecast_cols:
                 overall_change = ((total_predicted - total_current) / total_current * 100)
-                result += f"Overall demand change: {overall_change:+.1f}%\n"
+                parts.append(f"Overall demand change: {overall_change:+.1f}%\n")
         
         # Average confidence
-        if 'confidence' in forecast_df.columns:
-            avg_confidence = forecast_df['confidence'].mean()
-            result += f"Average forecast confidence: {avg_confidence:.1%}\n"
+        if 'confidence' in forecast_cols:
+            avg_confidence = column_stat(forecast_path, FORECAST_COLUMNS, 'confidence', 'mean')
+            parts.append(f"Average forecast confidence: {avg_confidence:.1%}\n")
         
         # Categories of change
-        if 'predicted_demand_change_pct' in forecast_df.columns or 'demand_change_pct' in forecast_df.columns:
-            change_col = 'predicted_demand_change_pct' if 'predicted_demand_change_pct' in forecast_df.columns else 'demand_change_pct'
+        if change_col:
+            change = forecast_df[change_col].to_numpy()
+            increasing = int((change > 10).sum())
+            stable = int(((change >= -10) & (change <= 10)).sum())
+            decreasing = int((change < -10).sum())
             
-            increasing = forecast_df[forecast_df[change_col] > 10]
-            stable = forecast_df[(forecast_df[change_col] >= -10) & (forecast_df[change_col] <= 10)]
-            decreasing = forecast_df[forecast_df[change_col] < -10]
-            
-            result += f"\n📊 Forecast Distribution:\n"
-            result += f"   Increasing demand: {len(increasing)} products\n"
-            result += f"   Stable demand: {len(stable)} products\n"
-            result += f"   Decreasing demand: {len(decreasing)} products\n"
+            parts.append(f"\n📊 Forecast Distribution:\n")
+            parts.append(f"   Increasing demand: {increasing} products\n")
+            parts.append(f"   Stable demand: {stable} products\n")
+            parts.append(f"   Decreasing demand: {decreasing} products\n")
         
         # Top movers
-        if 'predicted_demand_change_pct' in forecast_df.columns or 'demand_change_pct' in forecast_df.columns:
-            change_col = 'predicted_demand_change_pct' if 'predicted_demand_change_pct' in forecast_df.columns else 'demand_change_pct'
-            top_gainers = forecast_df.nlargest(5, change_col)
+        if change_col:
+            top_gainers = top_k(forecast_df[change_col].to_numpy(), 5)
             
-            result += f"\n🔝 Top 5 Demand Increases:\n"
-            for _, item in top_gainers.iterrows():
-                result += f"   • {item.get('product_id', 'N/A')}: {item[change_col]:+.1f}%\n"
+            parts.append(f"\n🔝 Top 5 Demand Increases:\n")
+            for item in iter_rows(forecast_df, ['product_id', change_col], top_gainers):
+                parts.append(f"   • {item.get('product_id', 'N/A')}: {item[change_col]:+.1f}%\n")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         return f"Error getting demand forecast: {str(e)}"
 
 
+def _summarize_history(historical_df: "pd.DataFrame") -> Dict[str, Any]:
+    """Figures for analyze_historical_trends from a fully loaded historical demand frame."""
+    historical_cols = set(historical_df.columns)
+    summary = {
+        "columns": historical_cols,
+        "rows": len(historical_df),
+        "stats": None,
+    }
+    if 'date' in historical_cols:
+        summary["date_min"] = historical_df['date'].min()
+        summary["date_max"] = historical_df['date'].max()
+    
+    if 'product_id' in historical_cols:
+        products = historical_df['product_id'].unique()
+        summary["product_count"] = len(products)
+        
+        if 'demand' in historical_cols:
+            # Stats for the first 10 products in one grouped pass (rows keep
+            # their order, so first/last are the earliest/latest readings)
+            shown = historical_df[historical_df['product_id'].isin(products[:10])]
+            stats = shown.groupby('product_id', sort=False)['demand'].agg(['size', 'mean', 'std'])
+            stats['first'] = shown.drop_duplicates('product_id', keep='first').set_index('product_id')['demand']
+            stats['last'] = shown.drop_duplicates('product_id', keep='last').set_index('product_id')['demand']
+            summary["stats"] = stats
+    elif 'demand' in historical_cols:
+        summary["demand_sum"] = historical_df['demand'].sum()
+        summary["demand_mean"] = historical_df['demand'].mean()
+    return summary
+
+
+def _summarize_history_chunks(historical_path: Path) -> Dict[str, Any]:
+    """
+    Figures for analyze_historical_trends, streamed from a large historical demand file.
+    
+    The file is read STREAM_CHUNK_ROWS rows at a time, keeping running
+    per-product statistics (row count, first/last reading, the demand sum and
+    the sum of squared deviations, merged across chunks with Chan's update) for
+    the first 10 products only, so memory stays bounded by the chunk size.
+    """
+    import pandas as pd
+
+    wanted = frozenset(HISTORICAL_COLUMNS)
+    columns = set()
+    rows = 0
+    date_min = date_max = np.nan
+    seen = set()  # every product id so far (NaN as _MISSING)
+    running = {}  # product id -> [size, n, total, m2, first, last] for the shown products
+    demand_sum, demand_n = 0.0, 0
+    
+    reader = pd.read_csv(
+        historical_path, engine="c", usecols=lambda col: col in wanted, chunksize=STREAM_CHUNK_ROWS,
+    )
+    for chunk in reader:
+        columns.update(chunk.columns)
+        rows += len(chunk)
+        
+        if 'date' in chunk.columns:
+            dates = chunk['date'].dropna()
+            if len(dates):
+                low, high = dates.min(), dates.max()
+                date_min = low if pd.isna(date_min) or low < date_min else date_min
+                date_max = high if pd.isna(date_max) or high > date_max else date_max
+        
+        if 'product_id' not in chunk.columns:
+            if 'demand' in chunk.columns:
+                demand_sum += chunk['demand'].sum()
+                demand_n += int(chunk['demand'].count())
+            continue
+        
+        for product in chunk['product_id'].unique():
+            key = _MISSING if pd.isna(product) else product
+            if key not in seen:
+                seen.add(key)
+                # A missing id takes one of the 10 slots but, as with groupby, gets no stats
+                if len(seen) <= 10 and key is not _MISSING:
+                    running[product] = [0, 0, 0.0, 0.0, np.nan, np.nan]
+        
+        if 'demand' not in chunk.columns or not running:
+            continue
+        shown = chunk[chunk['product_id'].isin(list(running))]
+        if shown.empty:
+            continue
+        grouped = shown.groupby('product_id', sort=False)['demand']
+        part = grouped.agg(['size', 'count', 'sum'])
+        part['m2'] = grouped.var(ddof=0) * part['count']
+        part['first'] = shown.drop_duplicates('product_id', keep='first').set_index('product_id')['demand']
+        part['last'] = shown.drop_duplicates('product_id', keep='last').set_index('product_id')['demand']
+        
+        for product, size, n_b, sum_b, m2_b, first, last in zip(
+            part.index, part['size'], part['count'], part['sum'], part['m2'], part['first'], part['last'],
+        ):
+            acc = running[product]
+            if acc[0] == 0:
+                acc[4] = first
+            acc[0] += size
+            acc[5] = last
+            if n_b:
+                n_a = acc[1]
+                if n_a:
+                    delta = sum_b / n_b - acc[2] / n_a
+                    acc[3] += m2_b + delta * delta * n_a * n_b / (n_a + n_b)
+                else:
+                    acc[3] = m2_b
+                acc[1] += n_b
+                acc[2] += sum_b
+    
+    summary = {"columns": columns, "rows": rows, "stats": None}
+    if 'date' in columns:
+        summary["date_min"], summary["date_max"] = date_min, date_max
+    if 'product_id' in columns:
+        summary["product_count"] = len(seen)
+        if 'demand' in columns:
+            summary["stats"] = pd.DataFrame(
+                {
+                    'size': [acc[0] for acc in running.values()],
+                    'mean': [acc[2] / acc[1] if acc[1] else np.nan for acc in running.values()],
+                    'std': [np.sqrt(acc[3] / (acc[1] - 1)) if acc[1] > 1 else np.nan for acc in running.values()],
+                    'first': [acc[4] for acc in running.values()],
+                    'last': [acc[5] for acc in running.values()],
+                },
+                index=list(running),
+            )
+    elif 'demand' in columns:
+        summary["demand_sum"] = demand_sum
+        summary["demand_mean"] = demand_sum / demand_n if demand_n else np.nan
+    return summary
+
+
+def _scan_history(historical_path: Path) -> Dict[str, Any]:
+    """
+    Figures for analyze_historical_trends, computed by a polars scan of a large file.
+    
+    The first 10 products are found first; the per-product stats then group only
+    their rows, and only the date, product_id and demand columns are read.
+    """
+    import polars as pl
+    
+    scan, columns = _scan_csv(historical_path, HISTORICAL_COLUMNS)
+    queries = [scan.select(pl.len())]
+    if 'date' in columns:
+        queries.append(scan.select(pl.col('date').min().alias('min'), pl.col('date').max().alias('max')))
+    if 'product_id' in columns:
+        queries.append(scan.select(pl.col('product_id').n_unique()))
+        queries.append(scan.select(pl.col('product_id').unique(maintain_order=True).head(10)))
+    elif 'demand' in columns:
+        queries.append(scan.select(pl.col('demand').sum().alias('sum'), pl.col('demand').mean().alias('mean')))
+    results = iter(pl.collect_all(queries))
+    
+    summary = {"columns": set(columns), "rows": next(results).item(), "stats": None}
+    if 'date' in columns:
+        dates = next(results).row(0)
+        summary["date_min"], summary["date_max"] = (np.nan if date is None else date for date in dates)
+    
+    if 'product_id' in columns:
+        summary["product_count"] = next(results).item()
+        # A missing id takes one of the 10 slots but, as with groupby, gets no stats
+        shown = [product for product in next(results).to_series() if product is not None]
+        if 'demand' in columns:
+            demand = pl.col('demand')
+            stats = (
+                scan.filter(pl.col('product_id').is_in(shown))
+                .group_by('product_id', maintain_order=True)
+                .agg(
+                    pl.len().alias('size'), demand.mean().alias('mean'), demand.std().alias('std'),
+                    demand.first().alias('first'), demand.last().alias('last'),
+                )
+                .collect()
+                .to_pandas()
+            )
+            summary["stats"] = stats.set_index('product_id')
+    elif 'demand' in columns:
+        total, mean = next(results).row(0)
+        summary["demand_sum"] = total
+        summary["demand_mean"] = np.nan if mean is None else mean
+    return summary
+
+
 @tool
 def analyze_historical_trends(scenario_dir: Annotated[str, "Scenario directory name"]) -> str:
     """
@@ -164,36 +469,55 @@ def analyze_historical_trends(scenario_dir: Annotated[str, "Scenario directory n
     
     try:
         historical_path = scenario_path / "historical_demand.csv"
-        if not historical_path.exists():
+        if not file_exists(historical_path):
             return "No historical demand data available for this scenario"
         
-        historical_df = pd.read_csv(historical_path)
+        # Large histories are scanned or aggregated chunk by chunk instead of loaded whole
+        summary = None
+        if historical_path.stat().st_size >= STREAM_MIN_BYTES:
+            if HAVE_POLARS:
+                try:
+                    summary = _scan_history(historical_path)
+                except Exception:
+                    pass  # Unsupported by the polars reader (e.g. duplicate headers): stream with pandas
+            if summary is None:
+                summary = _summarize_history_chunks(historical_path)
+        else:
+            summary = _summarize_history(read_csv(historical_path, HISTORICAL_COLUMNS))
+        columns = summary["columns"]
+        
+        parts = [f"Historical Demand Trend Analysis:\n"]
+        parts.append(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
         
-        result = f"Historical Demand Trend Analysis:\n"
-        result += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+        if summary["rows"] == 0:
+            parts.append("No records in historical_demand.csv\n")
+            return "".join(parts)
         
-        if 'date' in historical_df.columns:
-            result += f"Data points: {len(historical_df)}\n"
-            result += f"Period: {historical_df['date'].min()} to {historical_df['date'].max()}\n"
+        if 'date' in columns:
+            parts.append(f"Data points: {summary['rows']}\n")
+            parts.append(f"Period: {summary['date_min']} to {summary['date_max']}\n")
         
         # Analyze trends by product
-        if 'product_id' in historical_df.columns:
-            products = historical_df['product_id'].unique()
-            result += f"Products tracked: {len(products)}\n\n"
+        if 'product_id' in columns:
+            parts.append(f"Products tracked: {summary['product_count']}\n\n")
             
-            for product in products[:10]:  # Limit to first 10 products
-                product_data = historical_df[historical_df['product_id'] == product]
+            stats = summary["stats"]
+            if stats is not None:
+                first = stats['first'].to_numpy()
+                has_trend = first > 0
+                with np.errstate(divide='ignore', invalid='ignore'):
+                    trends = np.where(has_trend, (stats['last'].to_numpy() - first) / first * 100, np.nan)
                 
-                if 'demand' in product_data.columns and len(product_data) > 1:
-                    result += f"📊 Product {product}:\n"
+                for product, count, avg_demand, volatility, show_trend, trend in zip(
+                    stats.index, stats['size'].to_numpy(), stats['mean'].to_numpy(),
+                    stats['std'].to_numpy(), has_trend, trends,
+                ):
+                    if count <= 1:
+                        continue
                     
-                    # Calculate trend
-                    first_demand = product_data['demand'].iloc[0]
-                    last_demand = product_data['demand'].iloc[-1]
-                    avg_demand = product_data['demand'].mean()
+                    parts.append(f"📊 Product {product}:\n")
                     
-                    if first_demand > 0:
-                        trend = ((last_demand - first_demand) / first_demand * 100)
+                    if show_trend:
                         if trend > 10:
                             trend_indicator = "📈 Upward"
                         elif trend < -10:
@@ -201,23 +525,22 @@ def analyze_historical_trends(scenario_dir: Annotated[str, "Scenario directory n
                         else:
                             trend_indicator = "➡️ Stable"
                         
-                        result += f"   Trend: {trend_indicator} ({trend:+.1f}%)\n"
+                        parts.append(f"   Trend: {trend_indicator} ({trend:+.1f}%)\n")
                     
-                    result += f"   Average Demand: {avg_demand:.1f} units\n"
+                    parts.append(f"   Average Demand: {avg_demand:.1f} units\n")
                     
                     # Volatility
-                    if len(product_data) > 2:
-                        volatility = product_data['demand'].std()
-                        result += f"   Volatility (std dev): {volatility:.1f}\n"
+                    if count > 2:
+                        parts.append(f"   Volatility (std dev): {volatility:.1f}\n")
                     
-                    result += "\n"
+                    parts.append("\n")
         else:
             # Aggregate analysis if no product breakdown
-            if 'demand' in historical_df.columns:
-                result += f"Total demand over period: {historical_df['demand'].sum():.0f}\n"
-                result += f"Average demand: {historical_df['demand'].mean():.1f}\n"
+            if 'demand' in columns:
+                parts.append(f"Total demand over period: {summary['demand_sum']:.0f}\n")
+                parts.append(f"Average demand: {summary['demand_mean']:.1f}\n")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         return f"Error analyzing historical trends: {str(e)}"
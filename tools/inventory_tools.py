@@ -2,18 +2,56 @@
 Inventory Manager Agent Tools
 """
 
-import pandas as pd
+import numpy as np
+from functools import lru_cache
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 from langchain_core.tools import tool
 from config import MOCK_DATA_DIR
+from ._csv_cache import category_mask, column_stat, frame_stat, read_csv
+from ._files import file_exists
+from ._frames import iter_rows
+from ._kernels import reorder_points, top_k
 
+if TYPE_CHECKING:
+    import pandas as pd
 
+
+# Columns the tools read from each scenario file (only these are parsed)
+INVENTORY_COLUMNS = (
+    "product_id", "current_stock", "reorder_point", "priority", "days_until_stockout",
+    "unit_value", "daily_demand", "lead_time_days",
+)
+PRODUCT_COLUMNS = ("product_id", "product_name")
+
+# Files read through the CSV cache, with their column selections (see tools.warm_scenario)
+SCENARIO_FILES = {
+    "inventory.csv": INVENTORY_COLUMNS,
+    "products.csv": PRODUCT_COLUMNS,
+}
+
+
+@lru_cache(maxsize=16)
 def _get_scenario_path(scenario_dir: str) -> Path:
-    """Helper to get scenario directory path"""
+    """Helper to get scenario directory path (built once per scenario)"""
     return MOCK_DATA_DIR / scenario_dir
 
 
+def _low_stock(inventory_df: "pd.DataFrame") -> np.ndarray:
+    """Positions of the rows at or below their reorder point."""
+    return np.flatnonzero((inventory_df['current_stock'] <= inventory_df['reorder_point']).to_numpy())
+
+
+def _stockout_risk(inventory_df: "pd.DataFrame") -> np.ndarray:
+    """Positions of the rows expected to run out within two weeks."""
+    return np.flatnonzero((inventory_df['days_until_stockout'] <= 14).to_numpy())
+
+
+def _stock_value(inventory_df: "pd.DataFrame") -> float:
+    """Total value of the stock on hand."""
+    return (inventory_df['current_stock'] * inventory_df['unit_value']).sum()
+
+
 @tool
 def check_stock_levels(scenario_dir: Annotated[str, "Scenario directory name"]) -> str:
     """
@@ -23,44 +61,52 @@ def check_stock_levels(scenario_dir: Annotated[str, "Scenario directory name"])
     scenario_path = _get_scenario_path(scenario_dir)
     
     try:
-        inventory_df = pd.read_csv(scenario_path / "inventory.csv")
+        inventory_path = scenario_path / "inventory.csv"
+        inventory_df = read_csv(inventory_path, INVENTORY_COLUMNS)
+        inventory_cols = set(inventory_df.columns)
+        
+        parts = [f"Inventory Stock Level Analysis:\n"]
+        if inventory_df.empty:
+            parts.append("No records in inventory.csv\n")
+            return "".join(parts)
         
-        result = f"Inventory Stock Level Analysis:\n"
-        result += f"Total products tracked: {len(inventory_df)}\n"
+        parts.append(f"Total products tracked: {len(inventory_df)}\n")
         
-        if 'current_stock' in inventory_df.columns:
-            total_stock = inventory_df['current_stock'].sum()
-            result += f"Total units in stock: {total_stock}\n"
+        if 'current_stock' in inventory_cols:
+            total_stock = column_stat(inventory_path, INVENTORY_COLUMNS, 'current_stock', 'sum')
+            parts.append(f"Total units in stock: {total_stock}\n")
         
         # Check for low stock items
-        if 'current_stock' in inventory_df.columns and 'reorder_point' in inventory_df.columns:
-            low_stock = inventory_df[inventory_df['current_stock'] <= inventory_df['reorder_point']]
+        if 'current_stock' in inventory_cols and 'reorder_point' in inventory_cols:
+            # Shared with predict_inventory_shortage through the cache
+            low_stock = frame_stat(inventory_path, INVENTORY_COLUMNS, _low_stock)
             
-            if not low_stock.empty:
-                result += f"\n⚠️ Products below reorder point: {len(low_stock)}\n"
-                result += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+            if low_stock.size:
+                parts.append(f"\n⚠️ Products below reorder point: {low_stock.size}\n")
+                parts.append(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
                 
-                for _, item in low_stock.iterrows():
-                    result += f"  • Product {item.get('product_id', 'N/A')}: "
-                    result += f"Stock={item.get('current_stock', 0)}, "
-                    result += f"Reorder Point={item.get('reorder_point', 0)}"
+                item_columns = ['product_id', 'current_stock', 'reorder_point', 'priority', 'days_until_stockout']
+                for item in iter_rows(inventory_df, item_columns, low_stock):
+                    parts.append(f"  • Product {item.get('product_id', 'N/A')}: ")
+                    parts.append(f"Stock={item.get('current_stock', 0)}, ")
+                    parts.append(f"Reorder Point={item.get('reorder_point', 0)}")
                     
                     if 'priority' in item:
-                        result += f", Priority={item['priority']}"
+                        parts.append(f", Priority={item['priority']}")
                     
                     if 'days_until_stockout' in item:
-                        result += f"\n    ⏱️ Days until stockout: {item['days_until_stockout']}"
+                        parts.append(f"\n    ⏱️ Days until stockout: {item['days_until_stockout']}")
                     
-                    result += "\n"
+                    parts.append("\n")
             else:
-                result += f"\n✓ All products above reorder point\n"
+                parts.append(f"\n✓ All products above reorder point\n")
         
         # Stock value if available
-        if 'current_stock' in inventory_df.columns and 'unit_value' in inventory_df.columns:
-            total_value = (inventory_df['current_stock'] * inventory_df['unit_value']).sum()
-            result += f"\nTotal inventory value: ${total_value:,.2f}\n"
+        if 'current_stock' in inventory_cols and 'unit_value' in inventory_cols:
+            total_value = frame_stat(inventory_path, INVENTORY_COLUMNS, _stock_value)
+            parts.append(f"\nTotal inventory value: ${total_value:,.2f}\n")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         return f"Error checking stock levels: {str(e)}"
@@ -78,32 +124,42 @@ def predict_inventory_shortage(
     scenario_path = _get_scenario_path(scenario_dir)
     
     try:
-        inventory_df = pd.read_csv(scenario_path / "inventory.csv")
+        inventory_path = scenario_path / "inventory.csv"
+        inventory_df = read_csv(inventory_path, INVENTORY_COLUMNS)
+        inventory_cols = set(inventory_df.columns)
         
         if product_id:
-            inventory_df = inventory_df[inventory_df['product_id'] == product_id]
+            # A product can have several inventory rows, so this selects all of them
+            inventory_df = inventory_df[category_mask(inventory_path, INVENTORY_COLUMNS, 'product_id', (product_id,))]
             if inventory_df.empty:
                 return f"Product {product_id} not found in inventory"
         
-        result = f"Inventory Shortage Prediction:\n"
-        result += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+        parts = [f"Inventory Shortage Prediction:\n"]
+        parts.append(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
         
         # Identify products at risk
-        at_risk = pd.DataFrame()
-        if 'days_until_stockout' in inventory_df.columns:
-            at_risk = inventory_df[inventory_df['days_until_stockout'] <= 14]
-        elif 'current_stock' in inventory_df.columns and 'reorder_point' in inventory_df.columns:
-            at_risk = inventory_df[inventory_df['current_stock'] <= inventory_df['reorder_point']]
-        
-        if not at_risk.empty:
-            result += f"Products at risk of shortage: {len(at_risk)}\n\n"
+        at_risk = np.empty(0, dtype=np.intp)
+        risk = None
+        if 'days_until_stockout' in inventory_cols:
+            risk = _stockout_risk
+        elif 'current_stock' in inventory_cols and 'reorder_point' in inventory_cols:
+            risk = _low_stock
+        if risk is not None:
+            # The whole file's result is cached (and shared with check_stock_levels)
+            at_risk = risk(inventory_df) if product_id else frame_stat(inventory_path, INVENTORY_COLUMNS, risk)
+        
+        if at_risk.size:
+            parts.append(f"Products at risk of shortage: {at_risk.size}\n\n")
             
-            for _, item in at_risk.iterrows():
-                result += f"📦 Product {item.get('product_id', 'N/A')}:\n"
-                result += f"   Current Stock: {item.get('current_stock', 0)}\n"
+            item_columns = [
+                'product_id', 'current_stock', 'reorder_point', 'days_until_stockout', 'daily_demand', 'priority',
+            ]
+            for item in iter_rows(inventory_df, item_columns, at_risk):
+                parts.append(f"📦 Product {item.get('product_id', 'N/A')}:\n")
+                parts.append(f"   Current Stock: {item.get('current_stock', 0)}\n")
                 
                 if 'reorder_point' in item:
-                    result += f"   Reorder Point: {item.get('reorder_point', 0)}\n"
+                    parts.append(f"   Reorder Point: {item.get('reorder_point', 0)}\n")
                 
                 if 'days_until_stockout' in item:
                     days = item['days_until_stockout']
@@ -113,19 +169,19 @@ def predict_inventory_shortage(
                         urgency = "⚠️ HIGH"
                     else:
                         urgency = "⚡ MEDIUM"
-                    result += f"   Days Until Stockout: {days} {urgency}\n"
+                    parts.append(f"   Days Until Stockout: {days} {urgency}\n")
                 
                 if 'daily_demand' in item:
-                    result += f"   Daily Demand: {item['daily_demand']}\n"
+                    parts.append(f"   Daily Demand: {item['daily_demand']}\n")
                 
                 if 'priority' in item:
-                    result += f"   Priority: {item['priority']}\n"
+                    parts.append(f"   Priority: {item['priority']}\n")
                 
-                result += "\n"
+                parts.append("\n")
         else:
-            result += "✓ No immediate shortage risks detected\n"
+            parts.append("✓ No immediate shortage risks detected\n")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         return f"Error predicting inventory shortage: {str(e)}"
@@ -140,56 +196,54 @@ def update_reorder_points(scenario_dir: Annotated[str, "Scenario directory name"
     scenario_path = _get_scenario_path(scenario_dir)
     
     try:
-        inventory_df = pd.read_csv(scenario_path / "inventory.csv")
+        inventory_df = read_csv(scenario_path / "inventory.csv", INVENTORY_COLUMNS)
+        inventory_cols = set(inventory_df.columns)
         
         # Try to load products.csv for additional context
         products_path = scenario_path / "products.csv"
         products_df = None
-        if products_path.exists():
-            products_df = pd.read_csv(products_path)
-        
-        result = f"Reorder Point Analysis:\n"
-        result += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-        
-        recommendations = []
-        
-        for _, item in inventory_df.iterrows():
-            product_id = item.get('product_id', 'N/A')
-            current_reorder = item.get('reorder_point', 0)
-            current_stock = item.get('current_stock', 0)
+        if file_exists(products_path):
+            products_df = read_csv(products_path, PRODUCT_COLUMNS)
+        
+        parts = [f"Reorder Point Analysis:\n"]
+        parts.append(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
+        
+        # Calculate recommended reorder points based on demand, for all products at once
+        adjust = np.empty(0, dtype=np.intp)
+        if 'daily_demand' in inventory_cols:
+            daily_demand = inventory_df['daily_demand'].to_numpy()
+            lead_time = inventory_df['lead_time_days'].to_numpy() if 'lead_time_days' in inventory_cols else 7  # Default 7 days
+            safety_stock_days = 3  # 3 days safety stock
+            if 'reorder_point' in inventory_cols:
+                current_reorder = inventory_df['reorder_point'].to_numpy()
+            else:
+                current_reorder = np.zeros(len(inventory_df), dtype=np.int64)
             
-            # Calculate recommended reorder point based on demand
-            if 'daily_demand' in item:
-                daily_demand = item['daily_demand']
-                lead_time = item.get('lead_time_days', 7)  # Default 7 days
-                safety_stock_days = 3  # 3 days safety stock
-                
-                recommended_reorder = daily_demand * (lead_time + safety_stock_days)
-                
-                if abs(recommended_reorder - current_reorder) > daily_demand:
-                    change_pct = ((recommended_reorder - current_reorder) / current_reorder * 100) if current_reorder > 0 else 0
-                    
-                    recommendations.append({
-                        'product_id': product_id,
-                        'current': current_reorder,
-                        'recommended': recommended_reorder,
-                        'change_pct': change_pct,
-                        'priority': item.get('priority', 'MEDIUM')
-                    })
-        
-        if recommendations:
-            result += f"Recommended Reorder Point Adjustments: {len(recommendations)}\n\n"
+            recommended_reorder, adjust, change_pct = reorder_points(
+                daily_demand, lead_time, current_reorder, safety_stock_days
+            )
+            adjust = np.flatnonzero(adjust)
+            current_reorder = current_reorder[adjust]
+            recommended_reorder, change_pct = recommended_reorder[adjust], change_pct[adjust]
+        
+        if adjust.size:
+            parts.append(f"Recommended Reorder Point Adjustments: {adjust.size}\n\n")
             
-            for rec in sorted(recommendations, key=lambda x: abs(x['change_pct']), reverse=True)[:10]:
-                result += f"📊 Product {rec['product_id']}:\n"
-                result += f"   Current Reorder Point: {rec['current']:.0f}\n"
-                result += f"   Recommended: {rec['recommended']:.0f}\n"
-                result += f"   Change: {rec['change_pct']:+.1f}%\n"
-                result += f"   Priority: {rec['priority']}\n\n"
+            # Largest changes first (ties keep file order)
+            top = top_k(np.abs(change_pct), 10)
+            items = iter_rows(inventory_df, ['product_id', 'priority'], adjust[top])
+            for item, current, recommended, change in zip(
+                items, current_reorder[top].tolist(), recommended_reorder[top].tolist(), change_pct[top].tolist()
+            ):
+                parts.append(f"📊 Product {item.get('product_id', 'N/A')}:\n")
+                parts.append(f"   Current Reorder Point: {current:.0f}\n")
+                parts.append(f"   Recommended: {recommended:.0f}\n")
+                parts.append(f"   Change: {change:+.1f}%\n")
+                parts.append(f"   Priority: {item.get('priority', 'MEDIUM')}\n\n")
         else:
-            result += "✓ Current reorder points are appropriately set\n"
+            parts.append("✓ Current reorder points are appropriately set\n")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         return f"Error updating reorder points: {str(e)}"
@@ -2,15 +2,41 @@
 Procurement Manager Agent Tools
 """
 
-import pandas as pd
+import numpy as np
+from functools import lru_cache
 from pathlib import Path
 from typing import Annotated
 from langchain_core.tools import tool
 from config import MOCK_DATA_DIR
+from ._csv_cache import category_mask, column_stat, read_csv, row_position
+from ._files import file_exists
+from ._frames import format_counts, iter_rows
 
 
+# Columns the tools read from each scenario file (only these are parsed)
+SUPPLIER_COLUMNS = (
+    "supplier_id", "supplier_name", "status", "issue_type", "lead_time_days",
+    "reliability_score", "unit_price",
+)
+PRODUCT_COLUMNS = ("product_id", "product_name")
+PURCHASE_ORDER_COLUMNS = ("po_id", "product_id", "supplier_id", "status", "expected_delivery", "quantity")
+
+# Files read through the CSV cache, with their column selections (see tools.warm_scenario)
+SCENARIO_FILES = {
+    "suppliers.csv": SUPPLIER_COLUMNS,
+    "products.csv": PRODUCT_COLUMNS,
+    "purchase_orders.csv": PURCHASE_ORDER_COLUMNS,
+}
+
+PROBLEM_SUPPLIER_STATUSES = ('CRITICAL', 'DELAYED', 'QUALITY_ISSUE', 'BANKRUPTCY')
+ORDERABLE_SUPPLIER_STATUSES = ('ACTIVE', 'OPERATIONAL')
+PROBLEM_ORDER_STATUSES = ('DELAYED', 'AT_RISK', 'CRITICAL')
+DELAYED_ORDER_STATUSES = ('DELAYED', 'AT_RISK')
+
+
+@lru_cache(maxsize=16)
 def _get_scenario_path(scenario_dir: str) -> Path:
-    """Helper to get scenario directory path"""
+    """Helper to get scenario directory path (built once per scenario)"""
     return MOCK_DATA_DIR / scenario_dir
 
 
@@ -23,39 +49,47 @@ def check_supplier_status(scenario_dir: Annotated[str, "Scenario directory name"
     scenario_path = _get_scenario_path(scenario_dir)
     
     try:
-        suppliers_df = pd.read_csv(scenario_path / "suppliers.csv")
+        suppliers_path = scenario_path / "suppliers.csv"
+        suppliers_df = read_csv(suppliers_path, SUPPLIER_COLUMNS)
+        suppliers_cols = set(suppliers_df.columns)
+        
+        parts = [f"Supplier Status Analysis:\n"]
+        if suppliers_df.empty:
+            parts.append("No records in suppliers.csv\n")
+            return "".join(parts)
         
-        result = f"Supplier Status Analysis:\n"
-        result += f"Total suppliers: {len(suppliers_df)}\n"
+        parts.append(f"Total suppliers: {len(suppliers_df)}\n")
         
-        if 'status' in suppliers_df.columns:
-            status_counts = suppliers_df['status'].value_counts()
-            result += f"\nSupplier Status Distribution:\n{status_counts.to_string()}\n"
+        if 'status' in suppliers_cols:
+            status_counts = column_stat(suppliers_path, SUPPLIER_COLUMNS, 'status', 'value_counts')
+            parts.append(f"\nSupplier Status Distribution:\n{format_counts(status_counts)}\n")
             
             # Identify problematic suppliers
-            problem_statuses = ['CRITICAL', 'DELAYED', 'QUALITY_ISSUE', 'BANKRUPTCY']
-            problem_suppliers = suppliers_df[suppliers_df['status'].isin(problem_statuses)]
+            problem_suppliers = np.flatnonzero(
+                category_mask(suppliers_path, SUPPLIER_COLUMNS, 'status', PROBLEM_SUPPLIER_STATUSES)
+            )
             
-            if not problem_suppliers.empty:
-                result += f"\n⚠️ Suppliers with issues: {len(problem_suppliers)}\n"
-                for _, supplier in problem_suppliers.iterrows():
-                    result += f"  - {supplier.get('supplier_name', 'N/A')} (ID: {supplier.get('supplier_id', 'N/A')}): "
-                    result += f"{supplier.get('status', 'N/A')}"
+            if problem_suppliers.size:
+                parts.append(f"\n⚠️ Suppliers with issues: {problem_suppliers.size}\n")
+                supplier_columns = ['supplier_name', 'supplier_id', 'status', 'issue_type']
+                for supplier in iter_rows(suppliers_df, supplier_columns, problem_suppliers):
+                    parts.append(f"  - {supplier.get('supplier_name', 'N/A')} (ID: {supplier.get('supplier_id', 'N/A')}): ")
+                    parts.append(f"{supplier.get('status', 'N/A')}")
                     if 'issue_type' in supplier:
-                        result += f" - {supplier['issue_type']}"
-                    result += "\n"
+                        parts.append(f" - {supplier['issue_type']}")
+                    parts.append("\n")
         
         # Average lead time
-        if 'lead_time_days' in suppliers_df.columns:
-            avg_lead_time = suppliers_df['lead_time_days'].mean()
-            result += f"\nAverage lead time: {avg_lead_time:.1f} days\n"
+        if 'lead_time_days' in suppliers_cols:
+            avg_lead_time = column_stat(suppliers_path, SUPPLIER_COLUMNS, 'lead_time_days', 'mean')
+            parts.append(f"\nAverage lead time: {avg_lead_time:.1f} days\n")
         
         # Reliability info
-        if 'reliability_score' in suppliers_df.columns:
-            avg_reliability = suppliers_df['reliability_score'].mean()
-            result += f"Average reliability score: {avg_reliability:.2f}\n"
+        if 'reliability_score' in suppliers_cols:
+            avg_reliability = column_stat(suppliers_path, SUPPLIER_COLUMNS, 'reliability_score', 'mean')
+            parts.append(f"Average reliability score: {avg_reliability:.2f}\n")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         return f"Error checking supplier status: {str(e)}"
@@ -75,47 +109,48 @@ def place_purchase_order(
     scenario_path = _get_scenario_path(scenario_dir)
     
     try:
-        suppliers_df = pd.read_csv(scenario_path / "suppliers.csv")
+        suppliers_path = scenario_path / "suppliers.csv"
+        suppliers_df = read_csv(suppliers_path, SUPPLIER_COLUMNS)
         
         # Find the supplier
-        supplier = suppliers_df[suppliers_df['supplier_id'] == supplier_id]
-        if supplier.empty:
+        supplier_pos = row_position(suppliers_path, SUPPLIER_COLUMNS, 'supplier_id', supplier_id)
+        if supplier_pos is None:
             return f"Supplier {supplier_id} not found"
         
-        supplier_info = supplier.iloc[0]
+        supplier_info = suppliers_df.iloc[supplier_pos]
         
         # Check if products.csv exists for product info
         products_path = scenario_path / "products.csv"
         product_name = product_id
-        if products_path.exists():
-            products_df = pd.read_csv(products_path)
-            product = products_df[products_df['product_id'] == product_id]
-            if not product.empty:
-                product_name = product.iloc[0].get('product_name', product_id)
-        
-        result = f"Purchase Order Recommendation:\n"
-        result += f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
-        result += f"Supplier: {supplier_info.get('supplier_name', 'N/A')} (ID: {supplier_id})\n"
-        result += f"Status: {supplier_info.get('status', 'N/A')}\n"
-        result += f"Product: {product_name}\n"
-        result += f"Quantity: {quantity}\n"
+        if file_exists(products_path):
+            products_df = read_csv(products_path, PRODUCT_COLUMNS)
+            product_pos = row_position(products_path, PRODUCT_COLUMNS, 'product_id', product_id)
+            if product_pos is not None:
+                product_name = products_df.iloc[product_pos].get('product_name', product_id)
+        
+        parts = [f"Purchase Order Recommendation:\n"]
+        parts.append(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
+        parts.append(f"Supplier: {supplier_info.get('supplier_name', 'N/A')} (ID: {supplier_id})\n")
+        parts.append(f"Status: {supplier_info.get('status', 'N/A')}\n")
+        parts.append(f"Product: {product_name}\n")
+        parts.append(f"Quantity: {quantity}\n")
         
         if 'unit_price' in supplier_info:
             total_cost = supplier_info['unit_price'] * quantity
-            result += f"Unit Price: ${supplier_info['unit_price']:.2f}\n"
-            result += f"Total Cost: ${total_cost:.2f}\n"
+            parts.append(f"Unit Price: ${supplier_info['unit_price']:.2f}\n")
+            parts.append(f"Total Cost: ${total_cost:.2f}\n")
         
         if 'lead_time_days' in supplier_info:
-            result += f"Expected Lead Time: {supplier_info['lead_time_days']} days\n"
+            parts.append(f"Expected Lead Time: {supplier_info['lead_time_days']} days\n")
         
         if 'reliability_score' in supplier_info:
-            result += f"Supplier Reliability: {supplier_info['reliability_score']:.2f}\n"
+            parts.append(f"Supplier Reliability: {supplier_info['reliability_score']:.2f}\n")
         
         # Warning if supplier has issues
-        if supplier_info.get('status') not in ['ACTIVE', 'OPERATIONAL']:
-            result += f"\n⚠️ WARNING: Supplier status is {supplier_info.get('status')}. Consider alternative suppliers.\n"
+        if supplier_info.get('status') not in ORDERABLE_SUPPLIER_STATUSES:
+            parts.append(f"\n⚠️ WARNING: Supplier status is {supplier_info.get('status')}. Consider alternative suppliers.\n")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         return f"Error creating purchase order: {str(e)}"
@@ -131,37 +166,44 @@ def predict_supplier_delays(scenario_dir: Annotated[str, "Scenario directory nam
     
     try:
         po_path = scenario_path / "purchase_orders.csv"
-        if not po_path.exists():
+        if not file_exists(po_path):
             return "No purchase orders data available for this scenario"
         
-        po_df = pd.read_csv(po_path)
+        po_df = read_csv(po_path, PURCHASE_ORDER_COLUMNS)
+        po_cols = set(po_df.columns)
+        has_status = 'status' in po_cols
+        
+        parts = [f"Supplier Delay Prediction Analysis:\n"]
+        if po_df.empty:
+            parts.append("No records in purchase_orders.csv\n")
+            return "".join(parts)
         
-        result = f"Supplier Delay Prediction Analysis:\n"
-        result += f"Total purchase orders: {len(po_df)}\n"
+        parts.append(f"Total purchase orders: {len(po_df)}\n")
         
-        if 'status' in po_df.columns:
-            status_counts = po_df['status'].value_counts()
-            result += f"\nPO Status Distribution:\n{status_counts.to_string()}\n"
+        if has_status:
+            status_counts = column_stat(po_path, PURCHASE_ORDER_COLUMNS, 'status', 'value_counts')
+            parts.append(f"\nPO Status Distribution:\n{format_counts(status_counts)}\n")
             
             # Identify delayed or at-risk orders
-            problem_statuses = ['DELAYED', 'AT_RISK', 'CRITICAL']
-            problem_pos = po_df[po_df['status'].isin(problem_statuses)]
+            problem_pos = np.flatnonzero(category_mask(po_path, PURCHASE_ORDER_COLUMNS, 'status', PROBLEM_ORDER_STATUSES))
             
-            if not problem_pos.empty:
-                result += f"\n⚠️ Orders at risk: {len(problem_pos)}\n"
-                for _, po in problem_pos.head(10).iterrows():
-                    result += f"  - PO {po.get('po_id', 'N/A')}: {po.get('product_id', 'N/A')} "
-                    result += f"from {po.get('supplier_id', 'N/A')} - {po.get('status', 'N/A')}"
+            if problem_pos.size:
+                parts.append(f"\n⚠️ Orders at risk: {problem_pos.size}\n")
+                po_columns = ['po_id', 'product_id', 'supplier_id', 'status', 'expected_delivery']
+                for po in iter_rows(po_df, po_columns, problem_pos[:10]):
+                    parts.append(f"  - PO {po.get('po_id', 'N/A')}: {po.get('product_id', 'N/A')} ")
+                    parts.append(f"from {po.get('supplier_id', 'N/A')} - {po.get('status', 'N/A')}")
                     if 'expected_delivery' in po:
-                        result += f" (Expected: {po['expected_delivery']})"
-                    result += "\n"
+                        parts.append(f" (Expected: {po['expected_delivery']})")
+                    parts.append("\n")
         
         # Calculate delay impact
-        if 'quantity' in po_df.columns and 'status' in po_df.columns:
-            delayed_qty = po_df[po_df['status'].isin(['DELAYED', 'AT_RISK'])]['quantity'].sum()
-            result += f"\nTotal quantity at risk of delay: {delayed_qty}\n"
+        if 'quantity' in po_cols and has_status:
+            delayed = category_mask(po_path, PURCHASE_ORDER_COLUMNS, 'status', DELAYED_ORDER_STATUSES)
+            delayed_qty = po_df['quantity'][delayed].sum()
+            parts.append(f"\nTotal quantity at risk of delay: {delayed_qty}\n")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         return f"Error predicting supplier delays: {str(e)}"
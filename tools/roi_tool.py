@@ -0,0 +1,69 @@
+"""
+Cost Optimizer ROI Tool
+
+calculate_roi is plain arithmetic on its arguments, so it lives apart from
+the data tools in cost_optimizer_tools and importing it does not load
+pandas or numpy.
+"""
+
+from typing import Annotated
+from langchain_core.tools import tool
+
+
+@tool
+def calculate_roi(
+    scenario_dir: Annotated[str, "Scenario directory name"],
+    investment_amount: Annotated[float, "Investment amount to calculate ROI for"],
+    expected_savings: Annotated[float, "Expected monthly savings from investment"]
+) -> str:
+    """
+    Calculate return on investment for cost optimization initiatives.
+    Provides ROI analysis and payback period calculations.
+    """
+    try:
+        # Calculate annual savings
+        annual_savings = expected_savings * 12
+        
+        # Calculate ROI percentage
+        roi_pct = ((annual_savings - investment_amount) / investment_amount * 100) if investment_amount > 0 else 0
+        
+        # Calculate payback period in months
+        payback_months = (investment_amount / expected_savings) if expected_savings > 0 else float('inf')
+        
+        parts = [f"ROI Analysis:\n"]
+        parts.append(f"━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n")
+        parts.append(f"Investment Amount: ${investment_amount:,.2f}\n")
+        parts.append(f"Expected Monthly Savings: ${expected_savings:,.2f}\n")
+        parts.append(f"Expected Annual Savings: ${annual_savings:,.2f}\n")
+        parts.append(f"\n📊 Financial Metrics:\n")
+        parts.append(f"   ROI (1 year): {roi_pct:+.1f}%\n")
+        
+        if payback_months != float('inf'):
+            parts.append(f"   Payback Period: {payback_months:.1f} months\n")
+            
+            if payback_months <= 6:
+                assessment = "🟢 Excellent - Quick payback"
+            elif payback_months <= 12:
+                assessment = "🟡 Good - Reasonable payback"
+            elif payback_months <= 24:
+                assessment = "🟠 Fair - Long payback"
+            else:
+                assessment = "🔴 Poor - Very long payback"
+            
+            parts.append(f"   Assessment: {assessment}\n")
+        else:
+            parts.append(f"   Payback Period: Not achievable with current savings\n")
+            parts.append(f"   Assessment: 🔴 Not recommended\n")
+        
+        # 3-year projection
+        three_year_savings = annual_savings * 3
+        three_year_roi = ((three_year_savings - investment_amount) / investment_amount * 100) if investment_amount > 0 else 0
+        
+        parts.append(f"\n📈 3-Year Projection:\n")
+        parts.append(f"   Total Savings: ${three_year_savings:,.2f}\n")
+        parts.append(f"   ROI: {three_year_roi:+.1f}%\n")
+        
+        return "".join(parts)
+        
+    except Exception as e:
+        return f"Error calculating ROI: {str(e)}"
@@ -2,15 +2,39 @@
 Route Planner Agent Tools
 """
 
-import pandas as pd
+import numpy as np
+from functools import lru_cache
 from pathlib import Path
 from typing import Annotated
 from langchain_core.tools import tool
 from config import MOCK_DATA_DIR
+from ._csv_cache import category_mask, column_stat, read_csv, row_position
+from ._files import file_exists
+from ._frames import format_counts, iter_rows
 
 
+# Columns the tools read from each scenario file (only these are parsed)
+ROUTE_COLUMNS = ("route_id", "status", "delay_minutes", "estimated_load")
+VEHICLE_COLUMNS = ("vehicle_id", "status", "type", "current_location", "capacity")
+TRAFFIC_COLUMNS = ("route_id", "delay_minutes")
+INCIDENT_COLUMNS = ("severity", "incident_type", "affected_route", "estimated_delay")
+
+# Files read through the CSV cache, with their column selections (see tools.warm_scenario)
+SCENARIO_FILES = {
+    "routes.csv": ROUTE_COLUMNS,
+    "vehicles.csv": VEHICLE_COLUMNS,
+    "traffic_data.csv": TRAFFIC_COLUMNS,
+    "traffic_incidents.csv": INCIDENT_COLUMNS,
+}
+
+PROBLEM_ROUTE_STATUSES = ('DELAYED', 'BLOCKED', 'REROUTE_NEEDED')
+ASSIGNABLE_VEHICLE_STATUSES = ('AVAILABLE', 'EN_ROUTE')
+CRITICAL_SEVERITIES = ('HIGH', 'CRITICAL')
+
+
+@lru_cache(maxsize=16)
 def _get_scenario_path(scenario_dir: str) -> Path:
-    """Helper to get scenario directory path"""
+    """Helper to get scenario directory path (built once per scenario)"""
     return MOCK_DATA_DIR / scenario_dir
 
 
@@ -23,49 +47,51 @@ def optimize_routes(scenario_dir: Annotated[str, "Scenario directory name (e.g.,
     scenario_path = _get_scenario_path(scenario_dir)
     
     try:
-        routes_df = pd.read_csv(scenario_path / "routes.csv")
+        routes_path = scenario_path / "routes.csv"
+        routes_df = read_csv(routes_path, ROUTE_COLUMNS)
+        routes_cols = set(routes_df.columns)
         
         # Check if vehicles.csv exists
         vehicles_path = scenario_path / "vehicles.csv"
-        if vehicles_path.exists():
-            vehicles_df = pd.read_csv(vehicles_path)
+        if file_exists(vehicles_path):
+            vehicles_df = read_csv(vehicles_path, VEHICLE_COLUMNS)
+            vehicles_cols = set(vehicles_df.columns)
         else:
             vehicles_df = None
             
         # Check if traffic_data.csv exists
         traffic_path = scenario_path / "traffic_data.csv"
-        if traffic_path.exists():
-            traffic_df = pd.read_csv(traffic_path)
+        if file_exists(traffic_path):
+            traffic_df = read_csv(traffic_path, TRAFFIC_COLUMNS)
         else:
             traffic_df = None
         
-        result = f"Route Optimization Analysis:\n"
-        result += f"Total routes: {len(routes_df)}\n"
+        parts = [f"Route Optimization Analysis:\n"]
+        parts.append(f"Total routes: {len(routes_df)}\n")
         
-        if 'status' in routes_df.columns:
-            status_counts = routes_df['status'].value_counts()
-            result += f"\nRoute Status Distribution:\n{status_counts.to_string()}\n"
+        if 'status' in routes_cols and not routes_df.empty:
+            status_counts = column_stat(routes_path, ROUTE_COLUMNS, 'status', 'value_counts')
+            parts.append(f"\nRoute Status Distribution:\n{format_counts(status_counts)}\n")
             
             # Identify problematic routes
-            problem_statuses = ['DELAYED', 'BLOCKED', 'REROUTE_NEEDED']
-            problem_routes = routes_df[routes_df['status'].isin(problem_statuses)]
+            problem_routes = np.flatnonzero(category_mask(routes_path, ROUTE_COLUMNS, 'status', PROBLEM_ROUTE_STATUSES))
             
-            if not problem_routes.empty:
-                result += f"\n⚠️ Routes requiring attention: {len(problem_routes)}\n"
-                for _, route in problem_routes.iterrows():
-                    result += f"  - Route {route.get('route_id', 'N/A')}: {route.get('status', 'N/A')}"
+            if problem_routes.size:
+                parts.append(f"\n⚠️ Routes requiring attention: {problem_routes.size}\n")
+                for route in iter_rows(routes_df, ['route_id', 'status', 'delay_minutes'], problem_routes):
+                    parts.append(f"  - Route {route.get('route_id', 'N/A')}: {route.get('status', 'N/A')}")
                     if 'delay_minutes' in route:
-                        result += f" (Delay: {route['delay_minutes']} min)"
-                    result += "\n"
+                        parts.append(f" (Delay: {route['delay_minutes']} min)")
+                    parts.append("\n")
         
-        if vehicles_df is not None and 'status' in vehicles_df.columns:
+        if vehicles_df is not None and 'status' in vehicles_cols:
             available_vehicles = vehicles_df[vehicles_df['status'] == 'AVAILABLE']
-            result += f"\nAvailable vehicles for reassignment: {len(available_vehicles)}\n"
+            parts.append(f"\nAvailable vehicles for reassignment: {len(available_vehicles)}\n")
         
         if traffic_df is not None:
-            result += f"\nTraffic incidents affecting routes: {len(traffic_df)}\n"
+            parts.append(f"\nTraffic incidents affecting routes: {len(traffic_df)}\n")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         return f"Error optimizing routes: {str(e)}"
@@ -83,41 +109,43 @@ def assign_vehicle_to_route(
     scenario_path = _get_scenario_path(scenario_dir)
     
     try:
-        vehicles_df = pd.read_csv(scenario_path / "vehicles.csv")
-        routes_df = pd.read_csv(scenario_path / "routes.csv")
+        vehicles_path = scenario_path / "vehicles.csv"
+        routes_path = scenario_path / "routes.csv"
+        vehicles_df = read_csv(vehicles_path, VEHICLE_COLUMNS)
+        routes_df = read_csv(routes_path, ROUTE_COLUMNS)
         
         # Find the vehicle
-        vehicle = vehicles_df[vehicles_df['vehicle_id'] == vehicle_id]
-        if vehicle.empty:
+        vehicle_pos = row_position(vehicles_path, VEHICLE_COLUMNS, 'vehicle_id', vehicle_id)
+        if vehicle_pos is None:
             return f"Vehicle {vehicle_id} not found"
         
-        vehicle_info = vehicle.iloc[0]
+        vehicle_info = vehicles_df.iloc[vehicle_pos]
         
         # Find the route
-        route = routes_df[routes_df['route_id'] == route_id]
-        if route.empty:
+        route_pos = row_position(routes_path, ROUTE_COLUMNS, 'route_id', route_id)
+        if route_pos is None:
             return f"Route {route_id} not found"
         
-        route_info = route.iloc[0]
+        route_info = routes_df.iloc[route_pos]
         
         # Check vehicle status
-        if vehicle_info.get('status') not in ['AVAILABLE', 'EN_ROUTE']:
+        if vehicle_info.get('status') not in ASSIGNABLE_VEHICLE_STATUSES:
             return f"⚠️ Vehicle {vehicle_id} is {vehicle_info.get('status')} and may not be suitable for immediate assignment"
         
-        result = f"✓ Vehicle Assignment Recommendation:\n"
-        result += f"  Vehicle: {vehicle_id} ({vehicle_info.get('type', 'N/A')})\n"
-        result += f"  Current Status: {vehicle_info.get('status', 'N/A')}\n"
-        result += f"  Location: {vehicle_info.get('current_location', 'N/A')}\n"
-        result += f"  Route: {route_id}\n"
-        result += f"  Route Status: {route_info.get('status', 'N/A')}\n"
+        parts = [f"✓ Vehicle Assignment Recommendation:\n"]
+        parts.append(f"  Vehicle: {vehicle_id} ({vehicle_info.get('type', 'N/A')})\n")
+        parts.append(f"  Current Status: {vehicle_info.get('status', 'N/A')}\n")
+        parts.append(f"  Location: {vehicle_info.get('current_location', 'N/A')}\n")
+        parts.append(f"  Route: {route_id}\n")
+        parts.append(f"  Route Status: {route_info.get('status', 'N/A')}\n")
         
         if 'capacity' in vehicle_info and 'estimated_load' in route_info:
             if vehicle_info['capacity'] >= route_info['estimated_load']:
-                result += f"  Capacity Check: ✓ Sufficient ({vehicle_info['capacity']} >= {route_info['estimated_load']})\n"
+                parts.append(f"  Capacity Check: ✓ Sufficient ({vehicle_info['capacity']} >= {route_info['estimated_load']})\n")
             else:
-                result += f"  Capacity Check: ⚠️ Insufficient ({vehicle_info['capacity']} < {route_info['estimated_load']})\n"
+                parts.append(f"  Capacity Check: ⚠️ Insufficient ({vehicle_info['capacity']} < {route_info['estimated_load']})\n")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         return f"Error assigning vehicle: {str(e)}"
@@ -132,42 +160,45 @@ def check_traffic_conditions(scenario_dir: Annotated[str, "Scenario directory na
     scenario_path = _get_scenario_path(scenario_dir)
     
     try:
-        result = "Traffic Conditions Analysis:\n"
+        parts = ["Traffic Conditions Analysis:\n"]
         
         # Check for traffic_data.csv
         traffic_data_path = scenario_path / "traffic_data.csv"
-        if traffic_data_path.exists():
-            traffic_df = pd.read_csv(traffic_data_path)
-            result += f"\nTraffic Data Points: {len(traffic_df)}\n"
+        if file_exists(traffic_data_path):
+            traffic_df = read_csv(traffic_data_path, TRAFFIC_COLUMNS)
+            traffic_cols = set(traffic_df.columns)
+            parts.append(f"\nTraffic Data Points: {len(traffic_df)}\n")
             
-            if 'route_id' in traffic_df.columns and 'delay_minutes' in traffic_df.columns:
-                total_delay = traffic_df['delay_minutes'].sum()
-                avg_delay = traffic_df['delay_minutes'].mean()
-                result += f"Total delay across all routes: {total_delay} minutes\n"
-                result += f"Average delay per route: {avg_delay:.1f} minutes\n"
+            if 'route_id' in traffic_cols and 'delay_minutes' in traffic_cols and not traffic_df.empty:
+                total_delay = column_stat(traffic_data_path, TRAFFIC_COLUMNS, 'delay_minutes', 'sum')
+                avg_delay = column_stat(traffic_data_path, TRAFFIC_COLUMNS, 'delay_minutes', 'mean')
+                parts.append(f"Total delay across all routes: {total_delay} minutes\n")
+                parts.append(f"Average delay per route: {avg_delay:.1f} minutes\n")
         
         # Check for traffic_incidents.csv
         incidents_path = scenario_path / "traffic_incidents.csv"
-        if incidents_path.exists():
-            incidents_df = pd.read_csv(incidents_path)
-            result += f"\n⚠️ Active Traffic Incidents: {len(incidents_df)}\n"
+        if file_exists(incidents_path):
+            incidents_df = read_csv(incidents_path, INCIDENT_COLUMNS)
+            has_severity = 'severity' in incidents_df.columns and not incidents_df.empty
+            parts.append(f"\n⚠️ Active Traffic Incidents: {len(incidents_df)}\n")
             
-            if 'severity' in incidents_df.columns:
-                severity_counts = incidents_df['severity'].value_counts()
-                result += f"\nIncident Severity:\n{severity_counts.to_string()}\n"
+            if has_severity:
+                severity_counts = column_stat(incidents_path, INCIDENT_COLUMNS, 'severity', 'value_counts')
+                parts.append(f"\nIncident Severity:\n{format_counts(severity_counts)}\n")
             
             # List critical incidents
-            if 'severity' in incidents_df.columns:
-                critical = incidents_df[incidents_df['severity'].isin(['HIGH', 'CRITICAL'])]
-                if not critical.empty:
-                    result += f"\n🚨 Critical Incidents:\n"
-                    for _, incident in critical.head(5).iterrows():
-                        result += f"  - {incident.get('incident_type', 'N/A')} on Route {incident.get('affected_route', 'N/A')}"
+            if has_severity:
+                critical = np.flatnonzero(category_mask(incidents_path, INCIDENT_COLUMNS, 'severity', CRITICAL_SEVERITIES))
+                if critical.size:
+                    parts.append(f"\n🚨 Critical Incidents:\n")
+                    incident_columns = ['incident_type', 'affected_route', 'estimated_delay']
+                    for incident in iter_rows(incidents_df, incident_columns, critical[:5]):
+                        parts.append(f"  - {incident.get('incident_type', 'N/A')} on Route {incident.get('affected_route', 'N/A')}")
                         if 'estimated_delay' in incident:
-                            result += f" (Est. delay: {incident['estimated_delay']} min)"
-                        result += "\n"
+                            parts.append(f" (Est. delay: {incident['estimated_delay']} min)")
+                        parts.append("\n")
         
-        return result
+        return "".join(parts)
         
     except Exception as e:
         return f"Error checking traffic conditions: {str(e)}"
@@ -2,26 +2,48 @@
 Utilities package for the Logistics Multi-Agent System
 """
 
-from .state_filtering import filter_tool_messages, create_worker_node
-from .scenario_loader import (
-    load_scenario,
-    list_available_scenarios,
-    load_trigger_event,
-    format_trigger_message,
-    get_scenario_summary,
-    validate_scenario_data,
-)
+import importlib
 
-__all__ = [
+
+# Public name -> submodule defining it. Submodules are imported on first
+# access (PEP 562), so e.g. the Streamlit pages that only need the scenario
+# loader do not pay for LangChain via state_filtering.
+_EXPORTS = {
     # State filtering
-    "filter_tool_messages",
-    "create_worker_node",
+    "filter_tool_messages": "state_filtering",
+    "create_worker_node": "state_filtering",
+    "trim_to_token_budget": "state_filtering",
     # Scenario loading
-    "load_scenario",
-    "list_available_scenarios",
-    "load_trigger_event",
-    "format_trigger_message",
-    "get_scenario_summary",
-    "validate_scenario_data",
-]
+    "load_scenario": "scenario_loader",
+    "load_scenario_index": "scenario_loader",
+    "list_available_scenarios": "scenario_loader",
+    "load_trigger_event": "scenario_loader",
+    "format_trigger_message": "scenario_loader",
+    "get_scenario_summary": "scenario_loader",
+    "validate_scenario_data": "scenario_loader",
+    "clear_caches": "scenario_loader",
+    # Scenario result cache
+    "cached_scenario": "scenario_cache",
+    "scenario_digest": "scenario_cache",
+    "scenario_cache_key": "scenario_cache",
+    "has_agent_error": "scenario_cache",
+    "mark_run_failed": "scenario_cache",
+    # Adaptive LLM concurrency
+    "AIMDLimiter": "aimd_limiter",
+    "get_limiter": "aimd_limiter",
+    # Serialization
+    "content_to_str": "serialization",
+    "content_to_text": "serialization",
+}
+
+
+def __getattr__(name):
+    """Import the submodule defining ``name`` on first access (PEP 562)."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_EXPORTS[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
 
+__all__ = list(_EXPORTS)
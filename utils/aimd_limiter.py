@@ -0,0 +1,204 @@
+"""
+Adaptive (AIMD) concurrency limit for LLM API calls.
+
+LLM latency varies by orders of magnitude between calls, so a fixed
+concurrency cap is either too timid or overloads the provider. The limiter
+grows the number of concurrent calls by one after every window of healthy
+calls and shrinks it by a factor on rate-limit/server errors or a latency
+spike (additive increase, multiplicative decrease). One limiter is kept per
+provider; it works for threads and for any number of event loops.
+"""
+
+import asyncio
+import contextlib
+import threading
+import time
+from collections import deque
+from typing import Dict, Optional
+
+from config import MODEL_PROVIDER
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Return True for errors signalling provider overload (HTTP 429 or 5xx)."""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return isinstance(status, int) and (status == 429 or status >= 500)
+
+
+class AIMDLimiter:
+    """
+    Concurrency limiter whose limit adapts to observed latency and errors.
+
+    Args:
+        initial: Starting concurrency limit
+        min_limit: Lowest limit after decreases
+        max_limit: Highest limit after increases
+        window: Number of completed calls per adjustment
+        decrease: Factor applied to the limit on overload or a latency spike
+        spike_factor: A window's p99 latency above this multiple of the
+            baseline p99 counts as a latency spike
+    """
+
+    def __init__(
+        self,
+        initial: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        window: int = 20,
+        decrease: float = 0.8,
+        spike_factor: float = 2.0,
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.window = window
+        self.decrease = decrease
+        self.spike_factor = spike_factor
+        self.limit = float(initial)
+        self.in_flight = 0
+        self._samples: "deque[tuple[float, bool]]" = deque(maxlen=window)
+        self._baseline_p99: Optional[float] = None
+        self._waiters = deque()
+        self._lock = threading.Lock()
+
+    def _has_capacity(self) -> bool:
+        return self.in_flight < max(self.min_limit, int(self.limit))
+
+    def _wake_waiters(self) -> None:
+        """Hand free slots to queued callers (called with the lock held)."""
+        while self._waiters and self._has_capacity():
+            wake = self._waiters.popleft()
+            self.in_flight += 1
+            try:
+                wake()
+            except RuntimeError:
+                self.in_flight -= 1  # the waiter's event loop is gone
+
+    def acquire(self) -> None:
+        """Block the calling thread until a slot is free."""
+        with self._lock:
+            if self._has_capacity() and not self._waiters:
+                self.in_flight += 1
+                return
+            event = threading.Event()
+            self._waiters.append(event.set)
+        event.wait()
+
+    async def aacquire(self) -> None:
+        """Wait, without blocking the event loop, until a slot is free."""
+        with self._lock:
+            if self._has_capacity() and not self._waiters:
+                self.in_flight += 1
+                return
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+
+            def wake():
+                loop.call_soon_threadsafe(lambda: future.done() or future.set_result(None))
+
+            self._waiters.append(wake)
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                try:
+                    self._waiters.remove(wake)
+                    granted = False
+                except ValueError:
+                    granted = True
+            if granted:
+                self.release()
+            raise
+
+    def release(self, latency: Optional[float] = None, ok: bool = True) -> None:
+        """
+        Free a slot and record how the call went.
+
+        Args:
+            latency: Call duration in seconds (None to skip recording)
+            ok: False if the call failed with an overload error
+        """
+        with self._lock:
+            self.in_flight -= 1
+            if latency is not None:
+                self._record(latency, ok)
+            self._wake_waiters()
+
+    def _record(self, latency: float, ok: bool) -> None:
+        """Adjust the limit from a completed call (called with the lock held)."""
+        if not ok:
+            self.limit = max(self.min_limit, self.limit * self.decrease)
+            self._samples.clear()
+            return
+
+        self._samples.append((latency, ok))
+        if len(self._samples) < self.window:
+            return
+
+        latencies = sorted(sample[0] for sample in self._samples)
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        self._samples.clear()
+        if self._baseline_p99 is not None and p99 > self.spike_factor * self._baseline_p99:
+            self.limit = max(self.min_limit, self.limit * self.decrease)
+            return
+        self._baseline_p99 = p99 if self._baseline_p99 is None else 0.8 * self._baseline_p99 + 0.2 * p99
+        self.limit = min(self.max_limit, self.limit + 1)
+
+    @contextlib.contextmanager
+    def slot(self):
+        """Hold a slot for the duration of a (synchronous) call and record its outcome."""
+        self.acquire()
+        start = time.monotonic()
+        latency, ok = None, True
+        try:
+            yield
+            latency = time.monotonic() - start
+        except Exception as e:
+            if is_overload_error(e):
+                latency, ok = time.monotonic() - start, False
+            raise
+        finally:
+            self.release(latency, ok)
+
+    @contextlib.asynccontextmanager
+    async def aslot(self):
+        """Async version of slot."""
+        await self.aacquire()
+        start = time.monotonic()
+        latency, ok = None, True
+        try:
+            yield
+            latency = time.monotonic() - start
+        except Exception as e:
+            if is_overload_error(e):
+                latency, ok = time.monotonic() - start, False
+            raise
+        finally:
+            self.release(latency, ok)
+
+    def status(self) -> Dict[str, int]:
+        """Current limit and number of calls in flight."""
+        with self._lock:
+            return {"limit": max(self.min_limit, int(self.limit)), "in_flight": self.in_flight}
+
+
+_limiters: Dict[str, AIMDLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(provider: str = MODEL_PROVIDER) -> AIMDLimiter:
+    """
+    Get the shared limiter for a provider (created on first use).
+
+    Args:
+        provider: Model provider name
+
+    Returns:
+        The provider's AIMDLimiter
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(provider)
+        if limiter is None:
+            limiter = _limiters[provider] = AIMDLimiter()
+        return limiter
@@ -0,0 +1,252 @@
+"""
+Disk-backed cache of scenario results.
+
+A scenario run is fully determined by its data files and the configured
+model, so repeated runs (demos, re-runs from the CLI) can return the stored
+result without building the graph or calling the LLM.
+"""
+
+import functools
+import hashlib
+import inspect
+import logging
+import os
+import pickle
+import tempfile
+from contextvars import ContextVar
+from typing import Any, Callable, Optional
+
+from config import (
+    MOCK_DATA_DIR, PROJECT_ROOT, SCENARIO_DIRS, MODEL_PROVIDER, MODEL_NAME,
+    CLAUDE_FAST_MODEL, GEMINI_FAST_MODEL, OPENAI_FAST_MODEL, BEDROCK_FAST_MODEL,
+)
+
+
+CACHE_DIR = PROJECT_ROOT / ".scenario_cache"
+
+# The CLI's output logger (main.py routes it to the console through a queue)
+logger = logging.getLogger("logistics")
+
+# Fast-tier model per provider (agents on the "fast" tier run on it)
+_FAST_MODELS = {
+    "claude": CLAUDE_FAST_MODEL,
+    "gemini": GEMINI_FAST_MODEL,
+    "openai": OPENAI_FAST_MODEL,
+    "bedrock": BEDROCK_FAST_MODEL,
+}
+
+# Set by mark_run_failed while a scenario run is in progress; failed runs are not stored
+_run_failed: ContextVar[bool] = ContextVar("scenario_run_failed", default=False)
+
+# Sources that shape a run: prompts (agents/, orchestrator.py), tools, settings and helpers
+_CODE_PATHS = ("orchestrator.py", "agents", "tools", "config", "utils")
+
+
+def scenario_digest(scenario_id: int) -> str:
+    """
+    Fingerprint the data files of a scenario (names, sizes and modification times).
+
+    Args:
+        scenario_id: Scenario ID (1-6)
+
+    Returns:
+        Hex digest that changes whenever a scenario file or the scenario index changes
+    """
+    digest = hashlib.sha256()
+    paths = [MOCK_DATA_DIR / "scenario_index.csv"]
+    scenario_path = MOCK_DATA_DIR / SCENARIO_DIRS.get(scenario_id, "")
+    if scenario_path.is_dir():
+        # Only the CSVs are source data (the tools' Parquet copies are derived from them)
+        paths.extend(sorted(scenario_path.glob("*.csv")))
+
+    for path in paths:
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        digest.update(f"{path.name}\x00{stat.st_size}\x00{stat.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _code_version() -> str:
+    """
+    Fingerprint the source files that shape a scenario run (by content).
+
+    Covers the agent and supervisor prompts as well as the tools and settings,
+    so editing any of them invalidates stored results. Computed once per process.
+
+    Returns:
+        Hex digest of the project's run-relevant Python sources
+    """
+    digest = hashlib.sha256()
+    for name in _CODE_PATHS:
+        path = PROJECT_ROOT / name
+        files = sorted(path.glob("*.py")) if path.is_dir() else [path]
+        for file in files:
+            try:
+                content = file.read_bytes()
+            except OSError:
+                continue
+            digest.update(f"{file.relative_to(PROJECT_ROOT).as_posix()}\x00{len(content)}\n".encode("utf-8"))
+            digest.update(content)
+    return digest.hexdigest()
+
+
+def scenario_cache_key(scenario_id: int) -> str:
+    """
+    Build the cache key for a scenario run.
+
+    The trigger message is generated from the scenario files, so the file
+    digest covers it; both model tiers are included because results differ
+    per model, and the code version because prompts and tools shape the result.
+
+    Args:
+        scenario_id: Scenario ID (1-6)
+
+    Returns:
+        Hex cache key
+    """
+    fast_model = _FAST_MODELS.get(MODEL_PROVIDER, CLAUDE_FAST_MODEL)
+    raw = "\x00".join((
+        str(scenario_id), MODEL_PROVIDER, MODEL_NAME, fast_model,
+        _code_version(), scenario_digest(scenario_id),
+    ))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def get_cached_result(key: str) -> Optional[Any]:
+    """
+    Load a cached scenario result.
+
+    Args:
+        key: Cache key from scenario_cache_key
+
+    Returns:
+        The cached entry, or None on a miss or unreadable entry
+    """
+    path = CACHE_DIR / f"{key}.pkl"
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Warning: ignoring unreadable scenario cache entry {path.name}: {e}")
+        return None
+
+
+def put_cached_result(key: str, value: Any) -> None:
+    """
+    Store a scenario result (written atomically, so readers never see a partial file).
+
+    Args:
+        key: Cache key from scenario_cache_key
+        value: Picklable result to store
+    """
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, CACHE_DIR / f"{key}.pkl")
+    except Exception as e:
+        logger.warning(f"Warning: could not write scenario cache: {e}")
+
+
+def has_agent_error(update) -> bool:
+    """
+    Whether a graph update (``{node: {"messages": [...]}}``) holds a failed agent's reply.
+
+    The orchestrator turns an agent's exception into an
+    ``"[ERROR] {name} failed: ..."`` message instead of failing the run.
+
+    Args:
+        update: State update yielded by the graph (or a final state)
+
+    Returns:
+        True if any message in the update is an agent failure message
+    """
+    if not isinstance(update, dict):
+        return False
+    for node_state in update.values():
+        messages = node_state.get("messages", []) if isinstance(node_state, dict) else []
+        for msg in messages:
+            content = getattr(msg, "content", None)
+            if isinstance(content, str) and content.startswith("[ERROR] ") and " failed: " in content:
+                return True
+    return False
+
+
+def mark_run_failed() -> None:
+    """Keep the result of the scenario run in progress out of the cache (e.g. an agent failed)."""
+    _run_failed.set(True)
+
+
+def cached_scenario(summarize: Callable[[Any], Optional[str]]):
+    """
+    Decorator caching the result of ``run_scenario(scenario_id, verbose=True, use_cache=True)``.
+
+    On a hit the stored final state is returned immediately (and its summary
+    printed when verbose) without building the graph or calling the LLM.
+    Pass ``use_cache=False`` to force a fresh run, which also refreshes the entry.
+    Runs that call ``mark_run_failed`` (or whose final state holds an agent
+    failure message) are not stored, so a transient error is not replayed.
+    Works on both plain and ``async`` scenario runners.
+
+    Args:
+        summarize: Function extracting the summary text from a final state
+
+    Returns:
+        The decorator
+    """
+    def decorator(func):
+        def lookup(scenario_id: int, verbose: bool):
+            cached = get_cached_result(scenario_cache_key(scenario_id))
+            if cached is not None and verbose:
+                logger.info("\n" + "="*70)
+                logger.info(f"SCENARIO {scenario_id} (cached result - use --no-cache to re-run)")
+                logger.info("="*70 + "\n")
+                logger.info(cached["summary"] or "[No summary in cached result]")
+                logger.info("\n" + "="*70 + "\n")
+            return cached
+
+        def store(scenario_id: int, final_state) -> None:
+            if final_state is not None and not _run_failed.get() and not has_agent_error(final_state):
+                put_cached_result(
+                    scenario_cache_key(scenario_id),
+                    {"final_state": final_state, "summary": summarize(final_state)},
+                )
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(scenario_id: int, verbose: bool = True, use_cache: bool = True):
+                cached = lookup(scenario_id, verbose) if use_cache else None
+                if cached is not None:
+                    return cached["final_state"]
+                token = _run_failed.set(False)
+                try:
+                    final_state = await func(scenario_id, verbose=verbose)
+                    store(scenario_id, final_state)
+                finally:
+                    _run_failed.reset(token)
+                return final_state
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(scenario_id: int, verbose: bool = True, use_cache: bool = True):
+            cached = lookup(scenario_id, verbose) if use_cache else None
+            if cached is not None:
+                return cached["final_state"]
+            token = _run_failed.set(False)
+            try:
+                final_state = func(scenario_id, verbose=verbose)
+                store(scenario_id, final_state)
+            finally:
+                _run_failed.reset(token)
+            return final_state
+
+        return wrapper
+
+    return decorator
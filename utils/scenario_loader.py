@@ -1,11 +1,30 @@
 """
 Scenario Loader for the Logistics Multi-Agent System
+
+The trigger event and scenario index files are a few rows each, so they are
+read with the standard library's csv module; pandas is only imported when
+``load_scenario_index`` is asked for a DataFrame.
 """
 
-import pandas as pd
+import csv
+import functools
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from config import MOCK_DATA_DIR, SCENARIO_DIRS
+from tools._files import clear_file_checks, file_exists
+
+
+def _read_rows(path: Path) -> List[Dict[str, str]]:
+    """Parse a small CSV file into one dict per row (values are left as strings)."""
+    with path.open(newline='', encoding='utf-8') as f:
+        return list(csv.DictReader(f))
+
+
+@functools.lru_cache(maxsize=16)
+def _read_trigger_record(path_str: str, mtime_ns: int) -> Optional[Dict[str, Any]]:
+    """First row of a trigger_event.csv as a dict (None if empty); cached until the file's mtime changes."""
+    rows = _read_rows(Path(path_str))
+    return rows[0] if rows else None
 
 
 def load_trigger_event(scenario_id: int) -> Optional[Dict[str, Any]]:
@@ -16,7 +35,8 @@ def load_trigger_event(scenario_id: int) -> Optional[Dict[str, Any]]:
         scenario_id: Scenario ID (1-6)
         
     Returns:
-        Dictionary containing trigger event data, or None if not found
+        Dictionary containing trigger event data (field values as strings),
+        or None if not found
     """
     if scenario_id not in SCENARIO_DIRS:
         print(f"Error: Invalid scenario ID {scenario_id}")
@@ -25,19 +45,19 @@ def load_trigger_event(scenario_id: int) -> Optional[Dict[str, Any]]:
     scenario_dir = SCENARIO_DIRS[scenario_id]
     trigger_path = MOCK_DATA_DIR / scenario_dir / "trigger_event.csv"
     
-    if not trigger_path.exists():
+    if not file_exists(trigger_path):
         print(f"Error: Trigger event file not found at {trigger_path}")
         return None
     
     try:
-        trigger_df = pd.read_csv(trigger_path)
+        record = _read_trigger_record(str(trigger_path), trigger_path.stat().st_mtime_ns)
         
-        if trigger_df.empty:
+        if record is None:
             print(f"Error: Trigger event file is empty")
             return None
         
-        # Convert first row to dictionary
-        trigger_event = trigger_df.iloc[0].to_dict()
+        # First row as a dictionary (copied: the cached record is shared)
+        trigger_event = dict(record)
         trigger_event['scenario_dir'] = scenario_dir
         trigger_event['scenario_id'] = scenario_id
         
@@ -84,38 +104,100 @@ Provide a comprehensive response including:
     return message.strip()
 
 
-def get_scenario_summary(scenario_id: int) -> Optional[str]:
+SCENARIO_INDEX_PATH = MOCK_DATA_DIR / "scenario_index.csv"
+
+
+def _index_mtime() -> Optional[int]:
+    """Modification time of the scenario index (None if it does not exist)."""
+    try:
+        return SCENARIO_INDEX_PATH.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def _read_index_rows(mtime_ns: int) -> List[Dict[str, str]]:
+    """Rows of the scenario index as dicts; cached until the file's mtime changes."""
+    return _read_rows(SCENARIO_INDEX_PATH)
+
+
+@functools.lru_cache(maxsize=1)
+def _index_by_id(mtime_ns: int) -> Dict[str, Dict[str, str]]:
+    """Scenario index rows keyed by scenario_id (first row wins); cached until the file's mtime changes."""
+    rows = {}
+    for row in _read_index_rows(mtime_ns):
+        rows.setdefault(row['scenario_id'], row)
+    return rows
+
+
+@functools.lru_cache(maxsize=1)
+def _read_scenario_index(mtime_ns: int):
+    """Parse the scenario index into a DataFrame; cached until the file's mtime changes."""
+    import pandas as pd
+    return pd.read_csv(SCENARIO_INDEX_PATH)
+
+
+def load_scenario_index():
     """
-    Get a brief summary of a scenario from scenario_index.csv.
+    Load the scenario index.
+    
+    The parsed DataFrame is cached and shared between callers (treat it as
+    read-only); it is re-read only when the file's modification time changes.
     
-    Args:
-        scenario_id: Scenario ID (1-6)
-        
     Returns:
-        Summary string, or None if not found
+        DataFrame with one row per scenario, or None if the index does not exist
     """
-    index_path = MOCK_DATA_DIR / "scenario_index.csv"
+    mtime_ns = _index_mtime()
+    if mtime_ns is None:
+        return None
+    return _read_scenario_index(mtime_ns)
+
+
+@functools.lru_cache(maxsize=1)
+def _render_scenario_list(mtime_ns: int) -> str:
+    """Render the scenario listing printed by list_available_scenarios."""
+    return "".join(
+        f"[{row['scenario_id']}] {row.get('scenario_name', 'Unknown')}\n"
+        f"    Severity: {row.get('severity', 'N/A')} | Complexity: {row.get('complexity', 'N/A')}\n\n"
+        for row in _read_index_rows(mtime_ns)
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def _render_scenario_summary(scenario_id: int, mtime_ns: int) -> Optional[str]:
+    """Render the summary returned by get_scenario_summary (None if the scenario is not indexed)."""
+    scenario_data = _index_by_id(mtime_ns).get(str(scenario_id))
     
-    if not index_path.exists():
+    if scenario_data is None:
         return None
     
-    try:
-        index_df = pd.read_csv(index_path)
-        scenario = index_df[index_df['scenario_id'] == scenario_id]
-        
-        if scenario.empty:
-            return None
-        
-        scenario_data = scenario.iloc[0]
-        
-        summary = f"""
+    summary = f"""
 Scenario {scenario_id}: {scenario_data.get('scenario_name', 'Unknown')}
 Complexity: {scenario_data.get('complexity', 'N/A')}
 Severity: {scenario_data.get('severity', 'N/A')}
 Primary Agents: {scenario_data.get('primary_agents', 'N/A')}
 Key Metrics: {scenario_data.get('key_metrics', 'N/A')}
 """
-        return summary.strip()
+    return summary.strip()
+
+
+def get_scenario_summary(scenario_id: int) -> Optional[str]:
+    """
+    Get a brief summary of a scenario from scenario_index.csv.
+    
+    Args:
+        scenario_id: Scenario ID (1-6)
+        
+    Returns:
+        Summary string, or None if not found
+    """
+    try:
+        mtime_ns = _index_mtime()
+        if mtime_ns is None:
+            return None
+        
+        # Rendered once per scenario and version of the index file
+        return _render_scenario_summary(scenario_id, mtime_ns)
         
     except Exception as e:
         print(f"Error loading scenario summary: {e}")
@@ -130,25 +212,14 @@ def list_available_scenarios():
     print("AVAILABLE SCENARIOS")
     print("="*60 + "\n")
     
-    index_path = MOCK_DATA_DIR / "scenario_index.csv"
-    
-    if not index_path.exists():
+    mtime_ns = _index_mtime()
+    if mtime_ns is None:
         print("Scenario index not found")
         return
     
     try:
-        index_df = pd.read_csv(index_path)
-        
-        for _, scenario in index_df.iterrows():
-            scenario_id = scenario.get('scenario_id')
-            name = scenario.get('scenario_name', 'Unknown')
-            severity = scenario.get('severity', 'N/A')
-            complexity = scenario.get('complexity', 'N/A')
-            
-            print(f"[{scenario_id}] {name}")
-            print(f"    Severity: {severity} | Complexity: {complexity}")
-            print()
-            
+        # Rendered once per version of the index file
+        print(_render_scenario_list(mtime_ns), end="")
     except Exception as e:
         print(f"Error listing scenarios: {e}")
 
@@ -170,13 +241,13 @@ def validate_scenario_data(scenario_id: int) -> bool:
     scenario_dir = SCENARIO_DIRS[scenario_id]
     scenario_path = MOCK_DATA_DIR / scenario_dir
     
-    if not scenario_path.exists():
+    if not file_exists(scenario_path):
         print(f"Scenario directory not found: {scenario_path}")
         return False
     
     # Check for trigger_event.csv (required)
     trigger_path = scenario_path / "trigger_event.csv"
-    if not trigger_path.exists():
+    if not file_exists(trigger_path):
         print(f"Missing trigger_event.csv in {scenario_dir}")
         return False
     
@@ -184,6 +255,17 @@ def validate_scenario_data(scenario_id: int) -> bool:
     return True
 
 
+def clear_caches() -> None:
+    """
+    Forget remembered file existence checks for scenario data.
+
+    Call between scenario runs so files added or removed since the last run
+    are seen. Parsed files need no clearing: their caches are keyed by
+    modification time.
+    """
+    clear_file_checks()
+
+
 def load_scenario(scenario_id: int) -> Optional[Dict[str, Any]]:
     """
     Load a complete scenario including trigger event and formatted message.
@@ -0,0 +1,57 @@
+"""
+Fast, deterministic serialization of message content for display and hashing.
+"""
+
+import json
+from typing import Any
+
+# orjson is much faster than json (and handles numpy values); fall back if absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def content_to_str(content: Any) -> str:
+    """
+    Serialize message content to a string.
+
+    Strings are returned unchanged; content blocks (lists of dicts such as
+    tool calls) become sorted-key JSON, which is stable across runs and so
+    also suitable as hash input.
+
+    Args:
+        content: Message content (string or list of content blocks)
+
+    Returns:
+        The content as a string
+    """
+    if isinstance(content, str):
+        return content
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                content, option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY, default=str
+            ).decode()
+        except TypeError:
+            pass  # e.g. non-str dict keys; json handles those
+    return json.dumps(content, sort_keys=True, default=str)
+
+
+def content_to_text(content: Any) -> str:
+    """
+    Extract the text of message content.
+
+    Strings are returned unchanged; for content blocks (Claude and Gemini
+    return lists of parts) the text parts are joined and other blocks, such
+    as tool calls, are skipped.
+
+    Args:
+        content: Message content (string or list of content blocks)
+
+    Returns:
+        The text of the content ("" if it has none)
+    """
+    if isinstance(content, str):
+        return content
+    return ''.join(part if isinstance(part, str) else part.get('text', '') for part in content if part)
@@ -2,8 +2,10 @@
 State filtering utilities for managing message history in the multi-agent system.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from langchain_core.messages import AIMessage, HumanMessage, ToolMessage, BaseMessage
+from config.llm_factory import estimate_tokens
+from utils.serialization import content_to_str, content_to_text
 
 
 def filter_tool_messages(messages: List[BaseMessage]) -> List[BaseMessage]:
@@ -17,25 +19,58 @@ def filter_tool_messages(messages: List[BaseMessage]) -> List[BaseMessage]:
     Returns:
         Filtered list of messages without ToolMessage objects
     """
-    filtered = []
-    for msg in messages:
-        if not isinstance(msg, ToolMessage):
-            filtered.append(msg)
-    return filtered
+    # isinstance (not a class identity check) so ToolMessageChunk is dropped too
+    return [msg for msg in messages if not isinstance(msg, ToolMessage)]
 
 
-def create_worker_node(agent, agent_name: str):
+def trim_to_token_budget(messages: List[BaseMessage], max_tokens: int) -> List[BaseMessage]:
+    """
+    Drop the oldest messages until the estimated size of the rest fits a token budget.
+    
+    The last message (the current delegation) is always kept, and the kept
+    history never starts with a ToolMessage whose tool call was dropped: such
+    results are dropped too, unless nothing else would be left, in which case
+    the AI message that made the calls is kept with them.
+    
+    Args:
+        messages: Messages about to be sent to a model
+        max_tokens: Token budget for the messages (estimated with estimate_tokens)
+        
+    Returns:
+        The newest messages that fit (the input list itself if all of them fit)
+    """
+    sizes = [estimate_tokens(content_to_str(msg.content)) for msg in messages]
+    total = sum(sizes)
+    start = 0
+    while start < len(messages) - 1 and total > max_tokens:
+        total -= sizes[start]
+        start += 1
+    # A leading ToolMessage answers a tool call in a dropped message, so it goes too
+    while 0 < start < len(messages) and isinstance(messages[start], ToolMessage):
+        start += 1
+    if start == len(messages):
+        # Only tool results were left; keep them with the AI message that called them
+        start -= 1
+        while start > 0 and isinstance(messages[start], ToolMessage):
+            start -= 1
+    return messages if start == 0 else messages[start:]
+
+
+def create_worker_node(agent, agent_name: str, max_input_tokens: Optional[int] = None):
     """
     Create a node function that wraps a worker agent and filters its output.
     
     The node function:
-    1. Invokes the worker agent with the current state
-    2. Filters out ToolMessage objects from the result
-    3. Returns the filtered messages back to the supervisor
+    1. Trims the oldest input messages if they exceed the token budget
+    2. Invokes the worker agent with the current state
+    3. Filters out ToolMessage objects from the result
+    4. Returns the filtered messages back to the supervisor
     
     Args:
         agent: The worker agent to wrap
         agent_name: Name of the agent for identification
+        max_input_tokens: Estimated prompt budget (the agent's ``system_tokens``,
+            if set, count against it); None sends the state unchanged
         
     Returns:
         A node function that can be added to the graph
@@ -44,6 +79,14 @@ def create_worker_node(agent, agent_name: str):
         """
         Node function that invokes the agent and filters tool messages.
         """
+        # Keep the prompt within the model's context instead of failing the call
+        if max_input_tokens is not None:
+            messages = state.get("messages", [])
+            budget = max_input_tokens - getattr(agent, "system_tokens", 0)
+            trimmed = trim_to_token_budget(messages, budget)
+            if trimmed is not messages:
+                state = {**state, "messages": trimmed}
+        
         # Invoke the agent with the current state
         result = agent.invoke(state)
         
@@ -85,11 +128,14 @@ def get_final_response(messages: List[BaseMessage]) -> str:
         messages: List of messages
         
     Returns:
-        The content of the last AI message, or empty string if none found
+        The text of the last AI message that has any, or empty string if none found
     """
     for msg in reversed(messages):
         if isinstance(msg, AIMessage) and msg.content:
-            return msg.content
+            # Content may be a list of blocks (text, tool calls, thinking)
+            text = content_to_text(msg.content)
+            if text:
+                return text
     return ""
 
 
@@ -105,22 +151,16 @@ def summarize_agent_interaction(messages: List[BaseMessage], agent_name: str) ->
     Returns:
         A summary string
     """
-    tool_calls = []
-    final_response = ""
-    
-    for msg in messages:
-        if isinstance(msg, AIMessage):
-            # Check if this message has tool calls
-            if hasattr(msg, 'tool_calls') and msg.tool_calls:
-                for tool_call in msg.tool_calls:
-                    tool_calls.append(tool_call.get('name', 'unknown'))
-            # Get the final content
-            if msg.content:
-                final_response = msg.content
-    
+    # Names in order of first use (a set's order varies between runs)
+    tool_calls = dict.fromkeys(
+        tool_call.get('name', 'unknown')
+        for msg in messages if isinstance(msg, AIMessage)
+        for tool_call in msg.tool_calls
+    )
+
     summary = f"{agent_name} completed analysis"
     if tool_calls:
-        summary += f" (used tools: {', '.join(set(tool_calls))})"
+        summary += f" (used tools: {', '.join(tool_calls)})"
     
     return summary
 